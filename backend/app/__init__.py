@@ -1,13 +1,23 @@
 from flask import Flask
 from .config import config
-from .extensions import cors
+from .extensions import cors, compression
 from .services.firebase_service import FirebaseService
+from .services.draft_service import DraftService
+from .services.invalidation_service import InvalidationService
+from .services.history_service import HistoryService
 from .routes.health import health_bp
 from .routes.auth import auth_bp
 from .routes.user import user_bp
 from .routes.database import db_bp
 from .routes.onboarding import onboarding_bp 
+from .routes.back_office import back_office_bp
 from .utils.responses import error_response
+from .utils.json_provider import ApiJSONProvider
+from .commands import (
+    export_applications_command, generate_applicants_command, import_applications_command,
+    rescore_affordability_command, cluster_duplicates_command, archive_applications_command,
+    record_table_sizes_command, rebuild_funnel_command
+)
 import logging
 import os
 
@@ -18,9 +28,11 @@ def create_app(config_name=None):
     
     app = Flask(__name__)
     app.config.from_object(config[config_name])
+    app.json = ApiJSONProvider(app)
     
     # Initialize extensions
     cors.init_app(app, origins=app.config['CORS_ORIGINS'])
+    compression.init_app(app)
     
     # Initialize Firebase
     with app.app_context():
@@ -32,6 +44,18 @@ def create_app(config_name=None):
     app.register_blueprint(user_bp)
     app.register_blueprint(db_bp)  # Add database routes
     app.register_blueprint(onboarding_bp)  # Add this line
+    app.register_blueprint(back_office_bp)
+    
+    # CLI commands (flask --app run <command>)
+    app.cli.add_command(export_applications_command)
+    app.cli.add_command(generate_applicants_command)
+    app.cli.add_command(import_applications_command)
+    app.cli.add_command(rescore_affordability_command)
+    app.cli.add_command(cluster_duplicates_command)
+    app.cli.add_command(archive_applications_command)
+    app.cli.add_command(record_table_sizes_command)
+    app.cli.add_command(rebuild_funnel_command)
+    
     # Error handlers
     @app.errorhandler(404)
     def not_found(error):
@@ -45,6 +69,22 @@ def create_app(config_name=None):
     def bad_request(error):
         return error_response('Bad request', 400, 'BAD_REQUEST')
     
+    # Identity keys need their own secret; without one duplicate detection is off
+    if not app.config.get('DUPLICATE_KEY_SECRET'):
+        app.logger.warning("DUPLICATE_KEY_SECRET is not set; duplicate applicant detection is disabled")
+    
+    # Start the write-behind flusher for autosave drafts
+    if app.config.get('DRAFT_AUTOSAVE_ENABLED'):
+        DraftService.start_flusher(app)
+    
+    # Batch-write the onboarding history log in the background
+    if app.config.get('HISTORY_ENABLED'):
+        HistoryService.start_writer(app)
+    
+    # Listen for application changes made by any writer
+    if app.config.get('INVALIDATION_BUS_ENABLED'):
+        InvalidationService.start_listener(app)
+    
     # Setup logging
     if not app.debug:
         logging.basicConfig(level=logging.INFO)
@@ -0,0 +1,225 @@
+import sys
+from datetime import datetime
+from itertools import islice
+import click
+from flask.cli import with_appcontext
+from .services.export_service import WRITERS, ExportService, available_formats, resolve_columns
+from .services.import_service import IMPORT_COLUMNS, ImportService
+from .services.affordability_service import AffordabilityRescoreJob, AffordabilityService
+from .services.batch_job_service import BatchJobService
+from .services.duplicate_service import DuplicateService
+from .services.archive_service import ArchiveService
+from .services.funnel_service import FunnelService
+from .utils.synthetic_applicants import generate_applicants
+
+def _synthetic_rows(count, seed):
+    """Synthetic applicants as tuples ordered like ``IMPORT_COLUMNS``."""
+    for row in generate_applicants(count, seed):
+        yield tuple(row.get(column) for column in IMPORT_COLUMNS)
+
+def _batched(rows, size):
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, size))
+        if not batch:
+            return
+        yield batch
+
+@click.command('export-applications')
+@click.option('--format', 'fmt', type=click.Choice(available_formats()), default='csv', show_default=True)
+@click.option('--columns', default=None, help="Comma-separated columns (default: all)")
+@click.option('--since', default=None, help="Only rows updated after this ISO timestamp (previous watermark)")
+@click.option('--output', '-o', type=click.Path(dir_okay=False), default=None, help="File to write (default: stdout)")
+@with_appcontext
+def export_applications_command(fmt, columns, since, output):
+    """Export completed applications with constant memory.
+
+    Prints the watermark to pass as --since next time, plus rows/s and
+    peak RSS, to stderr.
+    """
+    try:
+        columns = resolve_columns(columns)
+        since = datetime.fromisoformat(since) if since else None
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+
+    until = ExportService.watermark()
+    out = open(output, 'wb') if output else sys.stdout.buffer
+    try:
+        for chunk in ExportService.stream(fmt, columns, since, until):
+            out.write(chunk)
+    finally:
+        if output:
+            out.close()
+        else:
+            out.flush()
+
+    stats = ExportService.last_run()
+    click.echo(
+        f"Exported {stats['rows']} rows ({stats['bytes']} bytes) in {stats['seconds']}s: "
+        f"{stats['rows_per_second']} rows/s, peak RSS {stats['peak_rss_mb']} MB",
+        err=True
+    )
+    click.echo(f"Watermark: {until.isoformat()}", err=True)
+
+@click.command('generate-applicants')
+@click.option('--count', type=int, required=True, help="Number of applicants")
+@click.option('--seed', type=int, default=0, show_default=True, help="Same seed, same rows")
+@click.option('--format', 'fmt', type=click.Choice(['csv', 'ndjson']), default='csv', show_default=True)
+@click.option('--output', '-o', type=click.Path(dir_okay=False), default=None, help="File to write (default: stdout)")
+def generate_applicants_command(count, seed, fmt, output):
+    """Write deterministic synthetic applicants in import format."""
+    out = open(output, 'wb') if output else sys.stdout.buffer
+    try:
+        for chunk in WRITERS[fmt](IMPORT_COLUMNS, _batched(_synthetic_rows(count, seed), 5000)):
+            out.write(chunk)
+    finally:
+        if output:
+            out.close()
+        else:
+            out.flush()
+
+@click.command('import-applications')
+@click.argument('source', type=click.File('rb'), required=False)
+@click.option('--format', 'fmt', type=click.Choice(['csv', 'ndjson']), default=None,
+              help="Input format (default: from the file extension, else csv)")
+@click.option('--synthetic', type=int, default=None, help="Import this many generated applicants instead of a file")
+@click.option('--seed', type=int, default=0, show_default=True, help="Seed for --synthetic")
+@with_appcontext
+def import_applications_command(source, fmt, synthetic, seed):
+    """Bulk-load applications through COPY and a set-based merge.
+
+    SOURCE is a CSV (header of column names) or NDJSON file, or - for
+    stdin. Rows are matched on firebase_uid; the last row per user wins.
+    """
+    if (source is None) == (synthetic is None):
+        raise click.UsageError("Give either SOURCE or --synthetic")
+
+    try:
+        if synthetic is not None:
+            stats = ImportService.import_rows(IMPORT_COLUMNS, _synthetic_rows(synthetic, seed))
+        else:
+            fmt = fmt or ('ndjson' if source.name.endswith(('.ndjson', '.jsonl')) else 'csv')
+            if fmt == 'csv':
+                stats = ImportService.import_csv(source)
+            else:
+                stats = ImportService.import_ndjson(source)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+
+    click.echo(
+        f"Imported {stats['staged']} rows ({stats['inserted']} inserted, {stats['updated']} updated): "
+        f"COPY {stats['copy_seconds']}s, merge {stats['merge_seconds']}s, "
+        f"{stats['rows_per_second']} rows/s, peak RSS {stats['peak_rss_mb']} MB",
+        err=True
+    )
+
+@click.command('rescore-affordability')
+@click.option('--batch-size', type=int, default=None, help="Rows per batch (default: AFFORDABILITY_BATCH_SIZE, or BATCH_JOB_BATCH_SIZE with --workers)")
+@click.option('--workers', type=int, default=None,
+              help="Run as a checkpointed job over id partitions on this many processes")
+@click.option('--resume', 'run_id', default=None, help="Continue an interrupted --workers run")
+@with_appcontext
+def rescore_affordability_command(batch_size, workers, run_id):
+    """Re-score every application under the current affordability policy.
+
+    Without --workers the table is re-scored in one transaction. With
+    --workers (or --resume) partitions commit independently and are
+    checkpointed, so an interrupted run can be resumed; a resumed run
+    keeps the policy it started with.
+    """
+    if workers is None and run_id is None:
+        stats = AffordabilityService.rescore_all(batch_size)
+        outcomes = ', '.join(f"{name} {count}" for name, count in stats['outcomes'].items())
+        click.echo(
+            f"Scored {stats['scored']} applications in {stats['seconds']}s "
+            f"({stats['compute_seconds']}s computing, {stats['rows_per_second']} rows/s); "
+            f"{stats['updated']} results changed. {outcomes}",
+            err=True
+        )
+        return
+
+    def progress(report):
+        eta = f", ETA {report['eta_seconds']}s" if report['eta_seconds'] is not None else ''
+        click.echo(
+            f"[{report['done']}/{report['partitions']}] {report['rows']} rows, "
+            f"{report['rows_per_second']} rows/s{eta}",
+            err=True
+        )
+
+    try:
+        stats = BatchJobService.run(AffordabilityRescoreJob, workers, batch_size, run_id, progress)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    outcomes = ', '.join(f"{name} {count}" for name, count in stats['counts'].items())
+    click.echo(
+        f"Run {stats['run_id']}: scored {stats['rows']} applications on {stats['workers']} workers "
+        f"in {stats['seconds']}s ({stats['rows_per_second']} rows/s); "
+        f"{stats['updated']} results changed. {outcomes}",
+        err=True
+    )
+    if stats['failed']:
+        raise click.ClickException(
+            f"{stats['failed']} partitions failed; re-run with --resume {stats['run_id']}"
+        )
+
+@click.command('cluster-duplicates')
+@click.option('--batch-size', type=int, default=None, help="Rows hashed per batch (default: DUPLICATE_BATCH_SIZE)")
+@with_appcontext
+def cluster_duplicates_command(batch_size):
+    """Rebuild identity keys and group applications sharing an email, phone or IRD number."""
+    if not DuplicateService.enabled():
+        raise click.ClickException("DUPLICATE_KEY_SECRET is not set; duplicate detection is disabled")
+    stats = DuplicateService.cluster_all(batch_size)
+    click.echo(
+        f"Hashed {stats['keys']} identity keys for {stats['applications']} applications; "
+        f"{stats['duplicates']} duplicates in {stats['clusters']} clusters (largest {stats['largest']}), "
+        f"{stats['changed']} flags changed, {stats['iterations']} passes in {stats['seconds']}s",
+        err=True
+    )
+
+@click.command('archive-applications')
+@click.option('--completed-days', type=int, default=None,
+              help="Archive completed applications untouched this long (default: ARCHIVE_COMPLETED_AFTER_DAYS; 0 = skip)")
+@click.option('--abandoned-days', type=int, default=None,
+              help="Archive unfinished drafts untouched this long (default: ARCHIVE_ABANDONED_AFTER_DAYS; 0 = skip)")
+@click.option('--batch-size', type=int, default=None, help="Applications per transaction (default: ARCHIVE_BATCH_SIZE)")
+@with_appcontext
+def archive_applications_command(completed_days, abandoned_days, batch_size):
+    """Move old completed and abandoned applications to the archive tables.
+
+    Safe to run while the app is serving; run it again to continue after
+    a failure. Deleted rows free space for reuse once autovacuum has run.
+    """
+    stats = ArchiveService.archive(completed_days, abandoned_days, batch_size)
+    click.echo(
+        f"Archived {stats['completed']} completed and {stats['abandoned']} abandoned applications "
+        f"in {stats['batches']} batches ({stats['seconds']}s); onboarding tables now "
+        f"{stats['table_bytes'] / 2 ** 20:.1f} MB, indexes {stats['index_bytes'] / 2 ** 20:.1f} MB",
+        err=True
+    )
+
+@click.command('record-table-sizes')
+@with_appcontext
+def record_table_sizes_command():
+    """Snapshot onboarding table and index sizes (schedule it, e.g. daily)."""
+    for row in sorted(ArchiveService.record_sizes(), key=lambda row: (row['table_name'], row['kind'] != 'table')):
+        click.echo(
+            f"{row['relation']:<56}{row['kind']:<7}{row['bytes'] / 2 ** 20:>10.1f} MB"
+            f"{row['live_rows'] if row['live_rows'] is not None else '':>12}"
+        )
+
+@click.command('rebuild-funnel')
+@with_appcontext
+def rebuild_funnel_command():
+    """Recount the onboarding funnel counters from live and archived applications.
+
+    Only needed if the counters have drifted (e.g. rows changed with the
+    triggers disabled). Step saves wait while it runs; run it off-peak.
+    """
+    stats = FunnelService.recount()
+    click.echo(
+        f"Recounted {stats['applications']} applications ({stats['completed']} completed) "
+        f"in {stats['seconds']}s",
+        err=True
+    )
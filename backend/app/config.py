@@ -19,6 +19,92 @@ class Config:
     REDIS_DB = int(os.getenv('REDIS_DB', 0))
     REDIS_TTL = int(os.getenv('REDIS_TTL', 300))  # Default cache TTL: 5 minutes
     
+    # Draft Autosave (write-behind) Configuration
+    DRAFT_AUTOSAVE_ENABLED = os.getenv('DRAFT_AUTOSAVE_ENABLED', 'false').lower() == 'true'
+    DRAFT_FLUSH_INTERVAL = float(os.getenv('DRAFT_FLUSH_INTERVAL', 2.0))  # Seconds between flushes
+    DRAFT_FLUSH_BATCH_SIZE = int(os.getenv('DRAFT_FLUSH_BATCH_SIZE', 500))  # Drafts per flush batch
+    DRAFT_TTL = int(os.getenv('DRAFT_TTL', 86400))  # Unflushed drafts expire after 1 day
+    
+    # Cache Invalidation Bus (Postgres LISTEN/NOTIFY) Configuration
+    # Needs the trigger in migrations/001_onboarding_applications_notify.sql
+    INVALIDATION_BUS_ENABLED = os.getenv('INVALIDATION_BUS_ENABLED', 'false').lower() == 'true'
+    INVALIDATION_POLL_INTERVAL = float(os.getenv('INVALIDATION_POLL_INTERVAL', 5.0))  # Idle connection check
+    INVALIDATION_RESYNC_MARGIN = int(os.getenv('INVALIDATION_RESYNC_MARGIN', 60))  # Seconds re-checked after a reconnect
+    INVALIDATION_RESYNC_LIMIT = int(os.getenv('INVALIDATION_RESYNC_LIMIT', 10000))  # Above this, drop all stamps
+    
+    # Bulk Export Configuration
+    EXPORT_BATCH_SIZE = int(os.getenv('EXPORT_BATCH_SIZE', 5000))  # Rows fetched per server-side cursor round trip
+    EXPORT_WATERMARK_LAG = int(os.getenv('EXPORT_WATERMARK_LAG', 60))  # Seconds left for in-flight writes to commit
+    
+    # Affordability Pre-assessment Configuration
+    # Changing any policy value should come with a new AFFORDABILITY_POLICY_VERSION and a rescore
+    AFFORDABILITY_POLICY_VERSION = os.getenv('AFFORDABILITY_POLICY_VERSION', '1')
+    AFFORDABILITY_COST_RATE = float(os.getenv('AFFORDABILITY_COST_RATE', 0.0))  # Fees/interest as a share of the loan
+    AFFORDABILITY_DEBT_SERVICING_RATE = float(os.getenv('AFFORDABILITY_DEBT_SERVICING_RATE', 0.03))  # Monthly cost per $ of debt
+    AFFORDABILITY_DEPENDENT_ALLOWANCE = float(os.getenv('AFFORDABILITY_DEPENDENT_ALLOWANCE', 400))  # Monthly, per dependant
+    AFFORDABILITY_MIN_SURPLUS = float(os.getenv('AFFORDABILITY_MIN_SURPLUS', 200))  # Monthly buffer left after repayment
+    AFFORDABILITY_MAX_REPAYMENT_RATIO = float(os.getenv('AFFORDABILITY_MAX_REPAYMENT_RATIO', 0.3))  # Repayment / income
+    AFFORDABILITY_DEFAULT_TERM_WEEKS = int(os.getenv('AFFORDABILITY_DEFAULT_TERM_WEEKS', 8))  # When loan_term is unreadable
+    AFFORDABILITY_BATCH_SIZE = int(os.getenv('AFFORDABILITY_BATCH_SIZE', 50000))  # Rows scored per array batch
+    
+    # Repayment Quote Configuration
+    QUOTE_ANNUAL_INTEREST_RATE = float(os.getenv('QUOTE_ANNUAL_INTEREST_RATE', 0.0))
+    QUOTE_ESTABLISHMENT_FEE = float(os.getenv('QUOTE_ESTABLISHMENT_FEE', 0.0))  # Dollars, added to the amount financed
+    QUOTE_REPAYMENT_FREQUENCY = os.getenv('QUOTE_REPAYMENT_FREQUENCY', 'weekly')  # weekly or fortnightly
+    # Loan terms offered, in weeks (first is the default); each term keeps a grid of ~1,900 quotes per worker
+    QUOTE_TERM_WEEKS = tuple(int(weeks) for weeks in os.getenv('QUOTE_TERM_WEEKS', '8').split(','))
+    
+    # Batch Job Configuration
+    BATCH_JOB_WORKERS = int(os.getenv('BATCH_JOB_WORKERS', os.cpu_count() or 1))  # Worker processes (one connection each)
+    BATCH_JOB_PARTITION_SIZE = int(os.getenv('BATCH_JOB_PARTITION_SIZE', 100000))  # Ids per partition (checkpoint unit)
+    BATCH_JOB_BATCH_SIZE = int(os.getenv('BATCH_JOB_BATCH_SIZE', 10000))  # Rows per fetch and execute_values update
+    
+    # Duplicate Applicant Detection Configuration
+    # Identity keys are HMACs under this secret; after changing it run `flask cluster-duplicates`.
+    # Unset disables duplicate detection (a guessable key makes the hashes reversible).
+    DUPLICATE_KEY_SECRET = os.getenv('DUPLICATE_KEY_SECRET')
+    DUPLICATE_BLOOM_ENABLED = os.getenv('DUPLICATE_BLOOM_ENABLED', 'false').lower() == 'true'
+    DUPLICATE_BLOOM_CAPACITY = int(os.getenv('DUPLICATE_BLOOM_CAPACITY', 1000000))  # Keys before false positives rise
+    DUPLICATE_BLOOM_ERROR_RATE = float(os.getenv('DUPLICATE_BLOOM_ERROR_RATE', 0.01))
+    DUPLICATE_BLOOM_REFRESH = float(os.getenv('DUPLICATE_BLOOM_REFRESH', 5.0))  # Seconds between pulls of new keys
+    DUPLICATE_BATCH_SIZE = int(os.getenv('DUPLICATE_BATCH_SIZE', 50000))  # Rows hashed per batch when clustering
+    
+    # Application Archival Configuration
+    # Applications untouched this many days move to the archive (0 = never)
+    ARCHIVE_COMPLETED_AFTER_DAYS = int(os.getenv('ARCHIVE_COMPLETED_AFTER_DAYS', 365))
+    ARCHIVE_ABANDONED_AFTER_DAYS = int(os.getenv('ARCHIVE_ABANDONED_AFTER_DAYS', 90))  # Unfinished drafts
+    ARCHIVE_BATCH_SIZE = int(os.getenv('ARCHIVE_BATCH_SIZE', 1000))  # Applications moved per transaction
+    ARCHIVE_BATCH_PAUSE = float(os.getenv('ARCHIVE_BATCH_PAUSE', 0.1))  # Seconds between batches, for replicas and autovacuum
+    ARCHIVE_LOCK_TIMEOUT = os.getenv('ARCHIVE_LOCK_TIMEOUT', '2s')  # Give up a batch rather than queue behind saves
+    
+    # Onboarding History (audit log) Configuration
+    HISTORY_ENABLED = os.getenv('HISTORY_ENABLED', 'false').lower() == 'true'
+    HISTORY_FLUSH_INTERVAL = float(os.getenv('HISTORY_FLUSH_INTERVAL', 0.25))  # Seconds between batch inserts
+    HISTORY_BATCH_SIZE = int(os.getenv('HISTORY_BATCH_SIZE', 1000))  # Entries per insert
+    HISTORY_QUEUE_SIZE = int(os.getenv('HISTORY_QUEUE_SIZE', 10000))  # Beyond this, saves write their own entry
+    
+    # Conditional GET (ETag) Configuration
+    # Writes from outside the app are only seen through the invalidation bus, so
+    # version stamps can live for a day with it and an hour without it
+    ONBOARDING_VERSION_TTL = int(os.getenv('ONBOARDING_VERSION_TTL', 86400 if INVALIDATION_BUS_ENABLED else 3600))
+    
+    # Idempotent Submission Configuration
+    IDEMPOTENCY_TTL = int(os.getenv('IDEMPOTENCY_TTL', 60))  # How long first responses are replayed
+    IDEMPOTENCY_LOCK_TTL = int(os.getenv('IDEMPOTENCY_LOCK_TTL', 30))  # In-flight marker lifetime
+    IDEMPOTENCY_WAIT = float(os.getenv('IDEMPOTENCY_WAIT', 10))  # Max seconds a duplicate waits
+    
+    # Status Stream (SSE) Configuration
+    STATUS_STREAM_HEARTBEAT = float(os.getenv('STATUS_STREAM_HEARTBEAT', 15))  # Keep-alive comment interval
+    STATUS_STREAM_MAX_DURATION = int(os.getenv('STATUS_STREAM_MAX_DURATION', 3600))  # Client reconnects after this
+    STATUS_STREAM_MAX_PER_WORKER = int(os.getenv('STATUS_STREAM_MAX_PER_WORKER', 5000))
+    
+    # Response Compression Configuration
+    COMPRESSION_ENABLED = os.getenv('COMPRESSION_ENABLED', 'true').lower() == 'true'
+    COMPRESSION_MIN_SIZE = int(os.getenv('COMPRESSION_MIN_SIZE', 500))  # Smaller bodies are sent as-is
+    COMPRESSION_GZIP_LEVEL = int(os.getenv('COMPRESSION_GZIP_LEVEL', 6))
+    COMPRESSION_BROTLI_QUALITY = int(os.getenv('COMPRESSION_BROTLI_QUALITY', 4))
+    COMPRESSION_MIMETYPES = ('application/json', 'text/plain', 'text/html', 'text/csv')
+    
     # Firebase Configuration
     FIREBASE_SERVICE_ACCOUNT_KEY = os.getenv('FIREBASE_SERVICE_ACCOUNT_KEY')
     FIREBASE_SERVICE_ACCOUNT_BASE64 = os.getenv('FIREBASE_SERVICE_ACCOUNT_BASE64')
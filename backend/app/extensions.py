@@ -1,3 +1,5 @@
 from flask_cors import CORS
+from .middleware.compression import Compression
 
-cors = CORS()
\ No newline at end of file
+cors = CORS()
+compression = Compression()
\ No newline at end of file
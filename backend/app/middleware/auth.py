@@ -67,7 +67,9 @@ def verify_firebase_token(f):
             request.firebase_user = {
                 'uid': decoded_token['uid'],
                 'email': decoded_token.get('email'),
-                'email_verified': decoded_token.get('email_verified', False)
+                'email_verified': decoded_token.get('email_verified', False),
+                # Firebase custom claim set for operations staff
+                'back_office': decoded_token.get('back_office', False)
             }
             
             return f(*args, **kwargs)
@@ -92,4 +94,17 @@ def verify_firebase_token(f):
                 'error_code': 'TOKEN_VERIFICATION_ERROR'
             }), 401
     
+    return decorated_function
+
+def require_back_office(f):
+    """Decorator restricting an endpoint to operations staff.
+
+    Must be applied inside ``verify_firebase_token``.
+    """
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        if not request.firebase_user.get('back_office'):
+            return error_response('Back office access required', 403, 'FORBIDDEN')
+        return f(*args, **kwargs)
+    
     return decorated_function
\ No newline at end of file
@@ -0,0 +1,157 @@
+import gzip
+import threading
+import time
+import zlib
+from flask import request, current_app
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+class Compression:
+    """gzip/brotli response compression negotiated through Accept-Encoding.
+
+    Bodies smaller than ``COMPRESSION_MIN_SIZE`` are sent as-is, streamed
+    responses are compressed chunk by chunk (flushed after each chunk so
+    clients see data as it is produced).
+    CPU time and bytes saved are tracked per endpoint (see ``stats``).
+    """
+
+    def __init__(self, app=None):
+        self._lock = threading.Lock()
+        self._stats = {}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.extensions['compression'] = self
+        if app.config.get('COMPRESSION_ENABLED', True):
+            app.after_request(self._after_request)
+
+    # ==========================================================================
+    # NEGOTIATION AND ENCODERS
+    # ==========================================================================
+
+    @staticmethod
+    def _choose_encoding():
+        offered = ('br', 'gzip') if brotli is not None else ('gzip',)
+        return request.accept_encodings.best_match(offered)
+
+    @staticmethod
+    def _compress(encoding, data):
+        config = current_app.config
+        if encoding == 'br':
+            return brotli.compress(data, quality=config.get('COMPRESSION_BROTLI_QUALITY', 4))
+        return gzip.compress(data, compresslevel=config.get('COMPRESSION_GZIP_LEVEL', 6), mtime=0)
+
+    @staticmethod
+    def _stream_encoder(encoding):
+        """Return ``(compress_chunk, finish)`` callables for a streamed body."""
+        config = current_app.config
+        if encoding == 'br':
+            compressor = brotli.Compressor(quality=config.get('COMPRESSION_BROTLI_QUALITY', 4))
+            return (lambda chunk: compressor.process(chunk) + compressor.flush()), compressor.finish
+        compressor = zlib.compressobj(config.get('COMPRESSION_GZIP_LEVEL', 6), zlib.DEFLATED, 31)
+        return (lambda chunk: compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)), compressor.flush
+
+    # ==========================================================================
+    # AFTER REQUEST HOOK
+    # ==========================================================================
+
+    def _after_request(self, response):
+        if (
+            response.status_code < 200
+            or response.status_code in (204, 304)
+            or request.method == 'HEAD'
+            or response.direct_passthrough
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in current_app.config.get('COMPRESSION_MIMETYPES', ('application/json',))
+        ):
+            return response
+
+        response.vary.add('Accept-Encoding')
+        encoding = self._choose_encoding()
+        endpoint = request.endpoint or 'unknown'
+
+        if response.is_streamed:
+            if encoding is not None:
+                self._compress_stream(response, encoding, endpoint)
+            return response
+
+        data = response.get_data()
+        if encoding is None or len(data) < current_app.config.get('COMPRESSION_MIN_SIZE', 500):
+            self._record(endpoint, len(data), len(data), 0.0, compressed=False)
+            return response
+
+        started = time.thread_time()
+        compressed = self._compress(encoding, data)
+        elapsed = time.thread_time() - started
+
+        if len(compressed) >= len(data):
+            self._record(endpoint, len(data), len(data), elapsed, compressed=False)
+            return response
+
+        response.set_data(compressed)
+        response.headers['Content-Encoding'] = encoding
+        self._record(endpoint, len(data), len(compressed), elapsed, compressed=True)
+        return response
+
+    def _compress_stream(self, response, encoding, endpoint):
+        compress_chunk, finish = self._stream_encoder(encoding)
+        chunks = response.iter_encoded()
+
+        def generate():
+            bytes_in = bytes_out = 0
+            elapsed = 0.0
+            try:
+                for chunk in chunks:
+                    started = time.thread_time()
+                    out = compress_chunk(chunk)
+                    elapsed += time.thread_time() - started
+                    bytes_in += len(chunk)
+                    bytes_out += len(out)
+                    if out:
+                        yield out
+                tail = finish()
+                bytes_out += len(tail)
+                yield tail
+            finally:
+                self._record(endpoint, bytes_in, bytes_out, elapsed, compressed=True)
+
+        response.response = generate()
+        response.headers.pop('Content-Length', None)
+        response.headers['Content-Encoding'] = encoding
+
+    # ==========================================================================
+    # METRICS
+    # ==========================================================================
+
+    def _record(self, endpoint, bytes_in, bytes_out, cpu_seconds, compressed):
+        with self._lock:
+            stats = self._stats.get(endpoint)
+            if stats is None:
+                stats = self._stats[endpoint] = {
+                    'responses': 0, 'compressed': 0,
+                    'bytes_in': 0, 'bytes_out': 0, 'cpu_seconds': 0.0
+                }
+            stats['responses'] += 1
+            stats['compressed'] += compressed
+            stats['bytes_in'] += bytes_in
+            stats['bytes_out'] += bytes_out
+            stats['cpu_seconds'] += cpu_seconds
+
+    def stats(self):
+        """Per-endpoint compression metrics for this worker."""
+        with self._lock:
+            endpoints = {endpoint: dict(stats) for endpoint, stats in self._stats.items()}
+        for stats in endpoints.values():
+            stats['bytes_saved'] = stats['bytes_in'] - stats['bytes_out']
+            stats['ratio'] = round(stats['bytes_out'] / stats['bytes_in'], 3) if stats['bytes_in'] else None
+            stats['cpu_ms_per_response'] = round(stats['cpu_seconds'] * 1000 / stats['responses'], 4)
+            stats['cpu_seconds'] = round(stats['cpu_seconds'], 6)
+        return {
+            'encodings': ['br', 'gzip'] if brotli is not None else ['gzip'],
+            'min_size': current_app.config.get('COMPRESSION_MIN_SIZE', 500),
+            'endpoints': endpoints
+        }
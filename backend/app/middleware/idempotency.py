@@ -0,0 +1,113 @@
+import hashlib
+import time
+from functools import wraps
+from flask import request, current_app, make_response
+from ..services.cache_service import CacheService
+from ..services.version_service import VersionService
+from ..utils.responses import error_response
+
+IDEMPOTENCY_KEY = 'idempotency:{}:{}:{}'
+REPLAY_HEADER = 'Idempotent-Replayed'
+
+def _replay(record):
+    response = current_app.response_class(record['body'], status=record['status'], mimetype=record['mimetype'])
+    response.headers[REPLAY_HEADER] = 'true'
+    return response
+
+def idempotent(f):
+    """Answer repeated submissions of the same write from Redis.
+
+    Requests are deduplicated by a hash of the body per user and endpoint,
+    and only replayed while the application has not been written since
+    (its version stamp is unchanged), so resubmitting old data after
+    another edit still saves. An ``Idempotency-Key`` header additionally
+    replays the first response for that key to later requests carrying
+    it, such as retries (reusing the key with a different body is
+    rejected). Clients send a new key per call, so a double-click is
+    caught by the body hash, not the key.
+
+    A duplicate that arrives while the first request is still running
+    waits for its result instead of racing it. If Redis fails the write
+    goes ahead without deduplication. Must be applied inside
+    ``verify_firebase_token``.
+    """
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        cache = CacheService()
+        if not cache.is_available:
+            return f(*args, **kwargs)
+
+        firebase_uid = request.firebase_user['uid']
+        body_hash = hashlib.sha256(request.get_data()).hexdigest()
+        client_key = request.headers.get('Idempotency-Key')
+        key = IDEMPOTENCY_KEY.format(firebase_uid, request.path, body_hash)
+        lock_key = f"{key}:lock"
+        client_record_key = (
+            IDEMPOTENCY_KEY.format(firebase_uid, request.path, f"key:{client_key}") if client_key else None
+        )
+
+        def replayable_record():
+            if client_record_key:
+                record = cache.get(client_record_key)
+                if record is not None and record['body_hash'] == body_hash:
+                    return record
+            record = cache.get(key)
+            if record is None or record['stamp'] is None:
+                return None
+            return record if VersionService.get(firebase_uid) == record['stamp'] else None
+
+        if client_record_key:
+            record = cache.get(client_record_key)
+            if record is not None and record['body_hash'] != body_hash:
+                return error_response(
+                    "Idempotency-Key was already used with a different request body",
+                    422,
+                    'IDEMPOTENCY_KEY_REUSED'
+                )
+        record = replayable_record()
+        if record is not None:
+            return _replay(record)
+
+        # Wait for an in-flight duplicate rather than running concurrently with it
+        deadline = time.monotonic() + current_app.config['IDEMPOTENCY_WAIT']
+        while True:
+            locked = cache.add(lock_key, 1, current_app.config['IDEMPOTENCY_LOCK_TTL'])
+            if locked is None:
+                # Redis failed: save without deduplication rather than refuse the write
+                return f(*args, **kwargs)
+            if locked:
+                break
+            if time.monotonic() >= deadline:
+                return error_response(
+                    "An identical request is still being processed",
+                    409,
+                    'REQUEST_IN_PROGRESS'
+                )
+            time.sleep(0.05)
+            record = replayable_record()
+            if record is not None:
+                return _replay(record)
+
+        try:
+            # The request we waited on may have finished just before the lock came free
+            record = replayable_record()
+            if record is not None:
+                return _replay(record)
+            response = make_response(f(*args, **kwargs))
+            if 200 <= response.status_code < 300:
+                record = {
+                    'status': response.status_code,
+                    'mimetype': response.mimetype,
+                    'body': response.get_data(as_text=True),
+                    'body_hash': body_hash,
+                    'stamp': VersionService.get(firebase_uid)
+                }
+                ttl = current_app.config['IDEMPOTENCY_TTL']
+                cache.set(key, record, ttl)
+                if client_record_key:
+                    cache.set(client_record_key, record, ttl)
+            return response
+        finally:
+            cache.delete(lock_key)
+
+    return decorated_function
@@ -0,0 +1,430 @@
+from flask import Blueprint, Response, request, stream_with_context
+from datetime import datetime
+from ..services.back_office_service import (
+    MIN_SEARCH_LENGTH, SEARCH_FIELDS, BackOfficeService, decode_cursor
+)
+from ..services.duplicate_service import DuplicateService
+from ..services.archive_service import ArchiveService
+from ..services.history_service import HistoryService
+from ..services.funnel_service import FunnelService
+from ..services.export_service import EXPORT_FORMATS, ExportService, available_formats, resolve_columns
+from ..middleware.auth import verify_firebase_token, require_back_office
+from ..utils.responses import success_response, error_response
+import logging
+
+logger = logging.getLogger(__name__)
+
+back_office_bp = Blueprint('back_office', __name__, url_prefix='/api/back-office')
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Database column -> frontend field for listing rows
+LISTING_FIELDS = {
+    'id': 'id',
+    'firebase_uid': 'firebaseUid',
+    'full_name': 'fullName',
+    'email': 'email',
+    'phone_number': 'phoneNumber',
+    'nz_residency_status': 'nzResidencyStatus',
+    'employment_type': 'employmentType',
+    'monthly_income': 'monthlyIncome',
+    'loan_amount': 'loanAmount',
+    'loan_purpose': 'loanPurpose',
+    'loan_term': 'loanTerm',
+    'affordability_outcome': 'affordabilityOutcome',
+    'duplicate_kinds': 'duplicateKinds',
+    'step_completed': 'stepCompleted',
+    'is_completed': 'isCompleted',
+    'created_at': 'createdAt',
+    'updated_at': 'updatedAt'
+}
+
+def _parse_listing_args(args):
+    """Query string -> ``(filters, limit)``; raises ValueError with a message."""
+    filters = {}
+
+    is_completed = args.get('is_completed')
+    if is_completed is not None:
+        if is_completed not in ('true', 'false'):
+            raise ValueError("is_completed must be 'true' or 'false'")
+        filters['is_completed'] = is_completed == 'true'
+
+    step_completed = args.get('step_completed')
+    if step_completed is not None:
+        if not step_completed.isdigit() or int(step_completed) > 6:
+            raise ValueError("step_completed must be between 0 and 6")
+        filters['step_completed'] = int(step_completed)
+
+    for name in ('updated_from', 'updated_to'):
+        value = args.get(name)
+        if value is not None:
+            try:
+                filters[name] = datetime.fromisoformat(value)
+            except ValueError:
+                raise ValueError(f"{name} must be an ISO 8601 timestamp")
+
+    limit = args.get('limit', str(DEFAULT_PAGE_SIZE))
+    if not limit.isdigit() or not 1 <= int(limit) <= MAX_PAGE_SIZE:
+        raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+
+    return filters, int(limit)
+
+@back_office_bp.route('/applications', methods=['GET'])
+@verify_firebase_token
+@require_back_office
+def list_applications():
+    """List applications, most recently updated first.
+
+    Pages are keyset-based: pass the returned ``nextCursor`` back as
+    ``cursor`` with the same filters to get the following page.
+    """
+    try:
+        try:
+            filters, limit = _parse_listing_args(request.args)
+        except ValueError as e:
+            return error_response(str(e), 400, 'INVALID_PARAMETER')
+
+        cursor = request.args.get('cursor')
+        if cursor:
+            try:
+                cursor = decode_cursor(cursor)
+            except ValueError:
+                return error_response('Invalid cursor', 400, 'INVALID_CURSOR')
+        else:
+            cursor = None
+
+        success, result = BackOfficeService.list_applications(filters, cursor, limit)
+
+        if success:
+            return success_response(
+                {
+                    'applications': [
+                        {field: row[column] for column, field in LISTING_FIELDS.items()}
+                        for row in result['applications']
+                    ],
+                    'nextCursor': result['next_cursor'],
+                    'hasMore': result['has_more'],
+                    'limit': limit
+                },
+                "Applications retrieved successfully"
+            )
+        else:
+            return error_response(
+                f"Failed to list applications: {result}",
+                500,
+                'DATABASE_ERROR'
+            )
+
+    except Exception as e:
+        logger.error(f"Error in list_applications: {e}")
+        return error_response(
+            "Internal server error",
+            500,
+            'INTERNAL_ERROR'
+        )
+
+@back_office_bp.route('/applications/search', methods=['GET'])
+@verify_firebase_token
+@require_back_office
+def search_applications():
+    """Find applications by partial name, email or address, best match first.
+
+    Query: ``q`` (at least three characters), ``fields`` (comma-separated
+    subset of name, email, address; default all) and ``limit``.
+    ``truncated`` means the term matched too many rows to rank them all.
+    """
+    try:
+        text = ' '.join(request.args.get('q', '').split())
+        if len(text) < MIN_SEARCH_LENGTH:
+            return error_response(
+                f"q must be at least {MIN_SEARCH_LENGTH} characters", 400, 'INVALID_PARAMETER'
+            )
+
+        fields = request.args.get('fields')
+        if fields:
+            fields = [field.strip() for field in fields.split(',') if field.strip()]
+            unknown = [field for field in fields if field not in SEARCH_FIELDS]
+            if unknown or not fields:
+                return error_response(
+                    f"fields must be a subset of: {', '.join(SEARCH_FIELDS)}", 400, 'INVALID_PARAMETER'
+                )
+
+        limit = request.args.get('limit', '20')
+        if not limit.isdigit() or not 1 <= int(limit) <= MAX_PAGE_SIZE:
+            return error_response(f"limit must be between 1 and {MAX_PAGE_SIZE}", 400, 'INVALID_PARAMETER')
+        limit = int(limit)
+
+        success, result = BackOfficeService.search_applications(text, fields, limit)
+
+        if success:
+            return success_response(
+                {
+                    'applications': [
+                        {
+                            **{field: row[column] for column, field in LISTING_FIELDS.items()},
+                            'address': row['address'],
+                            'rank': round(row['rank'] or 0, 3)
+                        }
+                        for row in result['applications']
+                    ],
+                    'query': text,
+                    'truncated': result['truncated'],
+                    'limit': limit
+                },
+                "Search completed successfully"
+            )
+        else:
+            return error_response(
+                f"Failed to search applications: {result}",
+                500,
+                'DATABASE_ERROR'
+            )
+
+    except Exception as e:
+        logger.error(f"Error in search_applications: {e}")
+        return error_response(
+            "Internal server error",
+            500,
+            'INTERNAL_ERROR'
+        )
+
+@back_office_bp.route('/applications/<firebase_uid>/duplicates', methods=['GET'])
+@verify_firebase_token
+@require_back_office
+def get_application_duplicates(firebase_uid):
+    """Other applications sharing this applicant's email, phone or IRD number.
+
+    ``matches`` are found through the identity keys as of the last save;
+    ``cluster`` is the group from the last ``flask cluster-duplicates`` run.
+    """
+    try:
+        success, result = DuplicateService.find_matches(firebase_uid)
+
+        if not success:
+            return error_response(f"Failed to find duplicates: {result}", 500, 'DATABASE_ERROR')
+        if result is None:
+            return error_response('Application not found', 404, 'NOT_FOUND')
+
+        application = result['application']
+        return success_response(
+            {
+                'id': application['id'],
+                'firebaseUid': application['firebase_uid'],
+                'duplicateKinds': application['duplicate_kinds'] or [],
+                'duplicateCluster': application['duplicate_cluster'],
+                'matches': [
+                    {
+                        'id': match['id'],
+                        'firebaseUid': match['firebase_uid'],
+                        'fullName': match['full_name'],
+                        'stepCompleted': match['step_completed'],
+                        'isCompleted': match['is_completed'],
+                        'updatedAt': match['updated_at'],
+                        'matchedOn': match['kinds']
+                    }
+                    for match in result['matches']
+                ],
+                'cluster': [
+                    {
+                        'id': member['id'],
+                        'firebaseUid': member['firebase_uid'],
+                        'duplicateKinds': member['duplicate_kinds'] or []
+                    }
+                    for member in result['cluster']
+                ]
+            },
+            "Duplicates retrieved successfully"
+        )
+
+    except Exception as e:
+        logger.error(f"Error in get_application_duplicates: {e}")
+        return error_response(
+            "Internal server error",
+            500,
+            'INTERNAL_ERROR'
+        )
+
+@back_office_bp.route('/applications/<firebase_uid>/history', methods=['GET'])
+@verify_firebase_token
+@require_back_office
+def get_application_history(firebase_uid):
+    """What the applicant submitted at each step, newest first.
+
+    Query: ``step`` (1-6, default all) and ``limit``. Entries are written
+    in the background, so the latest save can take a moment to appear.
+    """
+    try:
+        step = request.args.get('step')
+        if step is not None:
+            if not step.isdigit() or not 1 <= int(step) <= 6:
+                return error_response("step must be between 1 and 6", 400, 'INVALID_PARAMETER')
+            step = int(step)
+
+        limit = request.args.get('limit', str(DEFAULT_PAGE_SIZE))
+        if not limit.isdigit() or not 1 <= int(limit) <= MAX_PAGE_SIZE:
+            return error_response(f"limit must be between 1 and {MAX_PAGE_SIZE}", 400, 'INVALID_PARAMETER')
+
+        success, result = HistoryService.get_history(firebase_uid, step, int(limit))
+
+        if not success:
+            return error_response(f"Failed to get history: {result}", 500, 'DATABASE_ERROR')
+        return success_response(
+            {
+                'firebaseUid': firebase_uid,
+                'entries': [
+                    {
+                        'id': entry['id'],
+                        'step': entry['step'],
+                        'source': entry['source'],
+                        'changedAt': entry['changed_at'],
+                        'recordedAt': entry['recorded_at'],
+                        'data': entry['data']
+                    }
+                    for entry in result
+                ]
+            },
+            "History retrieved successfully"
+        )
+
+    except Exception as e:
+        logger.error(f"Error in get_application_history: {e}")
+        return error_response(
+            "Internal server error",
+            500,
+            'INTERNAL_ERROR'
+        )
+
+@back_office_bp.route('/table-sizes', methods=['GET'])
+@verify_firebase_token
+@require_back_office
+def get_table_sizes():
+    """Onboarding table and index sizes recorded over the last ``days`` days (default 30)."""
+    try:
+        days = request.args.get('days', '30')
+        if not days.isdigit() or not 1 <= int(days) <= 366:
+            return error_response("days must be between 1 and 366", 400, 'INVALID_PARAMETER')
+
+        success, result = ArchiveService.size_history(int(days))
+
+        if not success:
+            return error_response(f"Failed to get table sizes: {result}", 500, 'DATABASE_ERROR')
+        return success_response(
+            {
+                'snapshots': [
+                    {
+                        'capturedAt': snapshot['captured_at'],
+                        'tableBytes': snapshot['table_bytes'],
+                        'indexBytes': snapshot['index_bytes'],
+                        'relations': [
+                            {
+                                'relation': row['relation'],
+                                'table': row['table_name'],
+                                'kind': row['kind'],
+                                'bytes': row['bytes'],
+                                'liveRows': row['live_rows'],
+                                'deadRows': row['dead_rows']
+                            }
+                            for row in snapshot['relations']
+                        ]
+                    }
+                    for snapshot in result
+                ]
+            },
+            "Table sizes retrieved successfully"
+        )
+
+    except Exception as e:
+        logger.error(f"Error in get_table_sizes: {e}")
+        return error_response(
+            "Internal server error",
+            500,
+            'INTERNAL_ERROR'
+        )
+
+@back_office_bp.route('/funnel', methods=['GET'])
+@verify_firebase_token
+@require_back_office
+def get_funnel():
+    """Onboarding funnel: applications reaching each step, conversion and time per step."""
+    try:
+        success, result = FunnelService.get_funnel()
+
+        if not success:
+            return error_response(f"Failed to get funnel: {result}", 500, 'DATABASE_ERROR')
+        return success_response(
+            {
+                'applications': result['applications'],
+                'completed': result['completed'],
+                'completionRate': result['completion_rate'],
+                'steps': [
+                    {
+                        'step': step['step'],
+                        'reached': step['reached'],
+                        'inProgress': step['in_progress'],
+                        'conversion': step['conversion'],
+                        'averageSeconds': step['average_seconds'],
+                        'timedTransitions': step['timed_transitions']
+                    }
+                    for step in result['steps']
+                ]
+            },
+            "Funnel retrieved successfully"
+        )
+
+    except Exception as e:
+        logger.error(f"Error in get_funnel: {e}")
+        return error_response(
+            "Internal server error",
+            500,
+            'INTERNAL_ERROR'
+        )
+
+@back_office_bp.route('/exports/applications', methods=['GET'])
+@verify_firebase_token
+@require_back_office
+def export_applications():
+    """Stream completed applications as CSV, NDJSON or Parquet.
+
+    Query: ``format``, ``columns`` (comma-separated, default all) and
+    ``updated_since`` (exclusive). The ``X-Export-Watermark`` response
+    header is the ``updated_since`` to pass for the next incremental export.
+    """
+    try:
+        fmt = request.args.get('format', 'csv')
+        if fmt not in available_formats():
+            return error_response(
+                f"format must be one of: {', '.join(available_formats())}", 400, 'INVALID_PARAMETER'
+            )
+
+        try:
+            columns = resolve_columns(request.args.get('columns'))
+        except ValueError as e:
+            return error_response(str(e), 400, 'INVALID_PARAMETER')
+
+        since = request.args.get('updated_since')
+        if since is not None:
+            try:
+                since = datetime.fromisoformat(since)
+            except ValueError:
+                return error_response("updated_since must be an ISO 8601 timestamp", 400, 'INVALID_PARAMETER')
+
+        until = ExportService.watermark()
+        filename = f"applications-{until.strftime('%Y%m%dT%H%M%S')}.{fmt}"
+        return Response(
+            stream_with_context(ExportService.stream(fmt, columns, since, until)),
+            mimetype=EXPORT_FORMATS[fmt],
+            headers={
+                'Content-Disposition': f'attachment; filename="{filename}"',
+                'X-Export-Watermark': until.isoformat(),
+                'Cache-Control': 'no-store'
+            }
+        )
+
+    except Exception as e:
+        logger.error(f"Error in export_applications: {e}")
+        return error_response(
+            "Internal server error",
+            500,
+            'INTERNAL_ERROR'
+        )
@@ -1,4 +1,12 @@
 from flask import Blueprint
+from ..extensions import compression
+from ..services.draft_service import DraftService
+from ..services.status_stream_service import StatusStreamService
+from ..services.invalidation_service import InvalidationService
+from ..services.export_service import ExportService
+from ..services.history_service import HistoryService
+from .onboarding import read_flight
+from ..middleware.auth import verify_firebase_token, require_back_office
 from ..utils.responses import success_response
 
 health_bp = Blueprint('health', __name__)
@@ -12,4 +20,56 @@ def health_check():
         'service': 'Python Flask backend with Firebase auth',
         'version': '1.0.0'
     }
-    return success_response(data, "Service is running")
\ No newline at end of file
+    return success_response(data, "Service is running")
+
+@health_bp.route('/health/drafts', methods=['GET'])
+@verify_firebase_token
+@require_back_office
+def draft_buffer_stats():
+    """Draft autosave buffer metrics for this worker."""
+    return success_response(DraftService.stats(), "Draft buffer statistics")
+
+
+@health_bp.route('/health/compression', methods=['GET'])
+@verify_firebase_token
+@require_back_office
+def compression_stats():
+    """Per-endpoint response compression metrics for this worker."""
+    return success_response(compression.stats(), "Compression statistics")
+
+
+@health_bp.route('/health/reads', methods=['GET'])
+@verify_firebase_token
+@require_back_office
+def read_coalescing_stats():
+    """How many onboarding reads ran vs. were coalesced onto an in-flight one."""
+    return success_response(read_flight.stats(), "Read coalescing statistics")
+
+@health_bp.route('/health/streams', methods=['GET'])
+@verify_firebase_token
+@require_back_office
+def status_stream_stats():
+    """Open status (SSE) streams in this worker."""
+    return success_response({'open_streams': StatusStreamService.open_streams()}, "Status stream statistics")
+
+
+@health_bp.route('/health/invalidation', methods=['GET'])
+@verify_firebase_token
+@require_back_office
+def invalidation_stats():
+    """LISTEN/NOTIFY invalidation listener state for this worker."""
+    return success_response(InvalidationService.stats(), "Invalidation bus statistics")
+
+@health_bp.route('/health/exports', methods=['GET'])
+@verify_firebase_token
+@require_back_office
+def export_stats():
+    """Throughput and peak RSS of the last export in this worker."""
+    return success_response({'last_run': ExportService.last_run()}, "Export statistics")
+
+@health_bp.route('/health/history', methods=['GET'])
+@verify_firebase_token
+@require_back_office
+def history_writer_stats():
+    """Onboarding history writer queue and batch metrics for this worker."""
+    return success_response(HistoryService.stats(), "History writer statistics")
@@ -1,808 +1,497 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, current_app, make_response, request, jsonify, stream_with_context
 from ..services.onboarding_service import OnboardingService
 from ..services.database_service import DatabaseService
+from ..services.draft_service import DraftService
+from ..services.version_service import VersionService
+from ..services.status_stream_service import StatusStreamService, status_event
+from ..services.quote_service import QuoteService, MIN_LOAN_AMOUNT, MAX_LOAN_AMOUNT
+from ..schemas.onboarding_steps import STEP_SCHEMAS, get_step_schema
+from ..schemas.validation import summarize_errors
 from ..middleware.auth import verify_firebase_token
+from ..middleware.idempotency import idempotent
 from ..utils.responses import success_response, error_response
+from ..utils.conditional import make_etag, is_not_modified, not_modified_response, with_validators
+from ..utils.single_flight import SingleFlight
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
 onboarding_bp = Blueprint('onboarding', __name__, url_prefix='/api/onboarding')
 
-@onboarding_bp.route('/step1', methods=['POST'])
+# Coalesces identical concurrent step/status reads in this worker
+read_flight = SingleFlight()
+
+@onboarding_bp.route('/step<int:step>', methods=['POST'])
 @verify_firebase_token
-def save_step1():
-    """Save Step 1 onboarding data."""
+@idempotent
+def save_step(step):
+    """Save onboarding data for a step (1-6)."""
+    schema = get_step_schema(step)
+    if schema is None:
+        return error_response('Endpoint not found', 404, 'NOT_FOUND')
+
     try:
         # Get user ID from Firebase token
         firebase_uid = request.firebase_user['uid']
-        
+
         # Get JSON data from request
-        step1_data = request.get_json()
-        
-        if not step1_data:
+        step_data = request.get_json()
+
+        if not step_data:
             return error_response(
                 "No data provided",
                 400,
                 'NO_DATA'
             )
-        
-        # Validate required fields
-        required_fields = ['fullName', 'dob', 'address', 'email', 'phoneNumber', 'nzResidencyStatus']
-        missing_fields = [field for field in required_fields if not step1_data.get(field)]
-        
-        if missing_fields:
-            return error_response(
-                f"Missing required fields: {', '.join(missing_fields)}",
-                400,
-                'MISSING_REQUIRED_FIELDS'
-            )
-        
-        # Validate residency status
-        valid_statuses = ['citizen', 'permanent_resident', 'temporary_resident', 'work_visa', 'student_visa']
-        if step1_data.get('nzResidencyStatus') not in valid_statuses:
-            return error_response(
-                "Invalid residency status",
-                400,
-                'INVALID_RESIDENCY_STATUS'
-            )
-        
+
+        # Validate against the step schema, reporting every field error at once
+        errors = schema.validate(step_data)
+        if errors:
+            message, error_code = summarize_errors(errors)
+            return error_response(message, 400, error_code, errors)
+
+        # Final submissions are synchronous; a pending draft must not overwrite them
+        if DraftService.is_enabled():
+            DraftService.discard_draft(step, firebase_uid)
+
         # Save to database
-        success, result = OnboardingService.save_step1_data(firebase_uid, step1_data)
-        
+        success, result = OnboardingService.save_step_data(step, firebase_uid, step_data)
+
         if success:
+            # Transform database format to frontend format for response
             return success_response(
-                result,
-                "Step 1 data saved successfully"
+                schema.to_frontend(result),
+                f"Step {step} data saved successfully"
             )
         else:
             return error_response(
-                f"Failed to save Step 1 data: {result}",
+                f"Failed to save Step {step} data: {result}",
                 500,
                 'DATABASE_ERROR'
             )
-            
+
     except Exception as e:
-        logger.error(f"Error in save_step1: {e}")
+        logger.error(f"Error in save_step{step}: {e}")
         return error_response(
             "Internal server error",
             500,
             'INTERNAL_ERROR'
         )
 
-@onboarding_bp.route('/step2', methods=['POST'])
+@onboarding_bp.route('/batch', methods=['POST'])
 @verify_firebase_token
-def save_step2():
-    """Save Step 2 onboarding data."""
+@idempotent
+def save_steps_batch():
+    """Save any subset of steps in one transaction.
+
+    Body: ``{"steps": {"1": {...}, "3": {...}}}``. Every step is validated
+    before anything is written; the response carries each saved step in
+    frontend format.
+    """
     try:
-        # Get user ID from Firebase token
         firebase_uid = request.firebase_user['uid']
-        
-        # Get JSON data from request
-        step2_data = request.get_json()
-        
-        if not step2_data:
-            return error_response(
-                "No data provided",
-                400,
-                'NO_DATA'
-            )
-        
-        # Validate required fields
-        required_fields = ['employmentType']
-        missing_fields = [field for field in required_fields if not step2_data.get(field)]
-        
-        if missing_fields:
-            return error_response(
-                f"Missing required fields: {', '.join(missing_fields)}",
-                400,
-                'MISSING_REQUIRED_FIELDS'
-            )
-        
-        # Validate employment type
-        valid_employment_types = ['full_time', 'part_time', 'self_employed', 'contract', 'casual', 'unemployed', 'retired', 'student']
-        if step2_data.get('employmentType') not in valid_employment_types:
-            return error_response(
-                "Invalid employment type",
-                400,
-                'INVALID_EMPLOYMENT_TYPE'
-            )
-        
-        # Validate employment duration if provided
-        if step2_data.get('employmentDuration'):
-            valid_durations = ['less_than_3_months', '3_to_6_months', '6_months_to_1_year', '1_to_2_years', '2_to_5_years', 'more_than_5_years']
-            if step2_data.get('employmentDuration') not in valid_durations:
-                return error_response(
-                    "Invalid employment duration",
-                    400,
-                    'INVALID_EMPLOYMENT_DURATION'
-                )
-        
-        # Business logic validation for employed individuals
-        employment_type = step2_data.get('employmentType')
-        if employment_type not in ['unemployed', 'retired']:
-            # For employed individuals, require additional fields
-            if not step2_data.get('employer'):
-                return error_response(
-                    "Employer name is required for employed individuals",
-                    400,
-                    'MISSING_EMPLOYER'
-                )
-            
-            if not step2_data.get('jobTitle'):
-                return error_response(
-                    "Job title is required for employed individuals",
-                    400,
-                    'MISSING_JOB_TITLE'
-                )
-            
-            if not step2_data.get('employmentDuration'):
-                return error_response(
-                    "Employment duration is required for employed individuals",
-                    400,
-                    'MISSING_EMPLOYMENT_DURATION'
-                )
-            
-            if not step2_data.get('monthlyIncome') or step2_data.get('monthlyIncome') <= 0:
-                return error_response(
-                    "Monthly income is required and must be greater than 0 for employed individuals",
-                    400,
-                    'INVALID_MONTHLY_INCOME'
-                )
-        
-        # For unemployed/retired, ensure they have some form of income
-        if employment_type in ['unemployed', 'retired']:
-            monthly_income = step2_data.get('monthlyIncome', 0)
-            other_income = step2_data.get('otherIncome', 0)
-            
-            if monthly_income <= 0 and other_income <= 0:
-                return error_response(
-                    "Please specify your income source. Enter the amount in either monthly income or other income field.",
-                    400,
-                    'NO_INCOME_SPECIFIED'
-                )
-        
-        # Save to database
-        success, result = OnboardingService.save_step2_data(firebase_uid, step2_data)
-        
+        body = request.get_json()
+        steps = body.get('steps') if isinstance(body, dict) else None
+
+        if not steps or not isinstance(steps, dict):
+            return error_response("No data provided", 400, 'NO_DATA')
+
+        payloads = {}
+        for key, step_data in steps.items():
+            step = int(key) if str(key).isdigit() else None
+            if step not in STEP_SCHEMAS:
+                return error_response(f"Unknown onboarding step: {key}", 400, 'INVALID_STEP')
+            if not step_data or not isinstance(step_data, dict):
+                return error_response(f"No Step {step} data provided", 400, 'NO_DATA')
+            payloads[step] = step_data
+
+        # Validate every step, reporting all errors tagged with their step
+        all_errors = []
+        first_failure = None
+        for step in sorted(payloads):
+            errors = STEP_SCHEMAS[step].validate(payloads[step])
+            if errors:
+                if first_failure is None:
+                    first_failure = (step, *summarize_errors(errors))
+                all_errors.extend({**error, 'step': step} for error in errors)
+        if first_failure:
+            step, message, error_code = first_failure
+            return error_response(f"Step {step}: {message}", 400, error_code, all_errors)
+
+        # Final submissions are synchronous; pending drafts must not overwrite them
+        if DraftService.is_enabled():
+            for step in payloads:
+                DraftService.discard_draft(step, firebase_uid)
+
+        success, result = OnboardingService.save_steps_data(firebase_uid, payloads)
+
         if success:
-            # Transform database format to frontend format for response
-            frontend_data = {
-                'employmentType': result.get('employment_type'),
-                'employer': result.get('employer'),
-                'jobTitle': result.get('job_title'),
-                'employmentDuration': result.get('employment_duration'),
-                'monthlyIncome': float(result.get('monthly_income')) if result.get('monthly_income') else None,
-                'otherIncome': float(result.get('other_income')) if result.get('other_income') else 0,
-                'stepCompleted': result.get('step_completed', 2),
-                'isCompleted': result.get('is_completed', False)
-            }
-            
             return success_response(
-                frontend_data,
-                "Step 2 data saved successfully"
+                {
+                    'steps': {str(step): STEP_SCHEMAS[step].to_frontend(result) for step in sorted(payloads)},
+                    'stepCompleted': result.get('step_completed', 0),
+                    'isCompleted': result.get('is_completed', False)
+                },
+                f"Steps {', '.join(str(step) for step in sorted(payloads))} saved successfully"
             )
         else:
-            return error_response(
-                f"Failed to save Step 2 data: {result}",
-                500,
-                'DATABASE_ERROR'
-            )
-            
+            return error_response(f"Failed to save steps: {result}", 500, 'DATABASE_ERROR')
+
     except Exception as e:
-        logger.error(f"Error in save_step2: {e}")
-        return error_response(
-            "Internal server error",
-            500,
-            'INTERNAL_ERROR'
-        )
+        logger.error(f"Error in save_steps_batch: {e}")
+        return error_response("Internal server error", 500, 'INTERNAL_ERROR')
 
-@onboarding_bp.route('/step1', methods=['GET'])
+@onboarding_bp.route('/step<int:step>', methods=['PATCH'])
 @verify_firebase_token
-def get_step1():
-    """Get Step 1 onboarding data."""
+def patch_step(step):
+    """Partially update a step with only the fields the client changed."""
+    schema = get_step_schema(step)
+    if schema is None:
+        return error_response('Endpoint not found', 404, 'NOT_FOUND')
+
     try:
-        # Get user ID from Firebase token
         firebase_uid = request.firebase_user['uid']
-        print("uid id " + firebase_uid)
-        # Get data from database
-        success, result = OnboardingService.get_step1_data(firebase_uid)
-        
+        step_data = request.get_json()
+
+        if not step_data or not isinstance(step_data, dict):
+            return error_response("No data provided", 400, 'NO_DATA')
+
+        # Only the fields that were sent are validated
+        errors = schema.validate_partial(step_data)
+        if errors:
+            message, error_code = summarize_errors(errors)
+            return error_response(message, 400, error_code, errors)
+
+        changes = schema.patch_changes(step_data)
+        if not changes:
+            return error_response(f"No Step {step} fields provided", 400, 'NO_PATCHABLE_FIELDS')
+
+        success, result = OnboardingService.patch_step_data(step, firebase_uid, changes)
+
         if success:
-            if result:
-                # Transform database format to frontend format
-                frontend_data = {
-                    'fullName': result.get('full_name'),
-                    'dob': result.get('date_of_birth'),
-                    'address': result.get('address'),
-                    'email': result.get('email'),
-                    'phoneNumber': result.get('phone_number'),
-                    'nzResidencyStatus': result.get('nz_residency_status'),
-                    'taxNumber': result.get('tax_number'),
+            return success_response(
+                {
+                    'changed': result['changed'],
                     'stepCompleted': result.get('step_completed', 0),
-                    'isCompleted': result.get('is_completed', False)
-                }
-                
-                return success_response(
-                    frontend_data,
-                    "Step 1 data retrieved successfully"
-                )
-            else:
-                return success_response(
-                    {},
-                    "No Step 1 data found for user"
-                )
-        else:
-            return error_response(
-                f"Failed to retrieve Step 1 data: {result}",
-                500,
-                'DATABASE_ERROR'
+                    'isCompleted': result.get('is_completed', False),
+                    'updatedAt': result.get('updated_at')
+                },
+                f"Step {step} data updated successfully" if result['changed'] else f"Step {step} data unchanged"
             )
-            
+        else:
+            return error_response(f"Failed to update Step {step} data: {result}", 500, 'DATABASE_ERROR')
+
     except Exception as e:
-        logger.error(f"Error in get_step1: {e}")
-        return error_response(
-            "Internal server error",
-            500,
-            'INTERNAL_ERROR'
-        )
+        logger.error(f"Error in patch_step{step}: {e}")
+        return error_response("Internal server error", 500, 'INTERNAL_ERROR')
 
-@onboarding_bp.route('/step2', methods=['GET'])
+@onboarding_bp.route('/step<int:step>/draft', methods=['PUT'])
 @verify_firebase_token
-def get_step2():
-    """Get Step 2 onboarding data."""
+def save_step_draft(step):
+    """Autosave draft fields for a step.
+
+    With draft mode enabled the fields are buffered in Redis and written to
+    Postgres by the background flusher (202). Otherwise this falls back to
+    a synchronous partial update (200).
+    """
+    schema = get_step_schema(step)
+    if schema is None:
+        return error_response('Endpoint not found', 404, 'NOT_FOUND')
+
     try:
-        # Get user ID from Firebase token
         firebase_uid = request.firebase_user['uid']
-        
-        # Get data from database
-        success, result = OnboardingService.get_step2_data(firebase_uid)
-        
+        step_data = request.get_json()
+
+        if not step_data or not isinstance(step_data, dict):
+            return error_response("No data provided", 400, 'NO_DATA')
+
+        errors = schema.validate_partial(step_data)
+        if errors:
+            message, error_code = summarize_errors(errors)
+            return error_response(message, 400, error_code, errors)
+
+        fields = {key: value for key, value in step_data.items() if key in schema.patchable}
+        if not fields:
+            return error_response(f"No Step {step} fields provided", 400, 'NO_PATCHABLE_FIELDS')
+
+        if DraftService.is_enabled():
+            success, result = DraftService.save_draft(step, firebase_uid, fields)
+            if success:
+                return success_response(result, f"Step {step} draft saved", 202)
+            logger.warning(f"Draft buffer write failed, saving Step {step} synchronously: {result}")
+
+        success, result = OnboardingService.patch_step_data(step, firebase_uid, schema.patch_changes(fields))
+
         if success:
-            if result:
-                # Transform database format to frontend format
-                frontend_data = {
-                    'employmentType': result.get('employment_type'),
-                    'employer': result.get('employer'),
-                    'jobTitle': result.get('job_title'),
-                    'employmentDuration': result.get('employment_duration'),
-                    'monthlyIncome': float(result.get('monthly_income')) if result.get('monthly_income') else None,
-                    'otherIncome': float(result.get('other_income')) if result.get('other_income') else 0,
-                    'stepCompleted': result.get('step_completed', 0),
-                    'isCompleted': result.get('is_completed', False)
-                }
-                
-                return success_response(
-                    frontend_data,
-                    "Step 2 data retrieved successfully"
-                )
-            else:
-                return success_response(
-                    {},
-                    "No Step 2 data found for user"
-                )
-        else:
-            return error_response(
-                f"Failed to retrieve Step 2 data: {result}",
-                500,
-                'DATABASE_ERROR'
+            return success_response(
+                {'buffered': False, 'changed': result['changed']},
+                f"Step {step} draft saved"
             )
-            
+        else:
+            return error_response(f"Failed to save Step {step} draft: {result}", 500, 'DATABASE_ERROR')
+
     except Exception as e:
-        logger.error(f"Error in get_step2: {e}")
+        logger.error(f"Error in save_step{step}_draft: {e}")
+        return error_response("Internal server error", 500, 'INTERNAL_ERROR')
+
+def _step_response(step, schema, firebase_uid, draft):
+    """Read and serialize one step (shared by concurrent identical GETs without a draft)."""
+    success, result = OnboardingService.get_step_data(step, firebase_uid)
+
+    if not success:
         return error_response(
-            "Internal server error",
+            f"Failed to retrieve Step {step} data: {result}",
             500,
-            'INTERNAL_ERROR'
+            'DATABASE_ERROR'
         )
 
-@onboarding_bp.route('/status', methods=['GET'])
+    stamp = VersionService.stamp_for(result['updated_at'] if result else None)
+    VersionService.remember(firebase_uid, stamp)
+    etag = make_etag(f'step{step}', firebase_uid, stamp)
+
+    if result or draft:
+        # Transform database format to frontend format
+        frontend_data = schema.to_frontend(result) if result else {}
+        if draft:
+            # Draft overlays are not cacheable
+            frontend_data.update(draft)
+            frontend_data['hasDraft'] = True
+            return success_response(frontend_data, f"Step {step} data retrieved successfully")
+        return with_validators(
+            success_response(frontend_data, f"Step {step} data retrieved successfully"),
+            etag, stamp
+        )
+    else:
+        return with_validators(
+            success_response({}, f"No Step {step} data found for user"),
+            etag, stamp
+        )
+
+@onboarding_bp.route('/step<int:step>', methods=['GET'])
 @verify_firebase_token
-def get_onboarding_status():
-    """Get user's onboarding status."""
+def get_step(step):
+    """Get onboarding data for a step (1-6)."""
+    schema = get_step_schema(step)
+    if schema is None:
+        return error_response('Endpoint not found', 404, 'NOT_FOUND')
+
     try:
         # Get user ID from Firebase token
         firebase_uid = request.firebase_user['uid']
-        
-        # Get status from database
-        success, result = OnboardingService.get_user_onboarding_status(firebase_uid)
-        
-        if success:
-            return success_response(
-                result,
-                "Onboarding status retrieved successfully"
-            )
+
+        # Unflushed autosave fields take precedence over the stored row
+        draft = DraftService.get_draft(step, firebase_uid) if DraftService.is_enabled() else None
+
+        # Answer repeat fetches from the cached version stamp without touching Postgres
+        if draft is None:
+            stamp = VersionService.get(firebase_uid)
+            if stamp is not None:
+                etag = make_etag(f'step{step}', firebase_uid, stamp)
+                if is_not_modified(etag, stamp):
+                    return not_modified_response(etag, stamp)
+
+        if draft is not None:
+            # The body carries this request's draft overlay, so it cannot be shared
+            response = make_response(_step_response(step, schema, firebase_uid, draft))
         else:
-            return error_response(
-                f"Failed to retrieve onboarding status: {result}",
-                500,
-                'DATABASE_ERROR'
+            # Concurrent identical reads (e.g. components mounting twice) share one query
+            response = read_flight.response(
+                (firebase_uid, request.endpoint, step),
+                lambda: _step_response(step, schema, firebase_uid, None)
             )
-            
+        return response.make_conditional(request)
+
     except Exception as e:
-        logger.error(f"Error in get_onboarding_status: {e}")
+        logger.error(f"Error in get_step{step}: {e}")
         return error_response(
             "Internal server error",
             500,
             'INTERNAL_ERROR'
         )
 
-@onboarding_bp.route('/initialize', methods=['POST'])
-@verify_firebase_token  
-def initialize_onboarding():
-    """Initialize onboarding for a user (create tables if needed)."""
-    try:
-        # Create tables
-        success, message = DatabaseService.test_connection()
-        
-        if success:
-            return success_response(
-                {'tables_created': True},
-                message
-            )
-        else:
-            return error_response(
-                f"Failed to initialize onboarding: {message}",
-                500,
-                'INITIALIZATION_ERROR'
-            )
-            
-    except Exception as e:
-        logger.error(f"Error in initialize_onboarding: {e}")
+def _status_response(firebase_uid):
+    """Read and serialize the onboarding status (shared by concurrent identical GETs)."""
+    success, result = OnboardingService.get_user_onboarding_status(firebase_uid)
+
+    if success:
+        stamp = VersionService.stamp_for(result.get('updated_at'))
+        VersionService.remember(firebase_uid, stamp)
+        return with_validators(
+            success_response(result, "Onboarding status retrieved successfully"),
+            make_etag('status', firebase_uid, stamp), stamp
+        )
+    else:
         return error_response(
-            "Internal server error",
+            f"Failed to retrieve onboarding status: {result}",
             500,
-            'INTERNAL_ERROR'
+            'DATABASE_ERROR'
         )
 
-@onboarding_bp.route('/step3', methods=['POST'])
+@onboarding_bp.route('/status', methods=['GET'])
 @verify_firebase_token
-def save_step3():
-    """Save Step 3 onboarding data."""
+def get_onboarding_status():
+    """Get user's onboarding status."""
     try:
         # Get user ID from Firebase token
         firebase_uid = request.firebase_user['uid']
-        
-        # Get JSON data from request
-        step3_data = request.get_json()
-        
-        if not step3_data:
-            return error_response(
-                "No data provided",
-                400,
-                'NO_DATA'
-            )
-        
-        # Validate required fields
-        required_fields = ['rent', 'monthlyExpenses', 'debts', 'dependents']
-        missing_fields = []
-        
-        for field in required_fields:
-            value = step3_data.get(field)
-            if value is None:
-                missing_fields.append(field)
-        
-        if missing_fields:
-            return error_response(
-                f"Missing required fields: {', '.join(missing_fields)}",
-                400,
-                'MISSING_REQUIRED_FIELDS'
-            )
-        
-        # Validate numeric fields
-        numeric_fields = ['rent', 'monthlyExpenses', 'debts', 'dependents']
-        for field in numeric_fields:
-            value = step3_data.get(field)
-            if value is not None and not isinstance(value, (int, float)):
-                return error_response(
-                    f"Field '{field}' must be a number",
-                    400,
-                    'INVALID_FIELD_TYPE'
-                )
-            
-            # Validate ranges
-            if field == 'rent' and value is not None and (value < 0 or value > 10000):
-                return error_response(
-                    "Rent must be between 0 and 10,000",
-                    400,
-                    'INVALID_RENT_AMOUNT'
-                )
-            elif field == 'monthlyExpenses' and value is not None and (value < 0 or value > 20000):
-                return error_response(
-                    "Monthly expenses must be between 0 and 20,000",
-                    400,
-                    'INVALID_EXPENSES_AMOUNT'
-                )
-            elif field == 'debts' and value is not None and (value < 0 or value > 500000):
-                return error_response(
-                    "Debts must be between 0 and 500,000",
-                    400,
-                    'INVALID_DEBTS_AMOUNT'
-                )
-            elif field == 'dependents' and value is not None and (value < 0 or value > 10):
-                return error_response(
-                    "Dependents must be between 0 and 10",
-                    400,
-                    'INVALID_DEPENDENTS_COUNT'
-                )
-        
-        # Save to database
-        success, result = OnboardingService.save_step3_data(firebase_uid, step3_data)
-        
-        if success:
-            # Transform database format to frontend format for response
-            frontend_data = {
-                'rent': float(result.get('rent')) if result.get('rent') is not None else None,
-                'monthlyExpenses': float(result.get('monthly_expenses')) if result.get('monthly_expenses') is not None else None,
-                'debts': float(result.get('debts')) if result.get('debts') is not None else None,
-                'dependents': int(result.get('dependents')) if result.get('dependents') is not None else None,
-                'stepCompleted': result.get('step_completed', 3),
-                'isCompleted': result.get('is_completed', False)
-            }
-            
-            return success_response(
-                frontend_data,
-                "Step 3 data saved successfully"
-            )
-        else:
-            return error_response(
-                f"Failed to save Step 3 data: {result}",
-                500,
-                'DATABASE_ERROR'
-            )
-            
+
+        # Answer repeat fetches from the cached version stamp without touching Postgres
+        stamp = VersionService.get(firebase_uid)
+        if stamp is not None:
+            etag = make_etag('status', firebase_uid, stamp)
+            if is_not_modified(etag, stamp):
+                return not_modified_response(etag, stamp)
+
+        # Concurrent identical reads share one query
+        response = read_flight.response(
+            (firebase_uid, request.endpoint),
+            lambda: _status_response(firebase_uid)
+        )
+        return response.make_conditional(request)
+
     except Exception as e:
-        logger.error(f"Error in save_step3: {e}")
+        logger.error(f"Error in get_onboarding_status: {e}")
         return error_response(
             "Internal server error",
             500,
             'INTERNAL_ERROR'
         )
 
-@onboarding_bp.route('/step3', methods=['GET'])
+@onboarding_bp.route('/status/stream', methods=['GET'])
 @verify_firebase_token
-def get_step3():
-    """Get Step 3 onboarding data."""
+def stream_onboarding_status():
+    """Server-Sent Events stream of the user's application status.
+
+    Sends the current status first (skipped when ``Last-Event-ID`` already
+    matches it), then one ``status`` event per committed change, with
+    keep-alive comments in between. The stream closes after
+    ``STATUS_STREAM_MAX_DURATION`` seconds and the client reconnects.
+    """
     try:
-        # Get user ID from Firebase token
         firebase_uid = request.firebase_user['uid']
-        
-        # Get data from database
-        success, result = OnboardingService.get_step3_data(firebase_uid)
-        
-        if success:
-            if result:
-                # Transform database format to frontend format
-                frontend_data = {
-                    'rent': float(result.get('rent')) if result.get('rent') is not None else None,
-                    'monthlyExpenses': float(result.get('monthly_expenses')) if result.get('monthly_expenses') is not None else None,
-                    'debts': float(result.get('debts')) if result.get('debts') is not None else None,
-                    'dependents': int(result.get('dependents')) if result.get('dependents') is not None else None,
-                    'stepCompleted': result.get('step_completed', 0),
-                    'isCompleted': result.get('is_completed', False)
-                }
-                
-                return success_response(
-                    frontend_data,
-                    "Step 3 data retrieved successfully"
-                )
-            else:
-                return success_response(
-                    {},
-                    "No Step 3 data found for user"
-                )
-        else:
+        config = current_app.config
+
+        if StatusStreamService.open_streams() >= config['STATUS_STREAM_MAX_PER_WORKER']:
+            return error_response("Too many open status streams", 503, 'STREAM_LIMIT_REACHED')
+
+        # Subscribe before reading so a change committed in between is not missed
+        mailbox = StatusStreamService.subscribe(firebase_uid, current_app._get_current_object())
+        try:
+            success, result = OnboardingService.get_user_onboarding_status(firebase_uid)
+        except Exception:
+            StatusStreamService.unsubscribe(firebase_uid, mailbox)
+            raise
+        if not success:
+            StatusStreamService.unsubscribe(firebase_uid, mailbox)
             return error_response(
-                f"Failed to retrieve Step 3 data: {result}",
+                f"Failed to retrieve onboarding status: {result}",
                 500,
                 'DATABASE_ERROR'
             )
-            
+
+        dumps = current_app.json.dumps
+        heartbeat = config['STATUS_STREAM_HEARTBEAT']
+        deadline = time.monotonic() + config['STATUS_STREAM_MAX_DURATION']
+        initial = status_event(firebase_uid, result)
+        last_event_id = request.headers.get('Last-Event-ID')
+
+        def generate():
+            try:
+                # The client already has the version it last saw
+                last_sent = last_event_id
+                event = initial
+                yield "retry: 3000\n\n"
+                while time.monotonic() < deadline:
+                    if event is not None:
+                        version = event['updatedAt'] or ''
+                        if version != last_sent:
+                            last_sent = version
+                            payload = {key: value for key, value in event.items() if key != 'uid'}
+                            yield f"event: status\nid: {version}\ndata: {dumps(payload)}\n\n"
+                    event = mailbox.wait(heartbeat)
+                    if event is None:
+                        yield ": keep-alive\n\n"
+            finally:
+                StatusStreamService.unsubscribe(firebase_uid, mailbox)
+
+        response = Response(stream_with_context(generate()), mimetype='text/event-stream')
+        response.headers['Cache-Control'] = 'no-cache'
+        response.headers['X-Accel-Buffering'] = 'no'
+        return response
+
     except Exception as e:
-        logger.error(f"Error in get_step3: {e}")
+        logger.error(f"Error in stream_onboarding_status: {e}")
         return error_response(
             "Internal server error",
             500,
             'INTERNAL_ERROR'
         )
-    
-# Add these routes to your existing onboarding.py in backend/app/routes/onboarding.py
 
-@onboarding_bp.route('/step4', methods=['POST'])
+@onboarding_bp.route('/quote', methods=['GET'])
 @verify_firebase_token
-def save_step4():
-    """Save Step 4 onboarding data."""
-    try:
-        # Get user ID from Firebase token
-        firebase_uid = request.firebase_user['uid']
-        
-        # Get JSON data from request
-        step4_data = request.get_json()
-        
-        if not step4_data:
-            return error_response("No data provided", 400, 'NO_DATA')
-        
-        # Save to database
-        success, result = OnboardingService.save_step4_data(firebase_uid, step4_data)
-        
-        if success:
-            # Transform database format to frontend format for response
-            frontend_data = {
-                'savings': float(result.get('savings')) if result.get('savings') else None,
-                'assets': float(result.get('assets')) if result.get('assets') else None,
-                'sourceOfFunds': result.get('source_of_funds'),
-                'expectedAccountActivity': result.get('expected_account_activity'),
-                'isPoliticallyExposed': result.get('is_politically_exposed', False),
-                'stepCompleted': result.get('step_completed', 4),
-                'isCompleted': result.get('is_completed', False)
-            }
-            
-            return success_response(frontend_data, "Step 4 data saved successfully")
-        else:
-            return error_response(f"Failed to save Step 4 data: {result}", 500, 'DATABASE_ERROR')
-            
-    except Exception as e:
-        logger.error(f"Error in save_step4: {e}")
-        return error_response("Internal server error", 500, 'INTERNAL_ERROR')
+def get_repayment_quote():
+    """Repayment quote for a Step 5 loan amount and term.
 
-@onboarding_bp.route('/step4', methods=['GET'])
-@verify_firebase_token
-def get_step4():
-    """Get Step 4 onboarding data."""
+    Query: ``loanAmount`` (required), ``loanTerm`` (e.g. "8 weeks",
+    default the first offered term) and ``schedule=false`` to leave out
+    the amortization table.
+    """
     try:
-        # Get user ID from Firebase token
-        firebase_uid = request.firebase_user['uid']
-        
-        # Get data from database
-        success, result = OnboardingService.get_step4_data(firebase_uid)
-        
-        if success:
-            if result:
-                # Transform database format to frontend format
-                frontend_data = {
-                    'savings': float(result.get('savings')) if result.get('savings') else None,
-                    'assets': float(result.get('assets')) if result.get('assets') else None,
-                    'sourceOfFunds': result.get('source_of_funds'),
-                    'expectedAccountActivity': result.get('expected_account_activity'),
-                    'isPoliticallyExposed': result.get('is_politically_exposed', False),
-                    'stepCompleted': result.get('step_completed', 0),
-                    'isCompleted': result.get('is_completed', False)
-                }
-                
-                return success_response(frontend_data, "Step 4 data retrieved successfully")
-            else:
-                return success_response({}, "No Step 4 data found for user")
-        else:
-            return error_response(f"Failed to retrieve Step 4 data: {result}", 500, 'DATABASE_ERROR')
-            
-    except Exception as e:
-        logger.error(f"Error in get_step4: {e}")
-        return error_response("Internal server error", 500, 'INTERNAL_ERROR')
-    
-@onboarding_bp.route('/step5', methods=['POST'])
-@verify_firebase_token
-def save_step5():
-    """Save Step 5 onboarding data."""
-    try:
-        # Get user ID from Firebase token
-        firebase_uid = request.firebase_user['uid']
-        
-        # Get JSON data from request
-        step5_data = request.get_json()
-        
-        if not step5_data:
+        try:
+            amount = float(request.args.get('loanAmount', ''))
+        except ValueError:
+            amount = None
+        if amount is None or not MIN_LOAN_AMOUNT <= amount <= MAX_LOAN_AMOUNT:
             return error_response(
-                "No data provided",
-                400,
-                'NO_DATA'
-            )
-        
-        # Validate required fields
-        required_fields = ['loanAmount', 'loanPurpose']
-        missing_fields = []
-        
-        for field in required_fields:
-            value = step5_data.get(field)
-            if value is None or value == '':
-                missing_fields.append(field)
-        
-        if missing_fields:
-            return error_response(
-                f"Missing required fields: {', '.join(missing_fields)}",
+                "Loan amount must be between $100 and $2,000",
                 400,
-                'MISSING_REQUIRED_FIELDS'
+                'INVALID_LOAN_AMOUNT'
             )
-        
-        # Validate loan amount
-        loan_amount = step5_data.get('loanAmount')
-        if loan_amount is not None:
-            if not isinstance(loan_amount, (int, float)) or loan_amount < 100 or loan_amount > 2000:
-                return error_response(
-                    "Loan amount must be between $100 and $2,000",
-                    400,
-                    'INVALID_LOAN_AMOUNT'
-                )
-        
-        # Validate boolean declarations
-        declarations = ['understandsTerms', 'canAffordRepayments', 'hasReceivedAdvice']
-        for declaration in declarations:
-            value = step5_data.get(declaration, False)
-            if not value:
-                return error_response(
-                    f"All responsible lending declarations must be acknowledged",
-                    400,
-                    'MISSING_DECLARATIONS'
-                )
-        
-        # Save to database
-        success, result = OnboardingService.save_step5_data(firebase_uid, step5_data)
-        
-        if success:
-            # Transform database format to frontend format for response
-            frontend_data = {
-                'loanAmount': float(result.get('loan_amount')) if result.get('loan_amount') else None,
-                'loanPurpose': result.get('loan_purpose'),
-                'loanTerm': result.get('loan_term'),
-                'understandsTerms': result.get('understands_terms', False),
-                'canAffordRepayments': result.get('can_afford_repayments', False),
-                'hasReceivedAdvice': result.get('has_received_advice', False),
-                'stepCompleted': result.get('step_completed', 5),
-                'isCompleted': result.get('is_completed', False)
-            }
-            
-            return success_response(
-                frontend_data,
-                "Step 5 data saved successfully"
-            )
-        else:
-            return error_response(
-                f"Failed to save Step 5 data: {result}",
-                500,
-                'DATABASE_ERROR'
-            )
-            
+
+        success, result = QuoteService.quote(amount, request.args.get('loanTerm'))
+        if not success:
+            return error_response(result, 400, 'INVALID_LOAN_TERM')
+
+        if request.args.get('schedule') == 'false':
+            result = {key: value for key, value in result.items() if key != 'schedule'}
+        response = success_response(result, "Repayment quote calculated")
+        # Quotes only change with pricing config
+        response[0].headers['Cache-Control'] = 'private, max-age=3600'
+        return response
+
     except Exception as e:
-        logger.error(f"Error in save_step5: {e}")
+        logger.error(f"Error in get_repayment_quote: {e}")
         return error_response(
             "Internal server error",
             500,
             'INTERNAL_ERROR'
         )
 
-@onboarding_bp.route('/step5', methods=['GET'])
+@onboarding_bp.route('/initialize', methods=['POST'])
 @verify_firebase_token
-def get_step5():
-    """Get Step 5 onboarding data."""
+def initialize_onboarding():
+    """Initialize onboarding for a user (create tables if needed)."""
     try:
-        # Get user ID from Firebase token
-        firebase_uid = request.firebase_user['uid']
-        
-        # Get data from database
-        success, result = OnboardingService.get_step5_data(firebase_uid)
-        
+        # Create tables
+        success, message = DatabaseService.test_connection()
+
         if success:
-            if result:
-                # Transform database format to frontend format
-                frontend_data = {
-                    'loanAmount': float(result.get('loan_amount')) if result.get('loan_amount') else None,
-                    'loanPurpose': result.get('loan_purpose'),
-                    'loanTerm': result.get('loan_term'),
-                    'understandsTerms': result.get('understands_terms', False),
-                    'canAffordRepayments': result.get('can_afford_repayments', False),
-                    'hasReceivedAdvice': result.get('has_received_advice', False),
-                    'stepCompleted': result.get('step_completed', 0),
-                    'isCompleted': result.get('is_completed', False)
-                }
-                
-                return success_response(
-                    frontend_data,
-                    "Step 5 data retrieved successfully"
-                )
-            else:
-                return success_response(
-                    {},
-                    "No Step 5 data found for user"
-                )
+            return success_response(
+                {'tables_created': True},
+                message
+            )
         else:
             return error_response(
-                f"Failed to retrieve Step 5 data: {result}",
+                f"Failed to initialize onboarding: {message}",
                 500,
-                'DATABASE_ERROR'
+                'INITIALIZATION_ERROR'
             )
-            
+
     except Exception as e:
-        logger.error(f"Error in get_step5: {e}")
+        logger.error(f"Error in initialize_onboarding: {e}")
         return error_response(
             "Internal server error",
             500,
             'INTERNAL_ERROR'
         )
-    
-
-@onboarding_bp.route('/step6', methods=['POST'])
-@verify_firebase_token
-def save_step6():
-    """Save Step 6 onboarding data (document metadata only)."""
-    try:
-        firebase_uid = request.firebase_user['uid']
-        step6_data = request.get_json()
-        
-        if not step6_data:
-            return error_response("No data provided", 400, 'NO_DATA')
-        
-        # Validate that all required document fields are provided
-        required_fields = [
-            'identityDocumentName', 'identityDocumentSize', 'identityDocumentType',
-            'addressProofName', 'addressProofSize', 'addressProofType',
-            'incomeProofName', 'incomeProofSize', 'incomeProofType'
-        ]
-        missing_fields = [field for field in required_fields if not step6_data.get(field)]
-        
-        if missing_fields:
-            return error_response(f"Missing required fields: {', '.join(missing_fields)}", 400, 'MISSING_REQUIRED_FIELDS')
-        
-        # Save to database
-        success, result = OnboardingService.save_step6_data(firebase_uid, step6_data)
-        
-        if success:
-            frontend_data = {
-                'identityDocumentName': result.get('identity_document_name'),
-                'identityDocumentSize': result.get('identity_document_size'),
-                'identityDocumentType': result.get('identity_document_type'),
-                'identityDocumentUploadedAt': result.get('identity_document_uploaded_at').isoformat() if result.get('identity_document_uploaded_at') else None,
-                'addressProofName': result.get('address_proof_name'),
-                'addressProofSize': result.get('address_proof_size'),
-                'addressProofType': result.get('address_proof_type'),
-                'addressProofUploadedAt': result.get('address_proof_uploaded_at').isoformat() if result.get('address_proof_uploaded_at') else None,
-                'incomeProofName': result.get('income_proof_name'),
-                'incomeProofSize': result.get('income_proof_size'),
-                'incomeProofType': result.get('income_proof_type'),
-                'incomeProofUploadedAt': result.get('income_proof_uploaded_at').isoformat() if result.get('income_proof_uploaded_at') else None,
-                'stepCompleted': result.get('step_completed', 0),
-                'isCompleted': result.get('is_completed', False)
-            }
-            
-            return success_response(frontend_data, "Step 6 data saved successfully")
-        else:
-            return error_response(f"Failed to save Step 6 data: {result}", 500, 'DATABASE_ERROR')
-            
-    except Exception as e:
-        logger.error(f"Error in save_step6: {e}")
-        return error_response("Internal server error", 500, 'INTERNAL_ERROR')
-
-@onboarding_bp.route('/step6', methods=['GET'])
-@verify_firebase_token
-def get_step6():
-    """Get Step 6 onboarding data."""
-    try:
-        firebase_uid = request.firebase_user['uid']
-        success, result = OnboardingService.get_step6_data(firebase_uid)
-        
-        if success:
-            if result:
-                frontend_data = {
-                    'identityDocumentName': result.get('identity_document_name'),
-                    'identityDocumentSize': result.get('identity_document_size'),
-                    'identityDocumentType': result.get('identity_document_type'),
-                    'identityDocumentUploadedAt': result.get('identity_document_uploaded_at').isoformat() if result.get('identity_document_uploaded_at') else None,
-                    'addressProofName': result.get('address_proof_name'),
-                    'addressProofSize': result.get('address_proof_size'),
-                    'addressProofType': result.get('address_proof_type'),
-                    'addressProofUploadedAt': result.get('address_proof_uploaded_at').isoformat() if result.get('address_proof_uploaded_at') else None,
-                    'incomeProofName': result.get('income_proof_name'),
-                    'incomeProofSize': result.get('income_proof_size'),
-                    'incomeProofType': result.get('income_proof_type'),
-                    'incomeProofUploadedAt': result.get('income_proof_uploaded_at').isoformat() if result.get('income_proof_uploaded_at') else None,
-                    'stepCompleted': result.get('step_completed', 0),
-                    'isCompleted': result.get('is_completed', False)
-                }
-                
-                return success_response(frontend_data, "Step 6 data retrieved successfully")
-            else:
-                return success_response({}, "No Step 6 data found for user")
-        else:
-            return error_response(f"Failed to retrieve Step 6 data: {result}", 500, 'DATABASE_ERROR')
-            
-    except Exception as e:
-        logger.error(f"Error in get_step6: {e}")
-        return error_response("Internal server error", 500, 'INTERNAL_ERROR')
\ No newline at end of file
@@ -0,0 +1,454 @@
+# backend/app/schemas/onboarding_steps.py
+"""Declarative schemas for the six onboarding steps.
+
+Each step is described once as a list of ``StepField`` entries (payload key,
+DB column, kind, range/enum rules). Everything the routes and the service
+need per step is derived from that description when this module is
+imported:
+
+* ``validate(data)``    - compiled single-pass validator (see validation.py)
+* ``upsert_sql`` / ``upsert_params(uid, data)`` - the step's UPSERT
+  (``batch_upsert`` merges several steps into one statement)
+* ``select_sql``        - the step's SELECT by firebase_uid
+* ``patch_sql(columns)`` - minimal UPDATE for the columns a PATCH sends
+* ``to_frontend(row)``  - DB row -> camelCase response mapper
+
+Storage is split (migrations/008): ``onboarding_applications`` is a narrow
+"hot" row per application (progress, status and derived results) that
+every save touches, and each step's fields live in their own "cold"
+section table keyed by ``application_id``, written only when that step
+is saved. ``onboarding_applications_wide`` joins them back into the
+original wide shape for readers.
+"""
+
+from .validation import NUMBER_TYPES, compile_validator, field_error
+
+TABLE = 'onboarding_applications'
+
+# Read-only view with every application column (hot row + all sections)
+WIDE_VIEW = 'onboarding_applications_wide'
+
+# Columns every step returns alongside its own fields
+COMMON_COLUMNS = ('id', 'firebase_uid')
+STATUS_COLUMNS = ('step_completed', 'is_completed', 'created_at', 'updated_at')
+
+# ==========================================================================
+# VALUE CONVERTERS (DB -> FRONTEND)
+# ==========================================================================
+
+def format_date(value):
+    """Convert date object to frontend format."""
+    if not value:
+        return None
+    return value.strftime('%Y-%m-%d') if hasattr(value, 'strftime') else str(value)
+
+# Inline expression templates used when generating ``to_frontend``.
+# ``{v}`` is the raw column value, ``{empty}`` the field's empty value.
+# Decimals and datetimes are left to the app's JSON provider.
+CONVERTERS = {
+    'string': "{v} if {v} is not None else {empty}",
+    'boolean': "{v} if {v} is not None else {empty}",
+    'money': "{v} if {v} is not None else {empty}",
+    'integer': "int({v}) if {v} is not None else {empty}",
+    'date': "format_date({v}) if {v} else {empty}",
+    'timestamp': "{v} if {v} else {empty}",
+}
+
+# Column type per field kind, for casting untyped VALUES lists
+SQL_TYPES = {
+    'string': 'text',
+    'boolean': 'boolean',
+    'money': 'numeric',
+    'integer': 'integer',
+    'date': 'date',
+    'timestamp': 'timestamptz',
+}
+
+# ==========================================================================
+# SCHEMA DEFINITIONS
+# ==========================================================================
+
+class StepField:
+    """A single onboarding payload field and the DB column it maps to."""
+    __slots__ = (
+        'key', 'column', 'kind', 'required', 'choices', 'min_value', 'max_value',
+        'default', 'empty', 'error', 'type_error', 'server_value'
+    )
+
+    def __init__(self, key, column, kind='string', required=False, choices=None,
+                 min_value=None, max_value=None, default=None, empty=None,
+                 error=None, type_error=None, server_value=None):
+        self.key = key
+        self.column = column
+        self.kind = kind
+        self.required = required
+        self.choices = frozenset(choices) if choices is not None else None
+        self.min_value = min_value
+        self.max_value = max_value
+        self.default = default
+        self.empty = empty
+        self.error = error
+        self.type_error = type_error or (f"Field '{key}' must be a number", 'INVALID_FIELD_TYPE')
+        # SQL expression written instead of a payload value (e.g. CURRENT_TIMESTAMP)
+        self.server_value = server_value
+
+class StepSchema:
+    """Compiled schema for one onboarding step."""
+
+    # Progress and last change of a user's application (same for every step)
+    status_sql = f"SELECT step_completed, is_completed, updated_at FROM {TABLE} WHERE firebase_uid = %s;"
+
+    def __init__(self, step, table, fields, rules=(), completes=False):
+        self.step = step
+        self.table = table
+        self.fields = tuple(fields)
+        self.rules = tuple(rules)
+        self.completes = completes
+
+        self.columns = tuple(f.column for f in self.fields)
+        self.validate = compile_validator(self.fields, self.rules, name=f'validate_step{step}')
+        # Cross-field rules need the whole step, so PATCH only checks the fields it sends
+        self.validate_partial = compile_validator(self.fields, name=f'validate_step{step}_partial', partial=True)
+        self.upsert_sql = self._build_upsert_sql()
+        self.select_sql = self._build_select_sql()
+        self._payload_fields = tuple(
+            (f.key, f.default, f.kind == 'date') for f in self.fields if f.server_value is None
+        )
+        self.patchable = {f.key: f for f in self.fields if f.server_value is None}
+        self._patch_sql = {}
+        self._flush_sql = {}
+        self.to_frontend = self._compile_mapper()
+
+    # ----------------------------------------------------------------------
+    # SQL
+    # ----------------------------------------------------------------------
+
+    def _build_upsert_sql(self):
+        return build_upsert_sql((self,))
+
+    def _build_select_sql(self):
+        columns = ', '.join((
+            *(f"a.{column}" for column in COMMON_COLUMNS),
+            *(f"s.{column}" for column in self.columns),
+            *(f"a.{column}" for column in STATUS_COLUMNS)
+        ))
+        return (
+            f"SELECT {columns} FROM {TABLE} a "
+            f"LEFT JOIN {self.table} s ON s.application_id = a.id WHERE a.firebase_uid = %s;"
+        )
+
+    def patch_changes(self, data):
+        """Return ``[(column, value), ...]`` for the patchable keys present in ``data``."""
+        changes = []
+        for key, value in data.items():
+            field = self.patchable.get(key)
+            if field is not None:
+                changes.append((field.column, (value or None) if field.kind == 'date' else value))
+        changes.sort()
+        return changes
+
+    def patch_sql(self, columns):
+        """UPDATE/INSERT statements for a PATCH touching ``columns``, built once per column set.
+
+        Both take ``(firebase_uid, *values)``. The UPDATE upserts the step's
+        section row but only writes when at least one column actually
+        changes (``IS DISTINCT FROM``), so a no-op autosave leaves no dead
+        tuple; the hot row's ``updated_at`` moves only after a real change.
+        The INSERT is for users with no application yet.
+        """
+        statements = self._patch_sql.get(columns)
+        if statements is None:
+            placeholders = ', '.join('%s' for _ in columns)
+            assignments = ', '.join(f"{column} = EXCLUDED.{column}" for column in columns)
+            distinct = ' OR '.join(f"{self.table}.{column} IS DISTINCT FROM EXCLUDED.{column}" for column in columns)
+            update_sql = (
+                f"WITH app AS (SELECT id FROM {TABLE} WHERE firebase_uid = %s), changed AS ("
+                f"INSERT INTO {self.table} (application_id, {', '.join(columns)}) "
+                f"SELECT id, {placeholders} FROM app "
+                f"ON CONFLICT (application_id) DO UPDATE SET {assignments} WHERE {distinct} "
+                f"RETURNING application_id"
+                f") UPDATE {TABLE} a SET updated_at = CURRENT_TIMESTAMP FROM changed "
+                f"WHERE a.id = changed.application_id "
+                f"RETURNING a.step_completed, a.is_completed, a.updated_at;"
+            )
+            insert_sql = (
+                f"WITH app AS ("
+                f"INSERT INTO {TABLE} (firebase_uid) VALUES (%s) ON CONFLICT (firebase_uid) DO NOTHING "
+                f"RETURNING id, step_completed, is_completed, updated_at"
+                f"), section AS ("
+                f"INSERT INTO {self.table} (application_id, {', '.join(columns)}) "
+                f"SELECT id, {placeholders} FROM app"
+                f") SELECT step_completed, is_completed, updated_at FROM app;"
+            )
+            statements = self._patch_sql[columns] = (update_sql, insert_sql)
+        return statements
+
+    def flush_sql(self, columns):
+        """Multi-row upsert (for ``execute_values``) writing buffered drafts of ``columns``.
+
+        Rows carry the draft's save time as ``updated_at``; a row that was
+        written more recently (e.g. by a final step submission) is left alone.
+        """
+        statements = self._flush_sql.get(columns)
+        if statements is None:
+            kinds = {f.column: f.kind for f in self.fields}
+            updates = ', '.join(f"{column} = EXCLUDED.{column}" for column in columns)
+            sql = (
+                f"WITH drafts (firebase_uid, {', '.join(columns)}, updated_at) AS (VALUES %s), "
+                f"app AS ("
+                f"INSERT INTO {TABLE} (firebase_uid, updated_at) SELECT firebase_uid, updated_at FROM drafts "
+                f"ON CONFLICT (firebase_uid) DO UPDATE SET updated_at = EXCLUDED.updated_at "
+                f"WHERE {TABLE}.updated_at IS NULL OR {TABLE}.updated_at < EXCLUDED.updated_at "
+                f"RETURNING id, firebase_uid"
+                f") INSERT INTO {self.table} (application_id, {', '.join(columns)}) "
+                f"SELECT app.id, {', '.join(f'drafts.{column}' for column in columns)} "
+                f"FROM app JOIN drafts ON drafts.firebase_uid = app.firebase_uid "
+                f"ON CONFLICT (application_id) DO UPDATE SET {updates}"
+            )
+            casts = ', '.join(f"%s::{SQL_TYPES[kinds[column]]}" for column in columns)
+            template = f"(%s, {casts}, to_timestamp(%s))"
+            statements = self._flush_sql[columns] = (sql, template)
+        return statements
+
+    def payload_values(self, data):
+        """Column values for this step's fields (server-side values excluded)."""
+        values = []
+        for key, default, is_date in self._payload_fields:
+            value = data.get(key, default)
+            values.append((value or None) if is_date else value)
+        return values
+
+    def upsert_params(self, firebase_uid, data):
+        """Positional parameters for ``upsert_sql``."""
+        return [firebase_uid, self.step, *self.payload_values(data)]
+
+    # ----------------------------------------------------------------------
+    # Response mapping
+    # ----------------------------------------------------------------------
+
+    def _compile_mapper(self):
+        """Generate a straight-line ``row -> camelCase dict`` function."""
+        lines = ["def to_frontend(row):", "    get = row.get"]
+        items = []
+        for i, f in enumerate(self.fields):
+            lines.append(f"    v{i} = get({f.column!r})")
+            if f.kind in ('string', 'boolean', 'money') and f.empty is None:
+                expr = f"v{i}"
+            else:
+                expr = CONVERTERS[f.kind].format(v=f"v{i}", empty=repr(f.empty))
+            items.append(f"        {f.key!r}: {expr},")
+        lines += [
+            "    return {",
+            *items,
+            "        'stepCompleted': get('step_completed', 0),",
+            "        'isCompleted': get('is_completed', False),",
+            "    }",
+        ]
+        namespace = {'format_date': format_date}
+        exec(compile("\n".join(lines), f'<step{self.step}_to_frontend>', 'exec'), namespace)
+        to_frontend = namespace['to_frontend']
+        to_frontend.__doc__ = f"Transform a Step {self.step} database row to frontend format."
+        return to_frontend
+
+# ==========================================================================
+# UPSERTS (ONE STEP OR SEVERAL MERGED INTO ONE STATEMENT)
+# ==========================================================================
+
+def build_upsert_sql(schemas):
+    """UPSERT writing every field of ``schemas`` plus the step progress.
+
+    One statement: the hot row is upserted first (``step_completed``
+    advances to the highest step written) and each step's section row is
+    upserted from its id. Only the sections of ``schemas`` are written.
+    Parameters are the firebase_uid, that step, then each schema's
+    ``payload_values`` in order.
+    """
+    insert_columns = ['firebase_uid', 'step_completed']
+    values = ['%s', '%s']
+    updates = [f"step_completed = GREATEST({TABLE}.step_completed, EXCLUDED.step_completed)"]
+    if any(schema.completes for schema in schemas):
+        insert_columns.append('is_completed')
+        values.append('true')
+        updates.append('is_completed = true')
+    updates.append('updated_at = CURRENT_TIMESTAMP')
+
+    ctes = [
+        f"app AS (INSERT INTO {TABLE} ({', '.join(insert_columns)}) VALUES ({', '.join(values)}) "
+        f"ON CONFLICT (firebase_uid) DO UPDATE SET {', '.join(updates)} "
+        f"RETURNING {', '.join((*COMMON_COLUMNS, *STATUS_COLUMNS))})"
+    ]
+    joins = []
+    for schema in schemas:
+        alias = f"s{schema.step}"
+        section_updates = ', '.join(
+            f"{f.column} = {f.server_value or 'EXCLUDED.' + f.column}" for f in schema.fields
+        )
+        ctes.append(
+            f"{alias} AS (INSERT INTO {schema.table} (application_id, {', '.join(schema.columns)}) "
+            f"SELECT id, {', '.join(f.server_value or '%s' for f in schema.fields)} FROM app "
+            f"ON CONFLICT (application_id) DO UPDATE SET {section_updates} "
+            f"RETURNING application_id, {', '.join(schema.columns)})"
+        )
+        joins.append(f"JOIN {alias} ON {alias}.application_id = app.id")
+
+    returning = ', '.join((
+        *(f"app.{column}" for column in COMMON_COLUMNS),
+        *(f"s{schema.step}.{column}" for schema in schemas for column in schema.columns),
+        *(f"app.{column}" for column in STATUS_COLUMNS)
+    ))
+    return f"WITH {', '.join(ctes)} SELECT {returning} FROM app {' '.join(joins)};"
+
+_BATCH_UPSERT_SQL = {}
+
+def batch_upsert(firebase_uid, payloads):
+    """SQL and parameters saving several steps in one statement.
+
+    ``payloads`` maps step number -> validated step data. Statements are
+    built once per combination of steps.
+    """
+    steps = tuple(sorted(payloads))
+    sql = _BATCH_UPSERT_SQL.get(steps)
+    if sql is None:
+        sql = _BATCH_UPSERT_SQL[steps] = build_upsert_sql(tuple(STEP_SCHEMAS[step] for step in steps))
+
+    params = [firebase_uid, steps[-1]]
+    for step in steps:
+        params.extend(STEP_SCHEMAS[step].payload_values(payloads[step]))
+    return sql, params
+
+# ==========================================================================
+# CROSS-FIELD RULES
+# ==========================================================================
+
+RESIDENCY_STATUSES = ('citizen', 'permanent_resident', 'temporary_resident', 'work_visa', 'student_visa')
+EMPLOYMENT_TYPES = ('full_time', 'part_time', 'self_employed', 'contract', 'casual', 'unemployed', 'retired', 'student')
+EMPLOYMENT_DURATIONS = ('less_than_3_months', '3_to_6_months', '6_months_to_1_year', '1_to_2_years', '2_to_5_years', 'more_than_5_years')
+
+EMPLOYMENT_TYPE_SET = frozenset(EMPLOYMENT_TYPES)
+UNEMPLOYED_TYPES = frozenset(('unemployed', 'retired'))
+
+MISSING_EMPLOYER = field_error(
+    'employer', "Employer name is required for employed individuals", 'MISSING_EMPLOYER')
+MISSING_JOB_TITLE = field_error(
+    'jobTitle', "Job title is required for employed individuals", 'MISSING_JOB_TITLE')
+MISSING_EMPLOYMENT_DURATION = field_error(
+    'employmentDuration', "Employment duration is required for employed individuals", 'MISSING_EMPLOYMENT_DURATION')
+INVALID_MONTHLY_INCOME = field_error(
+    'monthlyIncome', "Monthly income is required and must be greater than 0 for employed individuals",
+    'INVALID_MONTHLY_INCOME')
+NO_INCOME_SPECIFIED = field_error(
+    'monthlyIncome', "Please specify your income source. Enter the amount in either monthly income or other income field.",
+    'NO_INCOME_SPECIFIED')
+
+def _employment_rule(data):
+    """Employed applicants need job details, others need some income."""
+    employment_type = data.get('employmentType')
+    if employment_type not in EMPLOYMENT_TYPE_SET:
+        # Missing or invalid type is already reported by the field checks
+        return None
+
+    errors = []
+    if employment_type not in UNEMPLOYED_TYPES:
+        if not data.get('employer'):
+            errors.append(MISSING_EMPLOYER)
+        if not data.get('jobTitle'):
+            errors.append(MISSING_JOB_TITLE)
+        if not data.get('employmentDuration'):
+            errors.append(MISSING_EMPLOYMENT_DURATION)
+        monthly_income = data.get('monthlyIncome')
+        if not isinstance(monthly_income, NUMBER_TYPES) or monthly_income <= 0:
+            errors.append(INVALID_MONTHLY_INCOME)
+    else:
+        monthly_income = data.get('monthlyIncome') or 0
+        other_income = data.get('otherIncome') or 0
+        if not (isinstance(monthly_income, NUMBER_TYPES) and monthly_income > 0) and \
+                not (isinstance(other_income, NUMBER_TYPES) and other_income > 0):
+            errors.append(NO_INCOME_SPECIFIED)
+    return errors
+
+DECLARATION_ERROR = ("All responsible lending declarations must be acknowledged", 'MISSING_DECLARATIONS')
+
+# ==========================================================================
+# STEP REGISTRY
+# ==========================================================================
+
+def _document_fields(prefix, column_prefix):
+    return [
+        StepField(f'{prefix}Name', f'{column_prefix}_name', required=True),
+        StepField(f'{prefix}Size', f'{column_prefix}_size', 'integer', required=True),
+        StepField(f'{prefix}Type', f'{column_prefix}_type', required=True),
+        StepField(f'{prefix}UploadedAt', f'{column_prefix}_uploaded_at', 'timestamp', server_value='CURRENT_TIMESTAMP'),
+    ]
+
+STEP_SCHEMAS = {
+    # STEP 1: PERSONAL INFORMATION
+    1: StepSchema(1, 'onboarding_personal', [
+        StepField('fullName', 'full_name', required=True),
+        StepField('dob', 'date_of_birth', 'date', required=True),
+        StepField('address', 'address', required=True),
+        StepField('email', 'email', required=True),
+        StepField('phoneNumber', 'phone_number', required=True),
+        StepField('nzResidencyStatus', 'nz_residency_status', required=True, choices=RESIDENCY_STATUSES,
+                  error=("Invalid residency status", 'INVALID_RESIDENCY_STATUS')),
+        StepField('taxNumber', 'tax_number'),
+    ]),
+
+    # STEP 2: EMPLOYMENT & INCOME
+    2: StepSchema(2, 'onboarding_employment', [
+        StepField('employmentType', 'employment_type', required=True, choices=EMPLOYMENT_TYPES,
+                  error=("Invalid employment type", 'INVALID_EMPLOYMENT_TYPE')),
+        StepField('employer', 'employer'),
+        StepField('jobTitle', 'job_title'),
+        StepField('employmentDuration', 'employment_duration', choices=EMPLOYMENT_DURATIONS,
+                  error=("Invalid employment duration", 'INVALID_EMPLOYMENT_DURATION')),
+        StepField('monthlyIncome', 'monthly_income', 'money'),
+        StepField('otherIncome', 'other_income', 'money', default=0, empty=0),
+    ], rules=[_employment_rule]),
+
+    # STEP 3: EXPENSES & OBLIGATIONS
+    3: StepSchema(3, 'onboarding_expenses', [
+        StepField('rent', 'rent', 'money', required=True, min_value=0, max_value=10000,
+                  error=("Rent must be between 0 and 10,000", 'INVALID_RENT_AMOUNT')),
+        StepField('monthlyExpenses', 'monthly_expenses', 'money', required=True, min_value=0, max_value=20000,
+                  error=("Monthly expenses must be between 0 and 20,000", 'INVALID_EXPENSES_AMOUNT')),
+        StepField('debts', 'debts', 'money', required=True, min_value=0, max_value=500000,
+                  error=("Debts must be between 0 and 500,000", 'INVALID_DEBTS_AMOUNT')),
+        StepField('dependents', 'dependents', 'integer', required=True, min_value=0, max_value=10,
+                  error=("Dependents must be between 0 and 10", 'INVALID_DEPENDENTS_COUNT')),
+    ]),
+
+    # STEP 4: ASSETS & FINANCIAL PROFILE
+    4: StepSchema(4, 'onboarding_assets', [
+        StepField('savings', 'savings', 'money'),
+        StepField('assets', 'assets', 'money'),
+        StepField('sourceOfFunds', 'source_of_funds'),
+        StepField('expectedAccountActivity', 'expected_account_activity'),
+        StepField('isPoliticallyExposed', 'is_politically_exposed', 'boolean', default=False, empty=False),
+    ]),
+
+    # STEP 5: LOAN REQUEST
+    5: StepSchema(5, 'onboarding_loan', [
+        StepField('loanAmount', 'loan_amount', 'money', required=True, min_value=100, max_value=2000,
+                  error=("Loan amount must be between $100 and $2,000", 'INVALID_LOAN_AMOUNT'),
+                  type_error=("Loan amount must be between $100 and $2,000", 'INVALID_LOAN_AMOUNT')),
+        StepField('loanPurpose', 'loan_purpose', required=True),
+        StepField('loanTerm', 'loan_term'),
+        StepField('understandsTerms', 'understands_terms', 'boolean', required=True,
+                  default=False, empty=False, error=DECLARATION_ERROR),
+        StepField('canAffordRepayments', 'can_afford_repayments', 'boolean', required=True,
+                  default=False, empty=False, error=DECLARATION_ERROR),
+        StepField('hasReceivedAdvice', 'has_received_advice', 'boolean', required=True,
+                  default=False, empty=False, error=DECLARATION_ERROR),
+    ]),
+
+    # STEP 6: DOCUMENTS & KYC (document metadata only)
+    6: StepSchema(6, 'onboarding_documents', [
+        *_document_fields('identityDocument', 'identity_document'),
+        *_document_fields('addressProof', 'address_proof'),
+        *_document_fields('incomeProof', 'income_proof'),
+    ], completes=True),
+}
+
+def get_step_schema(step):
+    """Return the compiled schema for a step, or None for unknown steps."""
+    return STEP_SCHEMAS.get(step)
@@ -0,0 +1,114 @@
+# backend/app/schemas/validation.py
+"""Compiles onboarding field specs into single-pass validator functions.
+
+``compile_validator`` generates straight-line Python source for a step:
+one ``data.get`` per field, enum membership against a frozenset, bounds
+inlined as constants and every error object built once at compile time.
+A valid payload allocates nothing; an invalid one allocates a single list
+holding every field error, so clients can fix all fields in one round trip.
+"""
+
+NUMBER_TYPES = (int, float)
+
+MISSING_REQUIRED_FIELDS = 'MISSING_REQUIRED_FIELDS'
+
+# Sentinel for keys not present in a partial payload
+ABSENT = object()
+
+def field_error(field, message, code):
+    """Error entry reported for a single payload field."""
+    return {'field': field, 'message': message, 'code': code}
+
+def summarize_errors(errors):
+    """Return the top-level ``(message, error_code)`` for a list of field errors.
+
+    Missing fields are reported together, matching the original
+    "Missing required fields: a, b" message; otherwise the first error wins.
+    """
+    missing = [e['field'] for e in errors if e['code'] == MISSING_REQUIRED_FIELDS]
+    if missing:
+        return f"Missing required fields: {', '.join(missing)}", MISSING_REQUIRED_FIELDS
+    first = errors[0]
+    return first['message'], first['code']
+
+def compile_validator(fields, rules=(), name='validate', partial=False):
+    """Compile field specs into ``validate(data) -> list of errors or None``.
+
+    ``fields`` are ``StepField``-like objects. ``rules`` are cross-field
+    callables returning a (possibly empty) list of field errors; they run
+    after the per-field checks. With ``partial`` a field absent from the
+    payload is skipped entirely (PATCH semantics), while a field that is
+    sent must still be valid.
+    """
+    namespace = {'NUMBER_TYPES': NUMBER_TYPES, 'ABSENT': ABSENT}
+    lines = [f"def {name}(data):", "    get = data.get", "    errors = None"]
+
+    def add(const_name, error):
+        namespace[const_name] = error
+        return [
+            "        if errors is None:",
+            "            errors = []",
+            f"        errors.append({const_name})",
+        ]
+
+    for i, f in enumerate(fields):
+        if f.server_value is not None:
+            continue
+        numeric = f.kind in ('money', 'integer')
+        ranged = f.min_value is not None or f.max_value is not None
+        branches = []
+
+        if f.required and f.kind == 'boolean':
+            # A required boolean is a declaration that must be acknowledged
+            branches.append(("not v", add(f'MISSING_{i}', field_error(f.key, *f.error))))
+        elif f.required:
+            missing = "v is None or v == ''" if numeric else "not v"
+            branches.append((missing, add(f'MISSING_{i}', field_error(
+                f.key, f"{f.key} is required", MISSING_REQUIRED_FIELDS))))
+
+        if f.choices is not None:
+            namespace[f'CHOICES_{i}'] = f.choices
+            condition = f"v not in CHOICES_{i}" if f.required else f"v and v not in CHOICES_{i}"
+            branches.append((condition, add(f'CHOICE_{i}', field_error(f.key, *f.error))))
+
+        if ranged:
+            present = "" if f.required else "v is not None and "
+            branches.append((
+                f"{present}not isinstance(v, NUMBER_TYPES)",
+                add(f'TYPE_{i}', field_error(f.key, *f.type_error))
+            ))
+            bounds = []
+            if f.min_value is not None:
+                bounds.append(f"v < {f.min_value!r}")
+            if f.max_value is not None:
+                bounds.append(f"v > {f.max_value!r}")
+            branches.append((
+                f"{present}({' or '.join(bounds)})",
+                add(f'RANGE_{i}', field_error(f.key, *f.error))
+            ))
+
+        if not branches:
+            continue
+        if partial:
+            branches.insert(0, ("v is ABSENT", ["        pass"]))
+            lines.append(f"    v = get({f.key!r}, ABSENT)")
+        else:
+            lines.append(f"    v = get({f.key!r})")
+        for n, (condition, body) in enumerate(branches):
+            keyword = "if" if n == 0 else "elif"
+            lines.append(f"    {keyword} {condition}:")
+            lines += body
+
+    for i, rule in enumerate(rules):
+        namespace[f'RULE_{i}'] = rule
+        lines += [
+            f"    rule_errors = RULE_{i}(data)",
+            "    if rule_errors:",
+            "        if errors is None:",
+            "            errors = []",
+            "        errors.extend(rule_errors)",
+        ]
+    lines.append("    return errors")
+
+    exec(compile("\n".join(lines), f'<{name}>', 'exec'), namespace)
+    return namespace[name]
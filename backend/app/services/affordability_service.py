@@ -0,0 +1,305 @@
+# backend/app/services/affordability_service.py
+import io
+import logging
+import re
+import time
+import math
+import uuid
+from flask import current_app
+from psycopg2.extensions import cursor as TupleCursor
+from ..services.database_service import DatabaseService
+from ..services.batch_job_service import BatchJob
+from ..schemas.onboarding_steps import TABLE, WIDE_VIEW
+
+logger = logging.getLogger(__name__)
+
+# Inputs, in the order the engine receives them; money is read as float8
+INPUT_COLUMNS = (
+    'monthly_income', 'other_income', 'rent', 'monthly_expenses',
+    'debts', 'dependents', 'loan_amount', 'loan_term'
+)
+INPUT_SELECT = ', '.join(
+    column if column == 'loan_term' else f"{column}::float8" for column in INPUT_COLUMNS
+)
+
+OUTCOMES = ('incomplete', 'decline', 'refer', 'pass')
+INCOMPLETE, DECLINE, REFER, PASS = range(len(OUTCOMES))
+
+WEEKS_PER_MONTH = 52 / 12
+TERM_PATTERN = re.compile(r'(\d+)\s*[_ ]?\s*(week|fortnight|month)', re.IGNORECASE)
+TERM_WEEKS = {'week': 1, 'fortnight': 2, 'month': WEEKS_PER_MONTH}
+
+def term_weeks(term, default_weeks=None):
+    """Loan term text ('8 weeks', '3 months', '6_months') -> weeks, or ``default_weeks``."""
+    match = TERM_PATTERN.search(term or '')
+    return int(match.group(1)) * TERM_WEEKS[match.group(2).lower()] if match else default_weeks
+
+def term_months(term, default_weeks):
+    """Loan term text -> months."""
+    return max(term_weeks(term, default_weeks), 1) / WEEKS_PER_MONTH
+
+def load_policy(config):
+    """Affordability policy from app config."""
+    return {
+        'version': config['AFFORDABILITY_POLICY_VERSION'],
+        'cost_rate': config['AFFORDABILITY_COST_RATE'],
+        'debt_servicing_rate': config['AFFORDABILITY_DEBT_SERVICING_RATE'],
+        'dependent_allowance': config['AFFORDABILITY_DEPENDENT_ALLOWANCE'],
+        'min_surplus': config['AFFORDABILITY_MIN_SURPLUS'],
+        'max_repayment_ratio': config['AFFORDABILITY_MAX_REPAYMENT_RATIO'],
+        'default_term_weeks': config['AFFORDABILITY_DEFAULT_TERM_WEEKS']
+    }
+
+# ==========================================================================
+# ENGINE
+# ==========================================================================
+# numpy is imported inside the batch functions only, so the Step 5 save
+# (``assess_one``) does not load it on the request path.
+
+def assess_one(values, policy):
+    """Score one application: ``values`` maps ``INPUT_COLUMNS`` to values (None if missing).
+
+    Returns ``(outcome code, monthly surplus, repayment ratio)`` with the
+    same rules as ``assess_arrays``; surplus and ratio are None when the
+    outcome is ``incomplete``.
+    """
+    income = (values['monthly_income'] or 0) + (values['other_income'] or 0)
+    inputs = (values['rent'], values['monthly_expenses'], values['debts'], values['dependents'],
+              values['loan_amount'])
+    if income <= 0 or any(value is None for value in inputs):
+        return INCOMPLETE, None, None
+
+    commitments = (
+        values['rent'] + values['monthly_expenses']
+        + values['debts'] * policy['debt_servicing_rate']
+        + values['dependents'] * policy['dependent_allowance']
+    )
+    months = term_months(values['loan_term'], policy['default_term_weeks'])
+    repayment = values['loan_amount'] * (1 + policy['cost_rate']) / months
+    surplus = income - commitments - repayment
+    ratio = repayment / income
+
+    if surplus >= policy['min_surplus'] and ratio <= policy['max_repayment_ratio']:
+        outcome = PASS
+    elif surplus > 0:
+        outcome = REFER
+    else:
+        outcome = DECLINE
+    return outcome, surplus, ratio
+
+def assess_arrays(columns, policy):
+    """Score many applications at once.
+
+    ``columns`` maps each of ``INPUT_COLUMNS`` to a 1-D array (money and
+    counts as float with NaN for missing values, ``loan_term`` as objects).
+    Returns ``(outcome codes, monthly surplus, repayment ratio)``:
+
+    - income: monthly + other income
+    - commitments: rent + expenses + debts x servicing rate
+      + dependants x allowance
+    - repayment: loan x (1 + cost rate) spread over the term in months
+    - surplus: income - commitments - repayment; ratio: repayment / income
+
+    ``pass`` needs surplus >= min_surplus and ratio <= max_repayment_ratio,
+    ``refer`` a positive surplus, anything else is ``decline``. Rows
+    missing step 2, 3 or 5 data are ``incomplete`` (NaN surplus and ratio).
+    """
+    import numpy as np
+
+    income = np.nan_to_num(columns['monthly_income']) + np.nan_to_num(columns['other_income'])
+    commitments = (
+        columns['rent'] + columns['monthly_expenses']
+        + columns['debts'] * policy['debt_servicing_rate']
+        + columns['dependents'] * policy['dependent_allowance']
+    )
+
+    # Few distinct terms: parse each once and broadcast
+    terms, inverse = np.unique(np.asarray(columns['loan_term'], dtype=object).astype(str), return_inverse=True)
+    months = np.array([term_months(term, policy['default_term_weeks']) for term in terms])[inverse]
+    repayment = columns['loan_amount'] * (1 + policy['cost_rate']) / months
+
+    surplus = income - commitments - repayment
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.where(income > 0, repayment / income, np.inf)
+
+    outcome = np.full(surplus.shape, DECLINE, dtype=np.int8)
+    outcome[surplus > 0] = REFER
+    outcome[(surplus >= policy['min_surplus']) & (ratio <= policy['max_repayment_ratio'])] = PASS
+    incomplete = np.isnan(surplus) | ~(income > 0)
+    outcome[incomplete] = INCOMPLETE
+    surplus[incomplete] = np.nan
+    ratio = np.where(incomplete | np.isinf(ratio), np.nan, ratio)
+    return outcome, surplus, ratio
+
+def rows_to_columns(rows):
+    """Row tuples (ordered like ``INPUT_COLUMNS``) -> column arrays."""
+    import numpy as np
+
+    transposed = list(zip(*rows)) or [()] * len(INPUT_COLUMNS)
+    columns = {}
+    for column, values in zip(INPUT_COLUMNS, transposed):
+        columns[column] = (
+            np.array(values, dtype=object) if column == 'loan_term' else np.array(values, dtype=float)
+        )
+    return columns
+
+# ==========================================================================
+# PERSISTENCE
+# ==========================================================================
+
+RESULT_UPDATE_SQL = (
+    f"UPDATE {TABLE} SET affordability_outcome = %s, affordability_surplus = %s, "
+    f"affordability_ratio = %s, affordability_policy = %s, affordability_assessed_at = CURRENT_TIMESTAMP "
+    f"WHERE firebase_uid = %s;"
+)
+
+def _nullable(value):
+    return None if value is None else round(float(value), 4)
+
+def _copy_value(value, digits):
+    """A float as COPY text, with NaN as NULL."""
+    return '\\N' if math.isnan(value) else f"{value:.{digits}f}"
+
+class AffordabilityRescoreJob(BatchJob):
+    """Re-score under a policy, in parallel partitions (``BatchJobService``).
+
+    Only rows whose result (or policy version) changed are rewritten.
+    """
+    name = 'rescore-affordability'
+    source = WIDE_VIEW
+    select = f"id, {INPUT_SELECT}"
+    update_template = "(%s, %s, %s::numeric(12, 2), %s::numeric(10, 4), %s)"
+    update_sql = (
+        "UPDATE {table} t SET affordability_outcome = v.outcome, affordability_surplus = v.surplus, "
+        "affordability_ratio = v.ratio, affordability_policy = v.policy, "
+        "affordability_assessed_at = CURRENT_TIMESTAMP "
+        "FROM (VALUES %s) AS v (id, outcome, surplus, ratio, policy) "
+        "WHERE t.id = v.id AND ("
+        "t.affordability_outcome IS DISTINCT FROM v.outcome OR "
+        "t.affordability_surplus IS DISTINCT FROM v.surplus OR "
+        "t.affordability_ratio IS DISTINCT FROM v.ratio OR "
+        "t.affordability_policy IS DISTINCT FROM v.policy) "
+        "RETURNING t.id;"
+    )
+
+    @classmethod
+    def load_params(cls, config):
+        return load_policy(config)
+
+    def process(self, rows):
+        import numpy as np
+
+        outcome, surplus, ratio = assess_arrays(rows_to_columns([row[1:] for row in rows]), self.params)
+        surplus = np.where(np.isnan(surplus), None, surplus.round(2))
+        ratio = np.where(np.isnan(ratio), None, ratio.round(4))
+        values = [
+            (row[0], OUTCOMES[code], s, r, self.params['version'])
+            for row, code, s, r in zip(rows, outcome.tolist(), surplus.tolist(), ratio.tolist())
+        ]
+        counts = np.bincount(outcome, minlength=len(OUTCOMES)).tolist()
+        return values, dict(zip(OUTCOMES, counts))
+
+class AffordabilityService:
+    """Affordability / serviceability pre-assessment.
+
+    Each application is scored when Step 5 is saved (inside the save's
+    transaction, with the scalar ``assess_one``) and the whole table can
+    be re-scored after a policy change with ``rescore_all`` (the
+    vectorized ``assess_arrays``, same rules). Results never touch
+    ``updated_at``.
+    """
+
+    @staticmethod
+    def assess_in_transaction(cursor, firebase_uid):
+        """Score one application on the caller's cursor before it commits.
+
+        Runs under a savepoint so a failure is logged without undoing the
+        caller's write.
+        """
+        policy = load_policy(current_app.config)
+        cursor.execute("SAVEPOINT affordability;")
+        try:
+            cursor.execute(f"SELECT {INPUT_SELECT} FROM {WIDE_VIEW} WHERE firebase_uid = %s;", (firebase_uid,))
+            outcome, surplus, ratio = assess_one(cursor.fetchone(), policy)
+            cursor.execute(RESULT_UPDATE_SQL, (
+                OUTCOMES[outcome], _nullable(surplus), _nullable(ratio), policy['version'], firebase_uid
+            ))
+            cursor.execute("RELEASE SAVEPOINT affordability;")
+            return OUTCOMES[outcome]
+        except Exception as e:
+            cursor.execute("ROLLBACK TO SAVEPOINT affordability;")
+            logger.error(f"Affordability assessment failed for {firebase_uid}: {e}")
+            return None
+
+    @staticmethod
+    def rescore_all(batch_size=None):
+        """Re-score every application under the current policy.
+
+        Inputs stream from a server-side cursor in batches that are scored
+        as column arrays; results are COPYed into a staging table and
+        applied with one UPDATE that only rewrites rows whose result
+        changed. The change-notification trigger is muted (migration 003)
+        since no application data changes.
+        """
+        import numpy as np
+
+        policy = load_policy(current_app.config)
+        batch_size = batch_size or current_app.config['AFFORDABILITY_BATCH_SIZE']
+        stats = {'scored': 0, 'updated': 0, 'outcomes': dict.fromkeys(OUTCOMES, 0)}
+        started = time.perf_counter()
+        compute_seconds = 0.0
+
+        with DatabaseService.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SET LOCAL terepay.bulk_import = 'on';")
+            cursor.execute(
+                "CREATE TEMP TABLE affordability_results "
+                "(id BIGINT, outcome TEXT, surplus NUMERIC(12, 2), ratio NUMERIC(10, 4)) ON COMMIT DROP;"
+            )
+
+            reader = conn.cursor(name=f"affordability_{uuid.uuid4().hex}", cursor_factory=TupleCursor)
+            reader.itersize = batch_size
+            reader.execute(f"SELECT id, {INPUT_SELECT} FROM {WIDE_VIEW};")
+            while True:
+                batch = reader.fetchmany(batch_size)
+                if not batch:
+                    break
+                computed = time.perf_counter()
+                ids = [row[0] for row in batch]
+                outcome, surplus, ratio = assess_arrays(rows_to_columns([row[1:] for row in batch]), policy)
+                counts = np.bincount(outcome, minlength=len(OUTCOMES))
+                lines = ''.join(
+                    f"{id_}\t{OUTCOMES[code]}\t{_copy_value(s, 2)}\t{_copy_value(r, 4)}\n"
+                    for id_, code, s, r in zip(ids, outcome.tolist(), surplus.tolist(), ratio.tolist())
+                )
+                compute_seconds += time.perf_counter() - computed
+
+                cursor.copy_expert("COPY affordability_results FROM STDIN", io.StringIO(lines))
+                stats['scored'] += len(batch)
+                for name, count in zip(OUTCOMES, counts.tolist()):
+                    stats['outcomes'][name] += count
+            reader.close()
+
+            cursor.execute(
+                f"UPDATE {TABLE} t SET affordability_outcome = r.outcome, affordability_surplus = r.surplus, "
+                f"affordability_ratio = r.ratio, affordability_policy = %s, "
+                f"affordability_assessed_at = CURRENT_TIMESTAMP "
+                f"FROM affordability_results r WHERE t.id = r.id AND ("
+                f"t.affordability_outcome IS DISTINCT FROM r.outcome OR "
+                f"t.affordability_surplus IS DISTINCT FROM r.surplus OR "
+                f"t.affordability_ratio IS DISTINCT FROM r.ratio OR "
+                f"t.affordability_policy IS DISTINCT FROM %s);",
+                (policy['version'], policy['version'])
+            )
+            stats['updated'] = cursor.rowcount
+            conn.commit()
+
+        elapsed = time.perf_counter() - started
+        stats['seconds'] = round(elapsed, 3)
+        stats['compute_seconds'] = round(compute_seconds, 3)
+        stats['rows_per_second'] = round(stats['scored'] / elapsed) if elapsed else 0
+        logger.info(
+            f"Re-scored {stats['scored']} applications under policy {policy['version']} in {elapsed:.2f}s "
+            f"({stats['updated']} changed)"
+        )
+        return stats
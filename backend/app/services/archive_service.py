@@ -0,0 +1,178 @@
+# backend/app/services/archive_service.py
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from flask import current_app
+from ..services.database_service import DatabaseService
+from ..schemas.onboarding_steps import STEP_SCHEMAS, TABLE, WIDE_VIEW
+from ..utils.partitions import month_start, monthly_partition_sql
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_TABLE = 'onboarding_applications_archive'
+SIZES_TABLE = 'onboarding_table_sizes'
+
+# Tables whose size (and index size) is recorded: the hot row and every section
+TRACKED_TABLES = (TABLE, *(schema.table for schema in STEP_SCHEMAS.values()))
+
+# Archive reason -> (hot-row condition, config key with its age in days).
+# Each condition is a range scan of one listing index (migrations/002).
+ARCHIVE_RULES = {
+    'completed': ('is_completed', 'ARCHIVE_COMPLETED_AFTER_DAYS'),
+    'abandoned': ('NOT is_completed', 'ARCHIVE_ABANDONED_AFTER_DAYS'),
+}
+
+# One batch: copy the wide rows into the archive and delete the hot rows
+# (sections cascade), in one statement. SKIP LOCKED leaves rows being
+# saved right now for a later batch instead of waiting on them.
+ARCHIVE_BATCH_SQL = (
+    f"WITH picked AS ("
+    f"SELECT id FROM {TABLE} WHERE {{condition}} AND updated_at < %s "
+    f"ORDER BY updated_at, id LIMIT %s FOR UPDATE SKIP LOCKED"
+    f"), archived AS ("
+    f"INSERT INTO {ARCHIVE_TABLE} (application_id, firebase_uid, reason, application) "
+    f"SELECT w.id, w.firebase_uid, %s, to_jsonb(w) FROM {WIDE_VIEW} w JOIN picked ON picked.id = w.id"
+    f") DELETE FROM {TABLE} a USING picked WHERE a.id = picked.id RETURNING a.id;"
+)
+
+# Latest archived copy, rebuilt with the wide view's column types
+ARCHIVE_READ_SQL = (
+    f"SELECT r.* FROM ("
+    f"SELECT application FROM {ARCHIVE_TABLE} WHERE firebase_uid = %s ORDER BY archived_at DESC LIMIT 1"
+    f") latest, jsonb_populate_record(NULL::{WIDE_VIEW}, latest.application) r;"
+)
+
+RECORD_SIZES_SQL = (
+    f"INSERT INTO {SIZES_TABLE} (relation, table_name, kind, bytes, live_rows, dead_rows) "
+    f"SELECT c.relname, t.relname, CASE WHEN c.relkind = 'i' THEN 'index' ELSE 'table' END, "
+    f"CASE WHEN c.relkind = 'i' THEN pg_relation_size(c.oid) ELSE pg_table_size(c.oid) END, "
+    f"s.n_live_tup, s.n_dead_tup "
+    f"FROM pg_class t "
+    f"JOIN pg_class c ON c.oid = t.oid OR c.oid IN (SELECT indexrelid FROM pg_index WHERE indrelid = t.oid) "
+    f"LEFT JOIN pg_stat_user_tables s ON s.relid = c.oid "
+    f"WHERE t.oid = ANY(%s::regclass[]) "
+    f"RETURNING captured_at, relation, table_name, kind, bytes, live_rows, dead_rows;"
+)
+
+def summarize_sizes(rows):
+    """Size rows -> ``{'table_bytes', 'index_bytes'}`` totals."""
+    totals = {'table_bytes': 0, 'index_bytes': 0}
+    for row in rows:
+        totals[f"{row['kind']}_bytes"] += row['bytes']
+    return totals
+
+class ArchiveService:
+    """Moves old applications out of the hot tables.
+
+    Completed applications and abandoned drafts untouched for long enough
+    are copied, as their full wide row (JSONB), into
+    ``onboarding_applications_archive``, partitioned by month archived,
+    and deleted from ``onboarding_applications`` in small batches, each
+    its own short transaction. Reads fall back to the archive when a user
+    has no live application; a user who saves again starts a new one.
+    """
+
+    @staticmethod
+    def read_in_transaction(cursor, firebase_uid):
+        """The user's latest archived application (wide row dict), or None."""
+        cursor.execute(ARCHIVE_READ_SQL, (firebase_uid,))
+        row = cursor.fetchone()
+        return dict(row) if row else None
+
+    @staticmethod
+    def archive(completed_days=None, abandoned_days=None, batch_size=None, progress=None):
+        """Archive everything past the age limits. Returns stats.
+
+        An age of 0 turns that rule off. ``progress`` is called with the
+        running counts after every batch. Committed batches stay archived
+        if the run fails, so it can simply be run again.
+        """
+        config = current_app.config
+        overrides = {'completed': completed_days, 'abandoned': abandoned_days}
+        batch_size = batch_size or config['ARCHIVE_BATCH_SIZE']
+        pause = config['ARCHIVE_BATCH_PAUSE']
+        lock_timeout = config['ARCHIVE_LOCK_TIMEOUT']
+        started = time.perf_counter()
+        now = datetime.now(timezone.utc)
+        stats = {'completed': 0, 'abandoned': 0, 'batches': 0}
+
+        with DatabaseService.get_connection() as conn:
+            cursor = conn.cursor()
+            # Neighbouring months too: the server may bucket archived_at by a
+            # different time zone, and a run can cross month end
+            cursor.execute("SET LOCAL lock_timeout = %s;", (lock_timeout,))
+            for shift in (-1, 0, 1):
+                cursor.execute(monthly_partition_sql(ARCHIVE_TABLE, month_start(now.date(), shift)))
+            conn.commit()
+
+            for reason, (condition, key) in ARCHIVE_RULES.items():
+                days = overrides[reason] if overrides[reason] is not None else config[key]
+                if not days:
+                    continue
+                sql = ARCHIVE_BATCH_SQL.format(condition=condition)
+                cutoff = now - timedelta(days=days)
+                while True:
+                    try:
+                        cursor.execute("SET LOCAL lock_timeout = %s;", (lock_timeout,))
+                        cursor.execute(sql, (cutoff, batch_size, reason))
+                        moved = cursor.rowcount
+                        conn.commit()
+                    except Exception:
+                        conn.rollback()
+                        raise
+                    stats[reason] += moved
+                    stats['batches'] += 1
+                    if progress:
+                        progress(dict(stats))
+                    if moved < batch_size:
+                        break
+                    time.sleep(pause)
+
+        sizes = ArchiveService.record_sizes()
+        stats.update(summarize_sizes(sizes))
+        stats['seconds'] = round(time.perf_counter() - started, 3)
+        logger.info(
+            f"Archived {stats['completed']} completed and {stats['abandoned']} abandoned applications "
+            f"in {stats['batches']} batches ({stats['seconds']}s)"
+        )
+        return stats
+
+    @staticmethod
+    def record_sizes():
+        """Snapshot the size of every tracked table and index. Returns the rows."""
+        with DatabaseService.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(RECORD_SIZES_SQL, (list(TRACKED_TABLES),))
+            rows = [dict(row) for row in cursor.fetchall()]
+            conn.commit()
+        return rows
+
+    @staticmethod
+    def size_history(days=30):
+        """Recorded snapshots from the last ``days`` days, oldest first.
+
+        Returns ``(success, snapshots)``; each snapshot is its capture time,
+        table and index totals, and one row per relation.
+        """
+        try:
+            with DatabaseService.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    f"SELECT captured_at, relation, table_name, kind, bytes, live_rows, dead_rows "
+                    f"FROM {SIZES_TABLE} WHERE captured_at >= CURRENT_TIMESTAMP - %s * interval '1 day' "
+                    f"ORDER BY captured_at, table_name, kind DESC, relation;",
+                    (days,)
+                )
+                rows = cursor.fetchall()
+
+            snapshots = []
+            for row in rows:
+                if not snapshots or snapshots[-1]['captured_at'] != row['captured_at']:
+                    snapshots.append({'captured_at': row['captured_at'], 'relations': []})
+                snapshots[-1]['relations'].append(dict(row))
+            for snapshot in snapshots:
+                snapshot.update(summarize_sizes(snapshot['relations']))
+            return True, snapshots
+        except Exception as e:
+            logger.error(f"Failed to get table size history: {e}")
+            return False, str(e)
@@ -0,0 +1,190 @@
+# backend/app/services/back_office_service.py
+import base64
+import json
+import logging
+from datetime import datetime
+from ..services.database_service import DatabaseService
+from ..schemas.onboarding_steps import STEP_SCHEMAS, TABLE
+
+logger = logging.getLogger(__name__)
+
+# Listing projection: applicant summary and progress, without the wide
+# document-metadata and free-text columns
+LISTING_COLUMNS = (
+    'id', 'firebase_uid', 'full_name', 'email', 'phone_number', 'nz_residency_status',
+    'employment_type', 'monthly_income', 'loan_amount', 'loan_purpose', 'loan_term',
+    'affordability_outcome', 'duplicate_kinds', 'step_completed', 'is_completed', 'created_at', 'updated_at'
+)
+
+def encode_cursor(row):
+    """Opaque keyset cursor for the position after ``row``."""
+    raw = json.dumps([row['updated_at'].isoformat(), row['id']])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+def decode_cursor(cursor):
+    """Return ``(updated_at, id)`` from a cursor, or raise ValueError."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        updated_at, row_id = json.loads(raw)
+        return datetime.fromisoformat(updated_at), int(row_id)
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+# Column -> section table holding it; other listing columns are on the hot row
+SECTION_OF = {column: schema.table for schema in STEP_SCHEMAS.values() for column in schema.columns}
+
+def _hot_columns(columns):
+    return [column for column in columns if column not in SECTION_OF]
+
+def _join_sections(page_sql, page_columns, order):
+    """Add the section columns of ``LISTING_COLUMNS`` to a page of rows ``p``.
+
+    ``page_sql`` is already ordered and limited, so each section is one
+    primary-key lookup per row on the page.
+    """
+    joins = {}
+    select = []
+    for column in LISTING_COLUMNS:
+        if column in page_columns:
+            select.append(f"p.{column}")
+        else:
+            alias = joins.setdefault(SECTION_OF[column], f"s{len(joins)}")
+            select.append(f"{alias}.{column}")
+    select += [f"p.{column}" for column in page_columns if column not in LISTING_COLUMNS]
+    return (
+        f"SELECT {', '.join(select)} FROM ({page_sql}) p "
+        + ''.join(f"LEFT JOIN {table} {alias} ON {alias}.application_id = p.id "
+                  for table, alias in joins.items())
+        + f"ORDER BY {order};"
+    )
+
+def build_listing_query(filters, cursor=None, limit=50, table=TABLE, sections=True):
+    """Keyset-paginated listing ordered by ``(updated_at, id)`` descending.
+
+    ``filters`` may hold ``is_completed``, ``step_completed``,
+    ``updated_from`` (inclusive) and ``updated_to`` (exclusive). Every
+    filter is on the hot row, and each combination maps onto one of the
+    indexes in migrations/002_onboarding_applications_listing_indexes.sql,
+    so the page is an index range scan of ``limit + 1`` hot rows at any
+    depth; the section columns are then joined onto those rows only.
+    With ``sections=False`` ``table`` holds every listing column itself.
+    """
+    conditions = []
+    params = []
+    if filters.get('is_completed') is not None:
+        conditions.append('is_completed' if filters['is_completed'] else 'NOT is_completed')
+    if filters.get('step_completed') is not None:
+        conditions.append('step_completed = %s')
+        params.append(filters['step_completed'])
+    if filters.get('updated_from') is not None:
+        conditions.append('updated_at >= %s')
+        params.append(filters['updated_from'])
+    if filters.get('updated_to') is not None:
+        conditions.append('updated_at < %s')
+        params.append(filters['updated_to'])
+    if cursor is not None:
+        conditions.append('(updated_at, id) < (%s, %s)')
+        params.extend(cursor)
+
+    where = f"WHERE {' AND '.join(conditions)} " if conditions else ''
+    params.append(limit + 1)
+    if not sections:
+        return (
+            f"SELECT {', '.join(LISTING_COLUMNS)} FROM {table} {where}"
+            f"ORDER BY updated_at DESC, id DESC LIMIT %s;"
+        ), params
+    columns = _hot_columns(LISTING_COLUMNS)
+    page = f"SELECT {', '.join(columns)} FROM {table} {where}ORDER BY updated_at DESC, id DESC LIMIT %s"
+    return _join_sections(page, columns, 'p.updated_at DESC, p.id DESC'), params
+
+# Search field -> column; each has a pg_trgm GIN index (migrations 007/008)
+SEARCH_FIELDS = {'name': 'full_name', 'email': 'email', 'address': 'address'}
+
+# Trigram indexes need three characters to narrow anything down
+MIN_SEARCH_LENGTH = 3
+
+# Matching rows ranked per search; beyond this the results are marked truncated
+SEARCH_CANDIDATES = 1000
+
+def _like_pattern(text):
+    """``text`` as an ILIKE substring pattern, with LIKE wildcards escaped."""
+    return '%' + text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+
+def build_search_query(text, fields=None, limit=20, candidates=SEARCH_CANDIDATES, table=TABLE, sections=True):
+    """Substring search over ``fields``, ranked by trigram word similarity.
+
+    Each ``column ILIKE '%text%'`` is answered from that column's GIN
+    index on the personal section and the results are OR-ed as a bitmap,
+    so no full scan happens. At most ``candidates + 1`` matching rows are
+    read, joined to their hot rows and ranked, which caps the cost of very
+    broad terms; the other section columns are joined onto the returned
+    page only. ``total`` in each row tells the caller whether the cap was
+    hit. With ``sections=False`` ``table`` holds every column itself.
+    """
+    columns = [SEARCH_FIELDS[field] for field in (fields or SEARCH_FIELDS)]
+    pattern = _like_pattern(text)
+    matches = ' OR '.join(f"{column} ILIKE %s" for column in columns)
+    rank = ', '.join(f"word_similarity(%s, c.{column})" for column in columns)
+    params = [text] * len(columns) + [pattern] * len(columns) + [candidates + 1, limit]
+    if not sections:
+        return (
+            f"SELECT c.*, GREATEST({rank}) AS rank, count(*) OVER () AS total FROM ("
+            f"SELECT {', '.join(LISTING_COLUMNS)}, address FROM {table} WHERE {matches} LIMIT %s"
+            f") c ORDER BY rank DESC, updated_at DESC, id DESC LIMIT %s;"
+        ), params
+
+    personal = SECTION_OF[SEARCH_FIELDS['name']]
+    found = [column for column in (*LISTING_COLUMNS, 'address') if SECTION_OF.get(column) == personal]
+    hot = _hot_columns(LISTING_COLUMNS)
+    page = (
+        f"SELECT {', '.join(f'a.{column}' for column in hot)}, "
+        f"{', '.join(f'c.{column}' for column in found)}, "
+        f"GREATEST({rank}) AS rank, count(*) OVER () AS total FROM ("
+        f"SELECT application_id, {', '.join(found)} FROM {personal} WHERE {matches} LIMIT %s"
+        f") c JOIN {table} a ON a.id = c.application_id "
+        f"ORDER BY rank DESC, a.updated_at DESC, a.id DESC LIMIT %s"
+    )
+    order = 'p.rank DESC, p.updated_at DESC, p.id DESC'
+    return _join_sections(page, (*hot, *found, 'rank', 'total'), order), params
+
+class BackOfficeService:
+    """Read-only queries for operations staff."""
+
+    @staticmethod
+    def list_applications(filters, cursor=None, limit=50):
+        """Return one page of applications plus the cursor for the next one."""
+        sql, params = build_listing_query(filters, cursor, limit)
+        try:
+            with DatabaseService.get_connection() as conn:
+                cursor_ = conn.cursor()
+                cursor_.execute(sql, params)
+                rows = cursor_.fetchall()
+
+            has_more = len(rows) > limit
+            rows = rows[:limit]
+            return True, {
+                'applications': [dict(row) for row in rows],
+                'next_cursor': encode_cursor(rows[-1]) if has_more else None,
+                'has_more': has_more
+            }
+        except Exception as e:
+            logger.error(f"Failed to list applications: {e}")
+            return False, str(e)
+
+    @staticmethod
+    def search_applications(text, fields=None, limit=20):
+        """Return the best ``limit`` matches for ``text`` and whether candidates were capped."""
+        sql, params = build_search_query(text, fields, limit)
+        try:
+            with DatabaseService.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(sql, params)
+                rows = cursor.fetchall()
+
+            return True, {
+                'applications': [dict(row) for row in rows],
+                'truncated': bool(rows) and rows[0]['total'] > SEARCH_CANDIDATES
+            }
+        except Exception as e:
+            logger.error(f"Failed to search applications: {e}")
+            return False, str(e)
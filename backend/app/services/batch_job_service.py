@@ -0,0 +1,257 @@
+# backend/app/services/batch_job_service.py
+import abc
+import json
+import logging
+import multiprocessing
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timezone
+import psycopg2
+from psycopg2.extras import execute_values
+from flask import current_app
+from ..services.database_service import DatabaseService
+from ..schemas.onboarding_steps import TABLE
+
+logger = logging.getLogger(__name__)
+
+class BatchJob(abc.ABC):
+    """A table-wide job run over id-range partitions by ``BatchJobService``.
+
+    Workers receive the class (pickled by reference, so define it at
+    module level) and the JSON-serializable ``params`` the run was started
+    with; they have no Flask app. Partitions are id ranges of ``table``,
+    rows are read from ``source`` (default: ``table``). ``select`` and
+    ``update_sql`` may use ``{table}``. ``update_sql`` is an
+    ``execute_values`` statement (one ``VALUES %s``) ending in
+    ``RETURNING`` so changed rows can be counted.
+    """
+    name = None
+    table = TABLE
+    source = None
+    select = 'id'
+    update_sql = None
+    update_template = None
+
+    def __init__(self, params):
+        self.params = params
+
+    @classmethod
+    def load_params(cls, config):
+        """Parameters for a new run, from app config."""
+        return {}
+
+    @abc.abstractmethod
+    def process(self, rows):
+        """Row tuples (ordered like ``select``) -> ``(update values, counts)``."""
+
+# ==========================================================================
+# WORKERS (one process and one connection each)
+# ==========================================================================
+
+CHECKPOINT_SQL = (
+    "INSERT INTO batch_job_partitions (run_id, partition_start, partition_end, rows, updated, seconds) "
+    "VALUES (%s, %s, %s, %s, %s, %s);"
+)
+
+_worker_connection = None
+_worker_dsn = None
+
+def _init_worker(dsn):
+    global _worker_dsn
+    _worker_dsn = dsn
+
+def _connection():
+    global _worker_connection
+    if _worker_connection is None or _worker_connection.closed:
+        _worker_connection = psycopg2.connect(_worker_dsn, application_name='terepay-batch-job')
+    return _worker_connection
+
+def run_partition(job_class, params, run_id, start, end, batch_size):
+    """Stream ids ``[start, end)`` and write results back, in one transaction.
+
+    The partition checkpoint (when ``run_id`` is set) commits with the
+    updates, so a partition is either fully applied and recorded or not
+    at all. The change-notification trigger is muted (migration 003).
+    """
+    job = job_class(params)
+    conn = _connection()
+    started = time.perf_counter()
+    rows = updated = 0
+    counts = Counter()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SET LOCAL terepay.bulk_import = 'on';")
+        reader = conn.cursor(name=f"batch_job_{uuid.uuid4().hex}")
+        reader.itersize = batch_size
+        reader.execute(
+            f"SELECT {job.select.format(table=job.table)} FROM {job.source or job.table} "
+            f"WHERE id >= %s AND id < %s;",
+            (start, end)
+        )
+        update_sql = job.update_sql.format(table=job.table)
+        while True:
+            batch = reader.fetchmany(batch_size)
+            if not batch:
+                break
+            values, batch_counts = job.process(batch)
+            if values:
+                changed = execute_values(
+                    cursor, update_sql, values, template=job.update_template, page_size=batch_size, fetch=True
+                )
+                updated += len(changed)
+            rows += len(batch)
+            counts.update(batch_counts)
+        reader.close()
+
+        seconds = time.perf_counter() - started
+        if run_id:
+            cursor.execute(CHECKPOINT_SQL, (run_id, start, end, rows, updated, round(seconds, 3)))
+        conn.commit()
+    except Exception:
+        if not conn.closed:
+            conn.rollback()
+        raise
+    return {'start': start, 'end': end, 'rows': rows, 'updated': updated,
+            'seconds': seconds, 'counts': dict(counts)}
+
+def plan_partitions(min_id, max_id, partition_size):
+    """``[start, end)`` id ranges covering ``min_id..max_id``."""
+    if min_id is None:
+        return []
+    return [(start, min(start + partition_size, max_id + 1))
+            for start in range(min_id, max_id + 1, partition_size)]
+
+def run_partitions(job_class, params, dsn, partitions, workers, batch_size, run_id=None,
+                   total=None, progress=None):
+    """Run ``partitions`` across a pool of ``workers`` processes.
+
+    Workers are spawned (not forked) so they never share the parent's
+    pooled connections, and each opens its own. A failed partition is
+    logged and left unrecorded for a resume; the others carry on.
+    ``progress`` is called with a report after every partition.
+    """
+    # An incomplete job class fails here rather than in every worker
+    job_class(params)
+    total = total or len(partitions)
+    stats = {'partitions': total, 'done': total - len(partitions), 'failed': 0,
+             'rows': 0, 'updated': 0, 'counts': Counter()}
+    started = time.perf_counter()
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=_init_worker, initargs=(dsn,)) as executor:
+        futures = {
+            executor.submit(run_partition, job_class, params, run_id, start, end, batch_size): (start, end)
+            for start, end in partitions
+        }
+        for future in as_completed(futures):
+            start, end = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                stats['failed'] += 1
+                logger.error(f"Batch job {job_class.name} partition [{start}, {end}) failed: {e}")
+                continue
+            stats['done'] += 1
+            stats['rows'] += result['rows']
+            stats['updated'] += result['updated']
+            stats['counts'].update(result['counts'])
+
+            elapsed = time.perf_counter() - started
+            finished = stats['done'] + stats['failed'] - (total - len(partitions))
+            remaining = total - stats['done'] - stats['failed']
+            report = {
+                'run_id': run_id,
+                'done': stats['done'],
+                'partitions': total,
+                'rows': stats['rows'],
+                'updated': stats['updated'],
+                'rows_per_second': round(stats['rows'] / elapsed) if elapsed else 0,
+                'eta_seconds': round(elapsed / finished * remaining) if finished else None
+            }
+            logger.info(
+                f"Batch job {job_class.name}: {report['done']}/{total} partitions, "
+                f"{report['rows']} rows ({report['rows_per_second']} rows/s)"
+            )
+            if progress:
+                progress(report)
+
+    elapsed = time.perf_counter() - started
+    stats['counts'] = dict(stats['counts'])
+    stats['seconds'] = round(elapsed, 3)
+    stats['rows_per_second'] = round(stats['rows'] / elapsed) if elapsed else 0
+    return stats
+
+# ==========================================================================
+# RUNS (checkpointed in batch_job_runs / batch_job_partitions)
+# ==========================================================================
+
+class BatchJobService:
+    """Partitioned, resumable batch jobs over ``onboarding_applications``.
+
+    The table is split into fixed id ranges (``BATCH_JOB_PARTITION_SIZE``)
+    processed on a process pool. Each partition streams through a
+    server-side cursor and writes back with batched ``execute_values``
+    updates. A run's parameters and id range are stored when it starts,
+    so resuming reuses them even if config has changed since.
+    """
+
+    @staticmethod
+    def run(job_class, workers=None, batch_size=None, resume=None, progress=None):
+        """Start (or with ``resume``, continue) a run. Returns its stats."""
+        config = current_app.config
+        workers = workers or config['BATCH_JOB_WORKERS']
+        batch_size = batch_size or config['BATCH_JOB_BATCH_SIZE']
+
+        with DatabaseService.get_connection() as conn:
+            cursor = conn.cursor()
+            if resume:
+                cursor.execute("SELECT * FROM batch_job_runs WHERE run_id = %s;", (resume,))
+                run = cursor.fetchone()
+                if not run or run['job'] != job_class.name:
+                    raise ValueError(f"No {job_class.name} run {resume}")
+                run_id, params = run['run_id'], run['params']
+                partitions = plan_partitions(run['min_id'], run['max_id'], run['partition_size'])
+                cursor.execute("SELECT partition_start FROM batch_job_partitions WHERE run_id = %s;", (run_id,))
+                done = {row['partition_start'] for row in cursor.fetchall()}
+                pending = [partition for partition in partitions if partition[0] not in done]
+            else:
+                params = job_class.load_params(config)
+                cursor.execute(f"SELECT min(id) AS min_id, max(id) AS max_id FROM {job_class.table};")
+                bounds = cursor.fetchone()
+                partition_size = config['BATCH_JOB_PARTITION_SIZE']
+                partitions = pending = plan_partitions(bounds['min_id'], bounds['max_id'], partition_size)
+                run_id = f"{job_class.name}-{datetime.now(timezone.utc):%Y%m%d%H%M%S}-{uuid.uuid4().hex[:6]}"
+                cursor.execute(
+                    "INSERT INTO batch_job_runs (run_id, job, params, min_id, max_id, partition_size, partitions) "
+                    "VALUES (%s, %s, %s, %s, %s, %s, %s);",
+                    (run_id, job_class.name, json.dumps(params), bounds['min_id'], bounds['max_id'],
+                     partition_size, len(partitions))
+                )
+            conn.commit()
+
+        logger.info(
+            f"Batch job {run_id}: {len(pending)} of {len(partitions)} partitions to run on {workers} workers"
+        )
+        stats = run_partitions(
+            job_class, params, config['DATABASE_URL'], pending, workers, batch_size,
+            run_id=run_id, total=len(partitions), progress=progress
+        )
+        stats['run_id'] = run_id
+        stats['workers'] = workers
+
+        if not stats['failed']:
+            with DatabaseService.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "UPDATE batch_job_runs SET finished_at = CURRENT_TIMESTAMP "
+                    "WHERE run_id = %s AND finished_at IS NULL;",
+                    (run_id,)
+                )
+                conn.commit()
+        logger.info(
+            f"Batch job {run_id}: {stats['rows']} rows in {stats['seconds']}s "
+            f"({stats['updated']} changed, {stats['failed']} partitions failed)"
+        )
+        return stats
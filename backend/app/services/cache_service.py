@@ -3,8 +3,9 @@ import redis
 import json
 import logging
 from flask import current_app
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional
 from functools import wraps
+from ..utils.json_provider import json_default
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +40,16 @@ class CacheService:
     def is_available(self) -> bool:
         return self._redis_client is not None
     
+    @staticmethod
+    def _encode(value: Any) -> str:
+        """Serialize a value for storage in Redis."""
+        return json.dumps(value, default=json_default)
+    
+    @staticmethod
+    def _decode(value: str) -> Any:
+        """Deserialize a value read from Redis."""
+        return json.loads(value)
+    
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache."""
         if not self.is_available:
@@ -47,7 +58,7 @@ class CacheService:
         try:
             value = self._redis_client.get(key)
             if value:
-                return json.loads(value)
+                return self._decode(value)
         except Exception as e:
             logger.error(f"Cache get error for key {key}: {e}")
         return None
@@ -58,7 +69,7 @@ class CacheService:
             return False
         
         try:
-            serialized = json.dumps(value, default=str)
+            serialized = self._encode(value)
             self._redis_client.setex(key, ttl, serialized)
             return True
         except Exception as e:
@@ -77,20 +88,199 @@ class CacheService:
             logger.error(f"Cache delete error for key {key}: {e}")
             return False
     
-    def delete_pattern(self, pattern: str) -> bool:
-        """Delete all keys matching pattern."""
+    def add(self, key: str, value: Any, ttl: int = 300) -> Optional[bool]:
+        """Set value only if the key does not exist yet (SET NX).
+
+        Returns True if it was set, False if the key already exists and
+        None when Redis is unavailable or the command failed.
+        """
+        if not self.is_available:
+            return None
+        
+        try:
+            return bool(self._redis_client.set(key, self._encode(value), ex=ttl, nx=True))
+        except Exception as e:
+            logger.error(f"Cache add error for key {key}: {e}")
+            return None
+    
+    def set_many(self, mapping: Dict[str, Any], ttl: int = 300) -> bool:
+        """Set several values with the same TTL in one round trip."""
+        if not self.is_available or not mapping:
+            return False
+        
+        try:
+            pipe = self._redis_client.pipeline(transaction=False)
+            for key, value in mapping.items():
+                pipe.setex(key, ttl, self._encode(value))
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Cache set error for {len(mapping)} keys: {e}")
+            return False
+    
+    def delete_many(self, keys: List[str]) -> bool:
+        """Delete several keys in one round trip."""
+        if not self.is_available or not keys:
+            return False
+        
+        try:
+            self._redis_client.delete(*keys)
+            return True
+        except Exception as e:
+            logger.error(f"Cache delete error for {len(keys)} keys: {e}")
+            return False
+    
+    def delete_pattern(self, pattern: str, batch_size: int = 1000) -> bool:
+        """Delete all keys matching pattern.
+
+        Walks the keyspace with SCAN (never the blocking KEYS) and UNLINKs
+        matches ``batch_size`` at a time, so Redis frees them off its main
+        thread.
+        """
         if not self.is_available:
             return False
         
         try:
-            keys = self._redis_client.keys(pattern)
-            if keys:
-                self._redis_client.delete(*keys)
+            batch = []
+            for key in self._redis_client.scan_iter(match=pattern, count=batch_size):
+                batch.append(key)
+                if len(batch) >= batch_size:
+                    self._redis_client.unlink(*batch)
+                    batch = []
+            if batch:
+                self._redis_client.unlink(*batch)
             return True
         except Exception as e:
             logger.error(f"Cache delete pattern error for {pattern}: {e}")
             return False
 
+    def hset_many(self, key: str, mapping: Dict[str, Any], ttl: int = 300, overwrite: bool = True) -> bool:
+        """Merge fields into a hash (values serialized individually) and refresh its TTL.
+
+        With ``overwrite=False`` fields already present in the hash are kept.
+        """
+        if not self.is_available:
+            return False
+
+        try:
+            pipe = self._redis_client.pipeline()
+            if overwrite:
+                pipe.hset(key, mapping={field: self._encode(value) for field, value in mapping.items()})
+            else:
+                for field, value in mapping.items():
+                    pipe.hsetnx(key, field, self._encode(value))
+            pipe.expire(key, ttl)
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Cache hset error for key {key}: {e}")
+            return False
+
+    def hgetall(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get all fields of a hash."""
+        if not self.is_available:
+            return None
+
+        try:
+            values = self._redis_client.hgetall(key)
+            return {field: self._decode(value) for field, value in values.items()}
+        except Exception as e:
+            logger.error(f"Cache hgetall error for key {key}: {e}")
+            return None
+
+    def take_hashes(self, keys: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Atomically read and delete several hashes (MULTI/EXEC)."""
+        if not self.is_available or not keys:
+            return []
+
+        try:
+            pipe = self._redis_client.pipeline(transaction=True)
+            for key in keys:
+                pipe.hgetall(key)
+            pipe.delete(*keys)
+            results = pipe.execute()[:-1]
+            return [
+                {field: self._decode(value) for field, value in values.items()} if values else None
+                for values in results
+            ]
+        except Exception as e:
+            logger.error(f"Cache take hashes error: {e}")
+            return []
+
+    def sadd(self, key: str, *members: str) -> int:
+        """Add members to a set. Returns how many were not already present."""
+        if not self.is_available:
+            return 0
+
+        try:
+            return self._redis_client.sadd(key, *members)
+        except Exception as e:
+            logger.error(f"Cache sadd error for key {key}: {e}")
+            return 0
+
+    def spop(self, key: str, count: int = 1) -> List[str]:
+        """Remove and return up to ``count`` random members of a set."""
+        if not self.is_available:
+            return []
+
+        try:
+            return self._redis_client.spop(key, count) or []
+        except Exception as e:
+            logger.error(f"Cache spop error for key {key}: {e}")
+            return []
+
+    def srem(self, key: str, *members: str) -> bool:
+        """Remove members from a set."""
+        if not self.is_available:
+            return False
+
+        try:
+            self._redis_client.srem(key, *members)
+            return True
+        except Exception as e:
+            logger.error(f"Cache srem error for key {key}: {e}")
+            return False
+
+    def scard(self, key: str) -> int:
+        """Number of members in a set."""
+        if not self.is_available:
+            return 0
+
+        try:
+            return self._redis_client.scard(key)
+        except Exception as e:
+            logger.error(f"Cache scard error for key {key}: {e}")
+            return 0
+
+    def publish(self, channel: str, message: Any) -> bool:
+        """Publish a message on a pub/sub channel."""
+        if not self.is_available:
+            return False
+
+        try:
+            self._redis_client.publish(channel, self._encode(message))
+            return True
+        except Exception as e:
+            logger.error(f"Cache publish error for channel {channel}: {e}")
+            return False
+
+    def subscribe(self, *channels: str):
+        """Return a PubSub subscribed to ``channels``, or None without Redis."""
+        if not self.is_available:
+            return None
+
+        try:
+            pubsub = self._redis_client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(*channels)
+            return pubsub
+        except Exception as e:
+            logger.error(f"Cache subscribe error for {channels}: {e}")
+            return None
+
+def build_cache_key(key_prefix: str, func, args, kwargs) -> str:
+    """Build the cache key used by the ``cached`` decorator."""
+    return f"{key_prefix}:{func.__name__}:{hash(str(args) + str(sorted(kwargs.items())))}"
+
 # Cache decorator
 def cached(ttl: int = 300, key_prefix: str = ""):
     """Decorator to cache function results."""
@@ -100,7 +290,7 @@ def cached(ttl: int = 300, key_prefix: str = ""):
             cache = CacheService()
             
             # Create cache key
-            cache_key = f"{key_prefix}:{func.__name__}:{hash(str(args) + str(sorted(kwargs.items())))}"
+            cache_key = build_cache_key(key_prefix, func, args, kwargs)
             
             # Try to get from cache
             cached_result = cache.get(cache_key)
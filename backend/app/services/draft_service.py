@@ -0,0 +1,219 @@
+# backend/app/services/draft_service.py
+import atexit
+import logging
+import threading
+import time
+from flask import current_app
+from psycopg2.extras import execute_values
+from ..services.cache_service import CacheService
+from ..services.database_service import DatabaseService
+from ..services.version_service import VersionService
+from ..schemas.onboarding_steps import STEP_SCHEMAS
+
+logger = logging.getLogger(__name__)
+
+# Redis layout:
+#   onboarding:draft:<step>:<uid>  hash of camelCase field -> JSON value, plus __saved_at
+#   onboarding:drafts:dirty        set of "<step>:<uid>" members waiting to be flushed
+DRAFT_KEY = 'onboarding:draft:{}'
+DIRTY_SET_KEY = 'onboarding:drafts:dirty'
+SAVED_AT_FIELD = '__saved_at'
+
+class DraftService:
+    """Write-behind buffer for onboarding autosave drafts.
+
+    Draft writes land in Redis and are coalesced per (step, firebase_uid):
+    repeated autosaves only overwrite hash fields. A background flusher
+    per worker pops dirty drafts and writes the latest version of each to
+    Postgres with one multi-row upsert per column set. Final step
+    submissions bypass the buffer and stay synchronous.
+    """
+    _flusher = None
+    _stop_event = None
+    _lock = threading.Lock()
+    _stats = {
+        'drafts_buffered': 0,
+        'drafts_coalesced': 0,
+        'flushes': 0,
+        'rows_flushed': 0,
+        'flush_failures': 0,
+        'last_flush_seconds': 0.0,
+        'last_flush_rows': 0,
+        'max_draft_age_seconds': 0.0,
+        'last_flush_at': None
+    }
+
+    @staticmethod
+    def is_enabled():
+        """Draft mode needs the feature flag and a reachable Redis."""
+        return current_app.config.get('DRAFT_AUTOSAVE_ENABLED', False) and CacheService().is_available
+
+    @staticmethod
+    def _member(step, firebase_uid):
+        return f"{step}:{firebase_uid}"
+
+    # ==========================================================================
+    # DRAFT WRITES AND READS
+    # ==========================================================================
+
+    @classmethod
+    def save_draft(cls, step, firebase_uid, fields):
+        """Buffer validated camelCase ``fields`` for a step."""
+        cache = CacheService()
+        member = cls._member(step, firebase_uid)
+
+        mapping = dict(fields)
+        mapping[SAVED_AT_FIELD] = time.time()
+        if not cache.hset_many(DRAFT_KEY.format(member), mapping, current_app.config['DRAFT_TTL']):
+            return False, "Draft buffer unavailable"
+
+        coalesced = cache.sadd(DIRTY_SET_KEY, member) == 0
+        with cls._lock:
+            cls._stats['drafts_buffered'] += 1
+            if coalesced:
+                cls._stats['drafts_coalesced'] += 1
+
+        return True, {'buffered': True, 'coalesced': coalesced}
+
+    @classmethod
+    def get_draft(cls, step, firebase_uid):
+        """Return the unflushed draft fields for a step, or None."""
+        draft = CacheService().hgetall(DRAFT_KEY.format(cls._member(step, firebase_uid)))
+        if not draft:
+            return None
+        draft.pop(SAVED_AT_FIELD, None)
+        return draft
+
+    @classmethod
+    def discard_draft(cls, step, firebase_uid):
+        """Drop a pending draft, e.g. before a final synchronous submission."""
+        cache = CacheService()
+        member = cls._member(step, firebase_uid)
+        cache.delete(DRAFT_KEY.format(member))
+        cache.srem(DIRTY_SET_KEY, member)
+
+    # ==========================================================================
+    # FLUSHING
+    # ==========================================================================
+
+    @classmethod
+    def flush(cls, batch_size=500):
+        """Write up to ``batch_size`` dirty drafts to Postgres. Returns the number taken."""
+        cache = CacheService()
+        members = cache.spop(DIRTY_SET_KEY, batch_size)
+        if not members:
+            return 0
+
+        keys = [DRAFT_KEY.format(member) for member in members]
+        drafts = cache.take_hashes(keys)
+
+        started = time.time()
+        groups = {}
+        taken = []
+        oldest = started
+        for member, draft in zip(members, drafts):
+            if not draft:
+                continue  # Expired or discarded by a final submission
+            step, firebase_uid = member.split(':', 1)
+            schema = STEP_SCHEMAS.get(int(step))
+            if schema is None:
+                continue
+            saved_at = draft.pop(SAVED_AT_FIELD, started)
+            changes = schema.patch_changes(draft)
+            if not changes:
+                continue
+            oldest = min(oldest, saved_at)
+            columns = tuple(column for column, _ in changes)
+            groups.setdefault((schema, columns), []).append(
+                (firebase_uid, *(value for _, value in changes), saved_at)
+            )
+            taken.append((member, draft, saved_at))
+
+        if not groups:
+            return len(members)
+
+        try:
+            with DatabaseService.get_connection() as conn:
+                cursor = conn.cursor()
+                for (schema, columns), rows in groups.items():
+                    sql, template = schema.flush_sql(columns)
+                    execute_values(cursor, sql, rows, template=template, page_size=len(rows))
+                conn.commit()
+        except Exception as e:
+            logger.error(f"Failed to flush {len(taken)} onboarding drafts: {e}")
+            cls._requeue(taken)
+            with cls._lock:
+                cls._stats['flush_failures'] += 1
+            return len(members)
+
+        # Flushed rows have a new updated_at; drop their cached version stamps
+        VersionService.invalidate({member.split(':', 1)[1] for member, _, _ in taken})
+
+        finished = time.time()
+        with cls._lock:
+            cls._stats['flushes'] += 1
+            cls._stats['rows_flushed'] += len(taken)
+            cls._stats['last_flush_rows'] = len(taken)
+            cls._stats['last_flush_seconds'] = round(finished - started, 4)
+            # How long the oldest draft in this batch waited; bounds the loss window
+            cls._stats['max_draft_age_seconds'] = round(finished - oldest, 3)
+            cls._stats['last_flush_at'] = finished
+
+        return len(members)
+
+    @classmethod
+    def _requeue(cls, taken):
+        """Put drafts back after a failed flush without clobbering newer autosaves."""
+        cache = CacheService()
+        ttl = current_app.config['DRAFT_TTL']
+        for member, draft, saved_at in taken:
+            draft[SAVED_AT_FIELD] = saved_at
+            cache.hset_many(DRAFT_KEY.format(member), draft, ttl, overwrite=False)
+            cache.sadd(DIRTY_SET_KEY, member)
+
+    @classmethod
+    def start_flusher(cls, app):
+        """Start this worker's background flusher thread (idempotent)."""
+        with cls._lock:
+            if cls._flusher is not None:
+                return
+            cls._stop_event = threading.Event()
+            cls._flusher = threading.Thread(
+                target=cls._run_flusher, args=(app,), name='draft-flusher', daemon=True
+            )
+            cls._flusher.start()
+        atexit.register(cls.stop_flusher)
+        logger.info("Draft autosave flusher started")
+
+    @classmethod
+    def stop_flusher(cls):
+        """Stop the flusher; drafts still in Redis are picked up by the next worker."""
+        with cls._lock:
+            if cls._flusher is None:
+                return
+            cls._stop_event.set()
+            flusher, cls._flusher = cls._flusher, None
+        flusher.join(timeout=5)
+
+    @classmethod
+    def _run_flusher(cls, app):
+        interval = app.config['DRAFT_FLUSH_INTERVAL']
+        batch_size = app.config['DRAFT_FLUSH_BATCH_SIZE']
+        with app.app_context():
+            while not cls._stop_event.wait(interval):
+                try:
+                    # Keep draining while full batches come back
+                    while cls.flush(batch_size) >= batch_size and not cls._stop_event.is_set():
+                        pass
+                except Exception as e:
+                    logger.error(f"Draft flusher error: {e}")
+
+    @classmethod
+    def stats(cls):
+        """Buffer metrics for this worker plus the shared backlog size."""
+        with cls._lock:
+            data = dict(cls._stats)
+        data['pending'] = CacheService().scard(DIRTY_SET_KEY)
+        data['flush_interval_seconds'] = current_app.config.get('DRAFT_FLUSH_INTERVAL')
+        data['flusher_running'] = cls._flusher is not None
+        return data
@@ -0,0 +1,411 @@
+# backend/app/services/duplicate_service.py
+import hashlib
+import hmac
+import logging
+import math
+import re
+import threading
+import time
+import uuid
+from flask import current_app
+from psycopg2.extensions import cursor as TupleCursor
+from ..services.database_service import DatabaseService
+from ..schemas.onboarding_steps import TABLE, WIDE_VIEW
+from ..utils.copy_feed import CsvFeed
+
+logger = logging.getLogger(__name__)
+
+KEYS_TABLE = 'applicant_identity_keys'
+
+# Keys re-read on each Bloom refresh, for inserts that committed out of id order
+BLOOM_LOOKBACK = 1000
+
+# Identity kind -> Step 1 column
+IDENTITY_COLUMNS = {'email': 'email', 'phone': 'phone_number', 'tax_number': 'tax_number'}
+
+GMAIL_DOMAINS = ('gmail.com', 'googlemail.com')
+
+# ==========================================================================
+# NORMALIZATION AND HASHING
+# ==========================================================================
+
+def normalize_email(value):
+    """Lower-case, drop ``+tags`` (and dots for Gmail, which ignores them)."""
+    local, _, domain = (value or '').strip().lower().rpartition('@')
+    if not local or not domain:
+        return None
+    local = local.split('+', 1)[0]
+    if domain in GMAIL_DOMAINS:
+        local, domain = local.replace('.', ''), GMAIL_DOMAINS[0]
+    return f"{local}@{domain}" if local else None
+
+def normalize_phone(value):
+    """Digits in international form: '021 123 4567' and '+64 21 1234567' -> '64211234567'."""
+    value = (value or '').strip()
+    digits = re.sub(r'\D', '', value)
+    if not value.startswith('+'):
+        if digits.startswith('00'):
+            digits = digits[2:]
+        elif digits.startswith('0'):
+            digits = '64' + digits[1:]
+    return digits if len(digits) >= 6 else None
+
+def normalize_tax_number(value):
+    """IRD number digits without separators or leading zeros."""
+    digits = re.sub(r'\D', '', value or '').lstrip('0')
+    return digits or None
+
+NORMALIZERS = {'email': normalize_email, 'phone': normalize_phone, 'tax_number': normalize_tax_number}
+
+def identity_keys(row, secret):
+    """``[(kind, digest)]`` for the identity columns of ``row`` that are set.
+
+    Digests are HMAC-SHA256 of the normalized value, so the lookup table
+    never holds the identifiers themselves.
+    """
+    keys = []
+    for kind, column in IDENTITY_COLUMNS.items():
+        normalized = NORMALIZERS[kind](row.get(column))
+        if normalized:
+            keys.append((kind, hmac.new(secret, f"{kind}:{normalized}".encode(), hashlib.sha256).digest()))
+    return keys
+
+class BloomFilter:
+    """Fixed-size Bloom filter over key digests.
+
+    Bit positions come straight from the (already uniform) digest by
+    double hashing, so nothing is re-hashed. Past ``capacity`` entries
+    the false-positive rate rises but lookups stay correct.
+    """
+
+    def __init__(self, capacity, error_rate):
+        self.size = max(int(-capacity * math.log(error_rate) / math.log(2) ** 2), 8)
+        self.hashes = max(round(self.size / capacity * math.log(2)), 1)
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, digest):
+        first = int.from_bytes(digest[:8], 'big')
+        step = int.from_bytes(digest[8:16], 'big') | 1
+        return ((first + i * step) % self.size for i in range(self.hashes))
+
+    def add(self, digest):
+        for position in self._positions(digest):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, digest):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(digest))
+
+# ==========================================================================
+# SERVICE
+# ==========================================================================
+
+class DuplicateService:
+    """Detect applicants sharing an email, phone number or IRD number.
+
+    Every Step 1 save records the applicant's hashed identity keys in
+    ``applicant_identity_keys`` (primary key ``(kind, key_hash, uid)``) and
+    looks the same keys up for other accounts: a few index probes, no
+    table scan. Collisions are written to ``duplicate_kinds`` on both
+    applications. ``cluster_all`` rebuilds the keys for the whole table
+    (covering bulk imports) and groups linked applications into
+    ``duplicate_cluster`` with set-based SQL.
+
+    With ``DUPLICATE_BLOOM_ENABLED`` each worker keeps a Bloom filter of
+    all key digests, tailing new keys every ``DUPLICATE_BLOOM_REFRESH``
+    seconds, and skips the lookup when no key can be present. Keys
+    written by other workers since the last refresh can be missed on
+    that path; ``cluster_all`` picks them up.
+    """
+    _bloom = None
+    _bloom_seen_id = 0
+    _bloom_synced_at = 0
+    _bloom_lock = threading.Lock()
+
+    @staticmethod
+    def enabled():
+        """Whether ``DUPLICATE_KEY_SECRET`` is set (detection is off without it)."""
+        return bool(current_app.config.get('DUPLICATE_KEY_SECRET'))
+
+    @staticmethod
+    def _secret():
+        return current_app.config['DUPLICATE_KEY_SECRET'].encode()
+
+    @classmethod
+    def record_in_transaction(cls, cursor, firebase_uid):
+        """Record the applicant's identity keys and flag collisions before the caller commits.
+
+        Runs under a savepoint so a failure is logged without undoing the
+        caller's write. Returns the kinds shared with other accounts, or
+        None on failure. Two accounts saving the same new key at the same
+        moment cannot see each other; ``cluster_all`` links them. Returns
+        None without recording anything when detection is disabled.
+        """
+        if not cls.enabled():
+            return None
+        cursor.execute("SAVEPOINT duplicates;")
+        try:
+            cursor.execute(
+                f"SELECT email, phone_number, tax_number, duplicate_kinds FROM {WIDE_VIEW} WHERE firebase_uid = %s;",
+                (firebase_uid,)
+            )
+            row = cursor.fetchone()
+            keys = identity_keys(row, cls._secret())
+            pairs = ', '.join(['(%s, %s)'] * len(keys))
+            flat = [value for key in keys for value in key]
+
+            if keys:
+                cursor.execute(
+                    f"DELETE FROM {KEYS_TABLE} WHERE firebase_uid = %s AND (kind, key_hash) NOT IN ({pairs});",
+                    (firebase_uid, *flat)
+                )
+                cursor.execute(
+                    f"INSERT INTO {KEYS_TABLE} (kind, key_hash, firebase_uid) "
+                    f"VALUES {', '.join(['(%s, %s, %s)'] * len(keys))} ON CONFLICT DO NOTHING;",
+                    [value for kind, digest in keys for value in (kind, digest, firebase_uid)]
+                )
+            else:
+                cursor.execute(f"DELETE FROM {KEYS_TABLE} WHERE firebase_uid = %s;", (firebase_uid,))
+
+            # Fast negative path: none of the keys has ever been seen (an
+            # already flagged application is always re-checked)
+            bloom = cls._bloom_filter()
+            matches = {}
+            if keys and (bloom is None or row['duplicate_kinds'] or any(digest in bloom for _, digest in keys)):
+                cursor.execute(
+                    f"SELECT kind, firebase_uid FROM {KEYS_TABLE} "
+                    f"WHERE (kind, key_hash) IN ({pairs}) AND firebase_uid <> %s;",
+                    (*flat, firebase_uid)
+                )
+                for match in cursor.fetchall():
+                    matches.setdefault(match['firebase_uid'], set()).add(match['kind'])
+            if bloom is not None:
+                for _, digest in keys:
+                    bloom.add(digest)
+
+            kinds = sorted({kind for found in matches.values() for kind in found})
+            if kinds != (row['duplicate_kinds'] or []):
+                cursor.execute(
+                    f"UPDATE {TABLE} SET duplicate_kinds = %s WHERE firebase_uid = %s;",
+                    (kinds or None, firebase_uid)
+                )
+            for other, found in matches.items():
+                cursor.execute(
+                    f"UPDATE {TABLE} SET duplicate_kinds = ARRAY("
+                    f"SELECT DISTINCT unnest(COALESCE(duplicate_kinds, '{{}}') || %s::text[]) ORDER BY 1) "
+                    f"WHERE firebase_uid = %s AND NOT COALESCE(duplicate_kinds, '{{}}') @> %s::text[];",
+                    (sorted(found), other, sorted(found))
+                )
+            cursor.execute("RELEASE SAVEPOINT duplicates;")
+
+            if kinds:
+                logger.warning(f"Applicant {firebase_uid} shares {', '.join(kinds)} with {len(matches)} other account(s)")
+            return kinds
+        except Exception as e:
+            cursor.execute("ROLLBACK TO SAVEPOINT duplicates;")
+            logger.error(f"Duplicate check failed for {firebase_uid}: {e}")
+            return None
+
+    @classmethod
+    def _bloom_filter(cls):
+        """This worker's Bloom filter, refreshed if due; None when disabled or unavailable."""
+        config = current_app.config
+        if not config['DUPLICATE_BLOOM_ENABLED']:
+            return None
+        if time.monotonic() - cls._bloom_synced_at >= config['DUPLICATE_BLOOM_REFRESH']:
+            # One thread refreshes; the others keep using the current filter
+            if cls._bloom_lock.acquire(blocking=False):
+                try:
+                    cls._refresh_bloom(config)
+                except Exception as e:
+                    logger.error(f"Duplicate Bloom filter refresh failed: {e}")
+                    return None
+                finally:
+                    cls._bloom_lock.release()
+        return cls._bloom
+
+    @classmethod
+    def _refresh_bloom(cls, config):
+        bloom = cls._bloom or BloomFilter(config['DUPLICATE_BLOOM_CAPACITY'], config['DUPLICATE_BLOOM_ERROR_RATE'])
+        seen = cls._bloom_seen_id
+        with DatabaseService.get_connection() as conn:
+            reader = conn.cursor(name=f"duplicate_bloom_{uuid.uuid4().hex}", cursor_factory=TupleCursor)
+            reader.itersize = config['DUPLICATE_BATCH_SIZE']
+            reader.execute(
+                f"SELECT id, key_hash FROM {KEYS_TABLE} WHERE id > %s ORDER BY id;",
+                (max(seen - BLOOM_LOOKBACK, 0) if cls._bloom else 0,)
+            )
+            for key_id, digest in reader:
+                bloom.add(bytes(digest))
+                seen = max(seen, key_id)
+            reader.close()
+            conn.rollback()
+        if cls._bloom is None:
+            logger.info(f"Loaded duplicate Bloom filter ({bloom.size} bits, {bloom.hashes} hashes)")
+        cls._bloom, cls._bloom_seen_id, cls._bloom_synced_at = bloom, seen, time.monotonic()
+
+    @staticmethod
+    def find_matches(firebase_uid):
+        """Accounts sharing identity keys with an application, and its cluster.
+
+        Returns ``(success, result)``; result is None for an unknown user.
+        """
+        try:
+            with DatabaseService.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    f"SELECT id, firebase_uid, duplicate_kinds, duplicate_cluster FROM {TABLE} WHERE firebase_uid = %s;",
+                    (firebase_uid,)
+                )
+                application = cursor.fetchone()
+                if application is None:
+                    return True, None
+
+                cursor.execute(
+                    f"SELECT a.id, a.firebase_uid, a.full_name, a.step_completed, a.is_completed, a.updated_at, "
+                    f"array_agg(DISTINCT other.kind ORDER BY other.kind) AS kinds "
+                    f"FROM {KEYS_TABLE} mine "
+                    f"JOIN {KEYS_TABLE} other ON other.kind = mine.kind AND other.key_hash = mine.key_hash "
+                    f"AND other.firebase_uid <> mine.firebase_uid "
+                    f"JOIN {WIDE_VIEW} a ON a.firebase_uid = other.firebase_uid "
+                    f"WHERE mine.firebase_uid = %s GROUP BY a.id ORDER BY a.id;",
+                    (firebase_uid,)
+                )
+                matches = [dict(row) for row in cursor.fetchall()]
+
+                cluster = []
+                if application['duplicate_cluster'] is not None:
+                    cursor.execute(
+                        f"SELECT id, firebase_uid, duplicate_kinds FROM {TABLE} "
+                        f"WHERE duplicate_cluster = %s ORDER BY id;",
+                        (application['duplicate_cluster'],)
+                    )
+                    cluster = [dict(row) for row in cursor.fetchall()]
+
+            return True, {'application': dict(application), 'matches': matches, 'cluster': cluster}
+        except Exception as e:
+            logger.error(f"Failed to find duplicates for {firebase_uid}: {e}")
+            return False, str(e)
+
+    @classmethod
+    def cluster_all(cls, batch_size=None):
+        """Rebuild every identity key and cluster linked applications.
+
+        Keys are recomputed from the application table (so rows loaded by
+        the bulk importer, or hashed under an old secret, are covered) and
+        swapped in with a set-based diff. Applications sharing any key are
+        joined through a star of edges per key and grouped into connected
+        components by repeated min-label propagation; each component's
+        ``duplicate_cluster`` is its lowest application id. Best run
+        off-peak: a Step 1 save racing the rebuild is re-recorded on its
+        next save.
+        """
+        secret = cls._secret()
+        batch_size = batch_size or current_app.config['DUPLICATE_BATCH_SIZE']
+        started = time.perf_counter()
+        stats = {'applications': 0, 'keys': 0}
+
+        with DatabaseService.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SET LOCAL terepay.bulk_import = 'on';")
+            cursor.execute(
+                "CREATE TEMP TABLE identity_keys_staging (kind TEXT, key_hash BYTEA, firebase_uid TEXT) ON COMMIT DROP;"
+            )
+
+            reader = conn.cursor(name=f"duplicate_keys_{uuid.uuid4().hex}", cursor_factory=TupleCursor)
+            reader.itersize = batch_size
+            reader.execute(f"SELECT firebase_uid, email, phone_number, tax_number FROM {WIDE_VIEW};")
+            while True:
+                batch = reader.fetchmany(batch_size)
+                if not batch:
+                    break
+                keys = [
+                    (kind, '\\x' + digest.hex(), uid)
+                    for uid, email, phone_number, tax_number in batch
+                    for kind, digest in identity_keys(
+                        {'email': email, 'phone_number': phone_number, 'tax_number': tax_number}, secret
+                    )
+                ]
+                cursor.copy_expert("COPY identity_keys_staging FROM STDIN WITH (FORMAT csv)", CsvFeed(keys))
+                stats['applications'] += len(batch)
+                stats['keys'] += len(keys)
+            reader.close()
+
+            cursor.execute(
+                f"DELETE FROM {KEYS_TABLE} k WHERE NOT EXISTS (SELECT 1 FROM identity_keys_staging s "
+                f"WHERE s.kind = k.kind AND s.key_hash = k.key_hash AND s.firebase_uid = k.firebase_uid);"
+            )
+            cursor.execute(
+                f"INSERT INTO {KEYS_TABLE} (kind, key_hash, firebase_uid) "
+                f"SELECT kind, key_hash, firebase_uid FROM identity_keys_staging ON CONFLICT DO NOTHING;"
+            )
+
+            # Applications holding a key some other application also holds
+            cursor.execute(
+                f"CREATE TEMP TABLE duplicate_members ON COMMIT DROP AS "
+                f"SELECT a.id, k.kind, k.key_hash FROM {KEYS_TABLE} k "
+                f"JOIN (SELECT kind, key_hash FROM {KEYS_TABLE} GROUP BY kind, key_hash HAVING count(*) > 1) d "
+                f"ON d.kind = k.kind AND d.key_hash = k.key_hash "
+                f"JOIN {TABLE} a ON a.firebase_uid = k.firebase_uid;"
+            )
+            # Every member links to its key's lowest id, both ways: O(members) edges, not O(members^2)
+            cursor.execute(
+                "CREATE TEMP TABLE duplicate_edges ON COMMIT DROP AS "
+                "SELECT m.id AS source, g.root AS target FROM duplicate_members m "
+                "JOIN (SELECT kind, key_hash, min(id) AS root FROM duplicate_members GROUP BY kind, key_hash) g "
+                "ON g.kind = m.kind AND g.key_hash = m.key_hash WHERE m.id <> g.root;"
+            )
+            cursor.execute("INSERT INTO duplicate_edges SELECT target, source FROM duplicate_edges;")
+            cursor.execute(
+                "CREATE TEMP TABLE duplicate_labels ON COMMIT DROP AS "
+                "SELECT DISTINCT id, id AS cluster FROM duplicate_members;"
+            )
+            cursor.execute("CREATE INDEX ON duplicate_edges (source);")
+            cursor.execute("CREATE UNIQUE INDEX ON duplicate_labels (id);")
+            cursor.execute("ANALYZE duplicate_edges; ANALYZE duplicate_labels;")
+
+            iterations = 0
+            while True:
+                iterations += 1
+                cursor.execute(
+                    "UPDATE duplicate_labels l SET cluster = n.cluster FROM ("
+                    "SELECT e.source AS id, min(t.cluster) AS cluster FROM duplicate_edges e "
+                    "JOIN duplicate_labels t ON t.id = e.target GROUP BY e.source"
+                    ") n WHERE l.id = n.id AND n.cluster < l.cluster;"
+                )
+                if cursor.rowcount == 0:
+                    break
+
+            cursor.execute(
+                f"UPDATE {TABLE} t SET duplicate_cluster = c.cluster, duplicate_kinds = c.kinds FROM ("
+                f"SELECT l.id, l.cluster, array_agg(DISTINCT m.kind ORDER BY m.kind) AS kinds "
+                f"FROM duplicate_labels l JOIN duplicate_members m ON m.id = l.id GROUP BY l.id, l.cluster"
+                f") c WHERE t.id = c.id AND (t.duplicate_cluster IS DISTINCT FROM c.cluster "
+                f"OR t.duplicate_kinds IS DISTINCT FROM c.kinds);"
+            )
+            flagged = cursor.rowcount
+            cursor.execute(
+                f"UPDATE {TABLE} t SET duplicate_cluster = NULL, duplicate_kinds = NULL "
+                f"WHERE (t.duplicate_cluster IS NOT NULL OR t.duplicate_kinds IS NOT NULL) "
+                f"AND NOT EXISTS (SELECT 1 FROM duplicate_labels l WHERE l.id = t.id);"
+            )
+            cleared = cursor.rowcount
+
+            cursor.execute(
+                "SELECT count(*) AS duplicates, count(DISTINCT cluster) AS clusters, "
+                "COALESCE(max(size), 0) AS largest FROM ("
+                "SELECT cluster, count(*) OVER (PARTITION BY cluster) AS size FROM duplicate_labels) s;"
+            )
+            stats.update(cursor.fetchone())
+            conn.commit()
+
+        elapsed = time.perf_counter() - started
+        stats.update({
+            'iterations': iterations,
+            'changed': flagged + cleared,
+            'seconds': round(elapsed, 3)
+        })
+        logger.info(
+            f"Clustered {stats['duplicates']} duplicate applications into {stats['clusters']} clusters "
+            f"({stats['keys']} keys, {iterations} passes) in {elapsed:.2f}s"
+        )
+        return stats
@@ -0,0 +1,127 @@
+# backend/app/services/funnel_service.py
+import logging
+import time
+from ..services.database_service import DatabaseService
+from ..services.archive_service import ARCHIVE_TABLE
+from ..schemas.onboarding_steps import STEP_SCHEMAS, TABLE
+
+logger = logging.getLogger(__name__)
+
+COUNTERS_TABLE = 'onboarding_funnel_counters'
+
+# Counter rows per bucket; must match the triggers in migrations/011
+FUNNEL_SHARDS = 16
+
+STEPS = tuple(sorted(STEP_SCHEMAS))
+
+READ_SQL = (
+    f"SELECT step_completed, is_completed, sum(applications)::bigint AS applications, "
+    f"sum(transitions)::bigint AS transitions, sum(transition_seconds) AS transition_seconds "
+    f"FROM {COUNTERS_TABLE} GROUP BY step_completed, is_completed;"
+)
+
+# Live and archived applications per bucket, for a full recount
+RECOUNT_SQL = (
+    f"INSERT INTO {COUNTERS_TABLE} (shard, step_completed, is_completed, applications) "
+    f"SELECT id % {FUNNEL_SHARDS}, step_completed, is_completed, count(*) FROM ("
+    f"SELECT id, step_completed, is_completed FROM {TABLE} "
+    f"UNION ALL "
+    f"(SELECT DISTINCT ON (application_id) application_id, (application->>'step_completed')::int, "
+    f"(application->>'is_completed')::boolean FROM {ARCHIVE_TABLE} "
+    f"ORDER BY application_id, archived_at DESC)"
+    f") AS applications GROUP BY 1, 2, 3 "
+    f"ON CONFLICT (shard, step_completed, is_completed) DO UPDATE SET applications = EXCLUDED.applications;"
+)
+
+def build_funnel(buckets):
+    """Counter buckets -> funnel: totals, then reach, conversion and time per step.
+
+    ``reached`` counts applications whose ``step_completed`` is at least
+    the step; ``in_progress`` those that completed it and stopped there
+    without finishing. ``conversion`` is from the previous step (from all
+    started applications for Step 1) and ``average_seconds`` is the mean
+    time from reaching the previous step to reaching this one.
+    """
+    at_step = {step: 0 for step in (0, *STEPS)}
+    in_progress = dict(at_step)
+    transitions = dict(at_step)
+    seconds = dict(at_step)
+    completed = 0
+    for bucket in buckets:
+        step = bucket['step_completed']
+        at_step[step] = at_step.get(step, 0) + bucket['applications']
+        if bucket['is_completed']:
+            completed += bucket['applications']
+        else:
+            in_progress[step] = in_progress.get(step, 0) + bucket['applications']
+        transitions[step] = transitions.get(step, 0) + bucket['transitions']
+        seconds[step] = seconds.get(step, 0) + bucket['transition_seconds']
+
+    total = sum(at_step.values())
+    steps = []
+    previous = total
+    for step in STEPS:
+        reached = sum(count for at, count in at_step.items() if at >= step)
+        steps.append({
+            'step': step,
+            'reached': reached,
+            'in_progress': in_progress[step],
+            'conversion': round(reached / previous, 4) if previous else None,
+            'average_seconds': round(seconds[step] / transitions[step], 1) if transitions[step] else None,
+            'timed_transitions': transitions[step]
+        })
+        previous = reached
+    return {
+        'applications': total,
+        'completed': completed,
+        'completion_rate': round(completed / total, 4) if total else None,
+        'steps': steps
+    }
+
+class FunnelService:
+    """Onboarding funnel read from incrementally maintained counters.
+
+    Triggers on ``onboarding_applications`` (migrations/011) move
+    applications between ``(step_completed, is_completed)`` buckets as
+    statements change them and time each step transition, so a read sums
+    a fixed number of counter rows however many applications there are.
+    """
+
+    @staticmethod
+    def get_funnel():
+        """Returns ``(success, funnel)``; see ``build_funnel``."""
+        try:
+            with DatabaseService.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(READ_SQL)
+                buckets = cursor.fetchall()
+            return True, build_funnel(buckets)
+        except Exception as e:
+            logger.error(f"Failed to get onboarding funnel: {e}")
+            return False, str(e)
+
+    @staticmethod
+    def recount():
+        """Recount every bucket from live and archived applications.
+
+        Step timings are kept: they cannot be recovered from current rows.
+        Saves that change a step wait for the counters lock until the
+        recount commits, so run it off-peak. Returns stats.
+        """
+        started = time.perf_counter()
+        with DatabaseService.get_connection() as conn:
+            cursor = conn.cursor()
+            # Block trigger updates so no transition lands between reset and recount
+            cursor.execute(f"LOCK TABLE {COUNTERS_TABLE} IN EXCLUSIVE MODE;")
+            cursor.execute(f"UPDATE {COUNTERS_TABLE} SET applications = 0;")
+            cursor.execute(RECOUNT_SQL)
+            cursor.execute(READ_SQL)
+            funnel = build_funnel(cursor.fetchall())
+            conn.commit()
+        stats = {
+            'applications': funnel['applications'],
+            'completed': funnel['completed'],
+            'seconds': round(time.perf_counter() - started, 3)
+        }
+        logger.info(f"Recounted onboarding funnel: {stats['applications']} applications in {stats['seconds']}s")
+        return stats
@@ -0,0 +1,214 @@
+# backend/app/services/history_service.py
+import atexit
+import logging
+import queue
+import threading
+import time
+from flask import current_app
+from psycopg2.extras import execute_values
+from ..services.database_service import DatabaseService
+from ..utils.json_provider import dumps_compact
+from ..utils.partitions import month_start, monthly_partition_sql
+
+logger = logging.getLogger(__name__)
+
+HISTORY_TABLE = 'onboarding_application_history'
+
+INSERT_SQL = (
+    f"INSERT INTO {HISTORY_TABLE} (firebase_uid, step, source, changed_at, data) VALUES %s;"
+)
+INSERT_TEMPLATE = "(%s, %s, %s, %s, %s::jsonb)"
+
+class HistoryService:
+    """Append-only history of the onboarding data each save submitted.
+
+    A save enqueues its entry after it commits (a tuple put on an
+    in-process queue, so the request path pays microseconds). A background
+    writer per worker drains the queue every ``HISTORY_FLUSH_INTERVAL``
+    and inserts the batch with one ``execute_values`` into
+    ``onboarding_application_history``, partitioned by month. Entries
+    still queued when a worker is killed are lost, so the interval bounds
+    the loss window; when the queue is full the saving request writes its
+    entry itself rather than drop it.
+    """
+    _queue = None
+    _writer = None
+    _stop_event = None
+    _lock = threading.Lock()
+    _partitions = set()
+    _stats = {
+        'entries_queued': 0,
+        'entries_written': 0,
+        'batches': 0,
+        'write_failures': 0,
+        'overflows': 0,
+        'last_batch_size': 0,
+        'last_batch_seconds': 0.0,
+        'max_lag_seconds': 0.0,
+        'last_write_at': None
+    }
+
+    @classmethod
+    def record(cls, firebase_uid, step, source, changed_at, data):
+        """Log what a committed save wrote: ``data`` maps column -> value.
+
+        ``source`` is ``'submit'`` for step saves and ``'patch'`` for
+        partial updates; ``changed_at`` is the row's new ``updated_at``.
+        """
+        if not current_app.config.get('HISTORY_ENABLED', False):
+            return
+        entry = (firebase_uid, step, source, changed_at, data, time.time())
+        if cls._queue is not None:
+            try:
+                cls._queue.put_nowait(entry)
+                with cls._lock:
+                    cls._stats['entries_queued'] += 1
+                return
+            except queue.Full:
+                with cls._lock:
+                    cls._stats['overflows'] += 1
+        # No writer in this process, or it has fallen behind
+        try:
+            cls._write([entry])
+        except Exception as e:
+            logger.error(f"Failed to write onboarding history for {firebase_uid}: {e}")
+
+    @classmethod
+    def _ensure_partitions(cls, cursor, entries):
+        # Neighbouring months too: the server may bucket by a different time zone
+        months = {
+            month_start(entry[3].date(), shift) for entry in entries for shift in (-1, 0, 1)
+        } - cls._partitions
+        for month in sorted(months):
+            cursor.execute(monthly_partition_sql(HISTORY_TABLE, month))
+        return months
+
+    @classmethod
+    def _write(cls, entries):
+        """Insert ``entries`` in one statement (creating month partitions as needed)."""
+        started = time.time()
+        with DatabaseService.get_connection() as conn:
+            cursor = conn.cursor()
+            months = cls._ensure_partitions(cursor, entries)
+            execute_values(
+                cursor, INSERT_SQL,
+                [(uid, step, source, changed_at, dumps_compact(data).decode('utf-8'))
+                 for uid, step, source, changed_at, data, _ in entries],
+                template=INSERT_TEMPLATE, page_size=len(entries)
+            )
+            conn.commit()
+        finished = time.time()
+        with cls._lock:
+            cls._partitions |= months
+            cls._stats['batches'] += 1
+            cls._stats['entries_written'] += len(entries)
+            cls._stats['last_batch_size'] = len(entries)
+            cls._stats['last_batch_seconds'] = round(finished - started, 4)
+            # How long the oldest entry in this batch waited to be written
+            cls._stats['max_lag_seconds'] = round(finished - min(entry[5] for entry in entries), 3)
+            cls._stats['last_write_at'] = finished
+
+    # ==========================================================================
+    # BACKGROUND WRITER
+    # ==========================================================================
+
+    @classmethod
+    def start_writer(cls, app):
+        """Start this worker's background writer thread (idempotent)."""
+        with cls._lock:
+            if cls._writer is not None:
+                return
+            cls._queue = queue.Queue(maxsize=app.config['HISTORY_QUEUE_SIZE'])
+            cls._stop_event = threading.Event()
+            cls._writer = threading.Thread(
+                target=cls._run_writer, args=(app,), name='history-writer', daemon=True
+            )
+            cls._writer.start()
+        atexit.register(cls.stop_writer)
+        logger.info("Onboarding history writer started")
+
+    @classmethod
+    def stop_writer(cls):
+        """Stop the writer after it has written what is queued."""
+        with cls._lock:
+            if cls._writer is None:
+                return
+            cls._stop_event.set()
+            writer = cls._writer
+        writer.join(timeout=5)
+        with cls._lock:
+            cls._writer = cls._queue = None
+
+    @classmethod
+    def _drain(cls, limit):
+        entries = []
+        try:
+            while len(entries) < limit:
+                entries.append(cls._queue.get_nowait())
+        except queue.Empty:
+            pass
+        return entries
+
+    @classmethod
+    def _run_writer(cls, app):
+        interval = app.config['HISTORY_FLUSH_INTERVAL']
+        batch_size = app.config['HISTORY_BATCH_SIZE']
+        retry = []
+        with app.app_context():
+            while True:
+                stopping = cls._stop_event.wait(interval)
+                # Keep writing while full batches come back
+                while True:
+                    batch = retry or cls._drain(batch_size)
+                    if not batch:
+                        break
+                    try:
+                        cls._write(batch)
+                        retry = []
+                    except Exception as e:
+                        logger.error(f"History writer failed to insert {len(batch)} entries: {e}")
+                        with cls._lock:
+                            cls._stats['write_failures'] += 1
+                        retry = batch
+                        break
+                    if len(batch) < batch_size:
+                        break
+                if stopping:
+                    lost = len(retry) + cls._queue.qsize()
+                    if lost:
+                        logger.error(f"History writer stopped with {lost} entries unwritten")
+                    return
+
+    @classmethod
+    def stats(cls):
+        """Writer metrics for this worker."""
+        with cls._lock:
+            data = dict(cls._stats)
+        data['queued'] = cls._queue.qsize() if cls._queue is not None else 0
+        data['flush_interval_seconds'] = current_app.config.get('HISTORY_FLUSH_INTERVAL')
+        data['writer_running'] = cls._writer is not None
+        return data
+
+    # ==========================================================================
+    # READS
+    # ==========================================================================
+
+    @staticmethod
+    def get_history(firebase_uid, step=None, limit=100):
+        """A user's history entries, newest first. Returns ``(success, entries)``."""
+        try:
+            with DatabaseService.get_connection() as conn:
+                cursor = conn.cursor()
+                conditions, params = ['firebase_uid = %s'], [firebase_uid]
+                if step is not None:
+                    conditions.append('step = %s')
+                    params.append(step)
+                cursor.execute(
+                    f"SELECT id, step, source, changed_at, recorded_at, data FROM {HISTORY_TABLE} "
+                    f"WHERE {' AND '.join(conditions)} ORDER BY changed_at DESC, id DESC LIMIT %s;",
+                    (*params, limit)
+                )
+                return True, [dict(row) for row in cursor.fetchall()]
+        except Exception as e:
+            logger.error(f"Failed to get onboarding history for {firebase_uid}: {e}")
+            return False, str(e)
@@ -0,0 +1,173 @@
+# backend/app/services/import_service.py
+import csv
+import json
+import logging
+import time
+from ..services.cache_service import CacheService
+from ..services.database_service import DatabaseService
+from ..services.export_service import EXPORT_COLUMNS, peak_rss_mb
+from ..services.version_service import VERSION_KEY
+from ..utils.copy_feed import CsvFeed
+from ..schemas.onboarding_steps import STEP_SCHEMAS, TABLE, WIDE_VIEW
+
+logger = logging.getLogger(__name__)
+
+# Columns an import may write; ids are assigned by the database
+IMPORT_COLUMNS = tuple(column for column in EXPORT_COLUMNS if column != 'id')
+
+# Status columns are merged rather than overwritten, and never inserted as NULL
+STATUS_DEFAULTS = {
+    'step_completed': '0',
+    'is_completed': 'false',
+    'created_at': 'CURRENT_TIMESTAMP',
+    'updated_at': 'CURRENT_TIMESTAMP'
+}
+STATUS_UPDATES = {
+    'step_completed': f"GREATEST({TABLE}.step_completed, EXCLUDED.step_completed)",
+    'is_completed': f"{TABLE}.is_completed OR EXCLUDED.is_completed",
+    'created_at': f"{TABLE}.created_at"
+}
+
+# Step field column -> the section table holding it (migrations/008)
+SECTION_TABLES = {column: schema.table for schema in STEP_SCHEMAS.values() for column in schema.columns}
+
+def check_columns(columns):
+    """Validate an import's column list; raise ValueError with a message."""
+    unknown = [column for column in columns if column not in IMPORT_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown import columns: {', '.join(unknown)}")
+    if 'firebase_uid' not in columns:
+        raise ValueError("Imports must include firebase_uid")
+    if len(set(columns)) != len(columns):
+        raise ValueError("Duplicate import columns")
+
+def build_merge_sql(columns):
+    """Set-based upsert of the staged rows (last row wins per firebase_uid).
+
+    The hot row is merged first; each section with imported columns is
+    then upserted from the merged ids, all in one statement.
+    """
+    select = [
+        f"COALESCE({column}, {STATUS_DEFAULTS[column]}) AS {column}" if column in STATUS_DEFAULTS else column
+        for column in columns
+    ]
+    hot = [column for column in columns if column not in SECTION_TABLES]
+    updates = [
+        f"{column} = {STATUS_UPDATES.get(column, 'EXCLUDED.' + column)}"
+        for column in hot if column != 'firebase_uid'
+    ]
+    if 'updated_at' not in columns:
+        updates.append('updated_at = CURRENT_TIMESTAMP')
+    ctes = [
+        f"staged AS (SELECT DISTINCT ON (firebase_uid) {', '.join(select)} FROM import_staging "
+        f"ORDER BY firebase_uid, import_seq DESC)",
+        f"merged AS (INSERT INTO {TABLE} ({', '.join(hot)}) SELECT {', '.join(hot)} FROM staged "
+        f"ON CONFLICT (firebase_uid) DO UPDATE SET {', '.join(updates)} "
+        f"RETURNING id, firebase_uid, (xmax = 0) AS inserted)"
+    ]
+    for schema in STEP_SCHEMAS.values():
+        section = [column for column in columns if SECTION_TABLES.get(column) == schema.table]
+        if not section:
+            continue
+        ctes.append(
+            f"s{schema.step} AS (INSERT INTO {schema.table} (application_id, {', '.join(section)}) "
+            f"SELECT merged.id, {', '.join(f'staged.{column}' for column in section)} "
+            f"FROM merged JOIN staged ON staged.firebase_uid = merged.firebase_uid "
+            f"ON CONFLICT (application_id) DO UPDATE SET "
+            f"{', '.join(f'{column} = EXCLUDED.{column}' for column in section)})"
+        )
+    return (
+        f"WITH {', '.join(ctes)} "
+        f"SELECT count(*) FILTER (WHERE inserted) AS inserted, count(*) AS merged FROM merged;"
+    )
+
+def ndjson_rows(lines):
+    """NDJSON lines -> ``(columns, rows)``; columns come from the first record."""
+    lines = (line for line in lines if line.strip())
+    first = next(lines, None)
+    if first is None:
+        return (), iter(())
+    first = json.loads(first)
+    columns = tuple(first)
+
+    def rows():
+        yield tuple(first[column] for column in columns)
+        for number, line in enumerate(lines, start=2):
+            record = json.loads(line)
+            extra = record.keys() - first.keys()
+            if extra:
+                raise ValueError(f"Line {number}: unexpected columns {', '.join(sorted(extra))}")
+            yield tuple(record.get(column) for column in columns)
+
+    return columns, rows()
+
+class ImportService:
+    """Bulk ingest through ``COPY FROM STDIN`` and one set-based merge.
+
+    Rows are copied into a temporary staging table, then merged with one
+    statement of ``INSERT ... SELECT ... ON CONFLICT`` upserts (hot row,
+    then sections), all in one transaction. The change-notification
+    trigger is muted for the import (see migrations/003) and every cached
+    version stamp is dropped once it commits, instead of one notification
+    per row.
+    """
+
+    @staticmethod
+    def import_csv(fileobj):
+        """Import a CSV body (header row of column names) from a binary file."""
+        header = fileobj.readline().decode().strip()
+        columns = tuple(next(csv.reader([header]), ()))
+        check_columns(columns)
+        return ImportService._copy_and_merge(columns, fileobj)
+
+    @staticmethod
+    def import_ndjson(lines):
+        """Import NDJSON records (one object per line)."""
+        columns, rows = ndjson_rows(lines)
+        check_columns(columns)
+        return ImportService.import_rows(columns, rows)
+
+    @staticmethod
+    def import_rows(columns, rows):
+        """Import row tuples (ordered as ``columns``), e.g. from the synthetic generator."""
+        check_columns(columns)
+        return ImportService._copy_and_merge(columns, CsvFeed(rows))
+
+    @staticmethod
+    def _copy_and_merge(columns, feed):
+        started = time.perf_counter()
+        with DatabaseService.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SET LOCAL terepay.bulk_import = 'on';")
+            cursor.execute(
+                f"CREATE TEMP TABLE import_staging ON COMMIT DROP AS "
+                f"SELECT {', '.join(columns)} FROM {WIDE_VIEW} WITH NO DATA;"
+            )
+            cursor.execute("ALTER TABLE import_staging ADD COLUMN import_seq BIGSERIAL;")
+
+            cursor.copy_expert(f"COPY import_staging ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", feed)
+            staged = cursor.rowcount
+            copied = time.perf_counter()
+
+            cursor.execute(build_merge_sql(columns))
+            result = cursor.fetchone()
+            conn.commit()
+        elapsed = time.perf_counter() - started
+
+        # The trigger was muted, so drop every stamp rather than one per row
+        CacheService().delete_pattern(VERSION_KEY.format('*'))
+
+        stats = {
+            'staged': staged,
+            'inserted': result['inserted'],
+            'updated': result['merged'] - result['inserted'],
+            'copy_seconds': round(copied - started, 3),
+            'merge_seconds': round(elapsed - (copied - started), 3),
+            'rows_per_second': round(staged / elapsed) if elapsed else 0,
+            'peak_rss_mb': round(peak_rss_mb(), 1)
+        }
+        logger.info(
+            f"Imported {stats['staged']} rows ({stats['inserted']} inserted, {stats['updated']} updated) "
+            f"in {elapsed:.2f}s: {stats['rows_per_second']} rows/s"
+        )
+        return stats
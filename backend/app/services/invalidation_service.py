@@ -0,0 +1,201 @@
+# backend/app/services/invalidation_service.py
+import atexit
+import logging
+import select
+import threading
+import psycopg2
+from ..services.cache_service import CacheService
+from ..services.database_service import DatabaseService
+from ..services.status_stream_service import StatusStreamService
+from ..services.version_service import VERSION_KEY, VersionService
+from ..schemas.onboarding_steps import TABLE
+
+logger = logging.getLogger(__name__)
+
+# Channel written by the trigger in migrations/001_onboarding_applications_notify.sql
+CHANGE_CHANNEL = 'onboarding_applications_changed'
+
+STATUS_SQL = (
+    f"SELECT firebase_uid, step_completed, is_completed, created_at, updated_at "
+    f"FROM {TABLE} WHERE firebase_uid = ANY(%s);"
+)
+
+class InvalidationService:
+    """Per-worker LISTEN/NOTIFY consumer that invalidates cached application data.
+
+    Every write to ``onboarding_applications`` (from this app, the back
+    office, scripts or plain SQL) NOTIFYs the row's firebase_uid. The
+    listener re-reads the notified rows' status in one query, overwrites
+    those users' cached version stamps with it (so a save's own
+    notification leaves its freshly published stamp in place) and
+    refreshes any status streams open in this worker.
+
+    The listener holds its own connection outside the pool. When it is
+    lost it reconnects with backoff and resyncs: every row whose
+    ``updated_at`` moved since the last confirmed point (minus a margin
+    for long transactions) is invalidated as if it had been notified; a
+    backlog larger than ``INVALIDATION_RESYNC_LIMIT`` drops all stamps.
+    """
+    _listener = None
+    _stop_event = None
+    _lock = threading.Lock()
+    _stats = {
+        'notifications': 0,
+        'invalidations': 0,
+        'reconnects': 0,
+        'resynced_rows': 0,
+        'full_resyncs': 0,
+        'connected': False,
+        'synced_until': None
+    }
+
+    @classmethod
+    def invalidate(cls, firebase_uids):
+        """Bring cached data up to date for users whose application changed.
+
+        Stamps are set from the rows' current ``updated_at``; users with
+        no row any more (or every user, if the read fails) lose theirs.
+        """
+        firebase_uids = set(firebase_uids)
+        try:
+            with DatabaseService.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(STATUS_SQL, (list(firebase_uids),))
+                statuses = {}
+                for row in cursor.fetchall():
+                    status = dict(row)
+                    statuses[status.pop('firebase_uid')] = status
+        except Exception as e:
+            logger.error(f"Failed to re-read {len(firebase_uids)} changed applications: {e}")
+            VersionService.invalidate(firebase_uids)
+            return
+
+        if statuses:
+            VersionService.refresh({uid: status['updated_at'] for uid, status in statuses.items()})
+        if firebase_uids - statuses.keys():
+            VersionService.invalidate(firebase_uids - statuses.keys())
+        for firebase_uid in firebase_uids:
+            if StatusStreamService.has_subscribers(firebase_uid):
+                # Same shape as OnboardingService.get_user_onboarding_status
+                status = statuses.get(firebase_uid, {'step_completed': 0, 'is_completed': False})
+                StatusStreamService.notify_local(firebase_uid, status)
+        with cls._lock:
+            cls._stats['invalidations'] += len(firebase_uids)
+
+    # ==========================================================================
+    # LISTENER
+    # ==========================================================================
+
+    @classmethod
+    def start_listener(cls, app):
+        """Start this worker's listener thread (idempotent)."""
+        with cls._lock:
+            if cls._listener is not None:
+                return
+            cls._stop_event = threading.Event()
+            cls._listener = threading.Thread(
+                target=cls._run, args=(app,), name='invalidation-listener', daemon=True
+            )
+            cls._listener.start()
+        atexit.register(cls.stop_listener)
+        logger.info("Invalidation listener started")
+
+    @classmethod
+    def stop_listener(cls):
+        with cls._lock:
+            if cls._listener is None:
+                return
+            cls._stop_event.set()
+            listener, cls._listener = cls._listener, None
+        listener.join(timeout=5)
+
+    @classmethod
+    def _run(cls, app):
+        backoff = 1
+        synced_until = None
+        with app.app_context():
+            while not cls._stop_event.is_set():
+                conn = None
+                try:
+                    conn = psycopg2.connect(app.config['DATABASE_URL'])
+                    conn.autocommit = True
+                    cursor = conn.cursor()
+                    # Listen before resyncing so no change falls between the two
+                    cursor.execute(f"LISTEN {CHANGE_CHANNEL};")
+                    if synced_until is not None:
+                        cls._resync(cursor, synced_until, app.config)
+                    synced_until = cls._checkpoint(cursor, conn)
+                    backoff = 1
+                    with cls._lock:
+                        cls._stats['connected'] = True
+
+                    while not cls._stop_event.is_set():
+                        if select.select([conn], [], [], app.config['INVALIDATION_POLL_INTERVAL']) == ([], [], []):
+                            # Idle: confirm the connection and advance the resync point
+                            synced_until = cls._checkpoint(cursor, conn)
+                            continue
+                        conn.poll()
+                        cls._drain(conn)
+
+                except Exception as e:
+                    with cls._lock:
+                        cls._stats['connected'] = False
+                        cls._stats['reconnects'] += 1
+                    logger.error(f"Invalidation listener lost its connection: {e}; retrying in {backoff}s")
+                    cls._stop_event.wait(backoff)
+                    backoff = min(backoff * 2, 30)
+                finally:
+                    if conn is not None and not conn.closed:
+                        conn.close()
+
+    @classmethod
+    def _drain(cls, conn):
+        if not conn.notifies:
+            return
+        firebase_uids = {notify.payload for notify in conn.notifies}
+        with cls._lock:
+            cls._stats['notifications'] += len(conn.notifies)
+        conn.notifies.clear()
+        cls.invalidate(firebase_uids)
+
+    @classmethod
+    def _checkpoint(cls, cursor, conn):
+        """DB time up to which every notification has been handled."""
+        cursor.execute("SELECT now();")
+        synced_until = cursor.fetchone()[0]
+        # Notifications committed before this statement arrive with its result
+        cls._drain(conn)
+        with cls._lock:
+            cls._stats['synced_until'] = synced_until.isoformat()
+        return synced_until
+
+    @classmethod
+    def _resync(cls, cursor, synced_until, config):
+        """Invalidate rows changed while the listener was disconnected."""
+        limit = config['INVALIDATION_RESYNC_LIMIT']
+        cursor.execute(
+            "SELECT firebase_uid FROM onboarding_applications "
+            "WHERE updated_at >= %s - make_interval(secs => %s) LIMIT %s;",
+            (synced_until, config['INVALIDATION_RESYNC_MARGIN'], limit + 1)
+        )
+        firebase_uids = {row[0] for row in cursor.fetchall()}
+
+        if len(firebase_uids) > limit:
+            logger.warning("Invalidation backlog too large; dropping all cached version stamps")
+            CacheService().delete_pattern(VERSION_KEY.format('*'))
+            with cls._lock:
+                cls._stats['full_resyncs'] += 1
+            return
+
+        if firebase_uids:
+            cls.invalidate(firebase_uids)
+        with cls._lock:
+            cls._stats['resynced_rows'] += len(firebase_uids)
+        logger.info(f"Invalidation listener resynced {len(firebase_uids)} changed applications")
+
+    @classmethod
+    def stats(cls):
+        with cls._lock:
+            data = dict(cls._stats)
+        data['listener_running'] = cls._listener is not None
+        return data
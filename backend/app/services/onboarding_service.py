@@ -1,7 +1,13 @@
 # backend/app/services/onboarding_service.py
 import logging
-from datetime import datetime
 from ..services.database_service import DatabaseService
+from ..services.version_service import VersionService
+from ..services.status_stream_service import StatusStreamService
+from ..services.affordability_service import AffordabilityService
+from ..services.duplicate_service import IDENTITY_COLUMNS, DuplicateService
+from ..services.archive_service import ArchiveService
+from ..services.history_service import HistoryService
+from ..schemas.onboarding_steps import STEP_SCHEMAS, TABLE, WIDE_VIEW, batch_upsert, format_date
 
 logger = logging.getLogger(__name__)
 
@@ -11,161 +17,82 @@ class OnboardingService:
     @staticmethod
     def _format_date_for_frontend(date_obj):
         """Convert date object to frontend format."""
-        if not date_obj:
-            return None
-        return date_obj.strftime('%Y-%m-%d') if hasattr(date_obj, 'strftime') else str(date_obj)
+        return format_date(date_obj)
     
     # ==========================================================================
-    # STEP 1: PERSONAL INFORMATION
+    # STEP DATA (SQL GENERATED FROM app/schemas/onboarding_steps.py)
     # ==========================================================================
     
     @staticmethod
-    def save_step1_data(firebase_uid, step1_data):
-        """Save or update Step 1 onboarding data."""
+    def save_step_data(step, firebase_uid, step_data):
+        """Save or update onboarding data for a step."""
+        schema = STEP_SCHEMAS[step]
         try:
             with DatabaseService.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                # Prepare the data
-                full_name = step1_data.get('fullName')
-                dob = step1_data.get('dob') if step1_data.get('dob') else None
-                address = step1_data.get('address')
-                email = step1_data.get('email')
-                phone_number = step1_data.get('phoneNumber')
-                nz_residency_status = step1_data.get('nzResidencyStatus')
-                tax_number = step1_data.get('taxNumber')
-                
                 # Use UPSERT (INSERT ... ON CONFLICT) to handle both insert and update
-                cursor.execute("""
-                    INSERT INTO onboarding_applications (
-                        firebase_uid, full_name, date_of_birth, address, email, 
-                        phone_number, nz_residency_status, tax_number, step_completed
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (firebase_uid) 
-                    DO UPDATE SET
-                        full_name = EXCLUDED.full_name,
-                        date_of_birth = EXCLUDED.date_of_birth,
-                        address = EXCLUDED.address,
-                        email = EXCLUDED.email,
-                        phone_number = EXCLUDED.phone_number,
-                        nz_residency_status = EXCLUDED.nz_residency_status,
-                        tax_number = EXCLUDED.tax_number,
-                        step_completed = GREATEST(onboarding_applications.step_completed, 1),
-                        updated_at = CURRENT_TIMESTAMP
-                    RETURNING id, firebase_uid, full_name, email, step_completed, created_at, updated_at;
-                """, (
-                    firebase_uid, full_name, dob, address, email, 
-                    phone_number, nz_residency_status, tax_number, 1
-                ))
+                cursor.execute(schema.upsert_sql, schema.upsert_params(firebase_uid, step_data))
                 
                 result = cursor.fetchone()
+                if step == 1:
+                    DuplicateService.record_in_transaction(cursor, firebase_uid)
+                if step == 5:
+                    AffordabilityService.assess_in_transaction(cursor, firebase_uid)
                 conn.commit()
                 
+                VersionService.publish(firebase_uid, result['updated_at'])
+                StatusStreamService.publish(firebase_uid, result)
+                HistoryService.record(
+                    firebase_uid, step, 'submit', result['updated_at'],
+                    {column: result[column] for column in schema.columns}
+                )
                 return True, dict(result)
                 
         except Exception as e:
-            logger.error(f"Failed to save Step 1 data: {e}")
-            return False, str(e)
-    
-    @staticmethod
-    def get_step1_data(firebase_uid):
-        """Get Step 1 onboarding data for a user."""
-        try:
-            with DatabaseService.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                cursor.execute("""
-                    SELECT 
-                        id, firebase_uid, full_name, date_of_birth, address, email,
-                        phone_number, nz_residency_status, tax_number, step_completed,
-                        is_completed, created_at, updated_at
-                    FROM onboarding_applications 
-                    WHERE firebase_uid = %s;
-                """, (firebase_uid,))
-                
-                result = cursor.fetchone()
-                
-                if result:
-                    data = dict(result)
-                    # Convert date to string format for frontend
-                    if data['date_of_birth']:
-                        data['date_of_birth'] = OnboardingService._format_date_for_frontend(data['date_of_birth'])
-                    
-                    return True, data
-                else:
-                    return True, None
-                    
-        except Exception as e:
-            logger.error(f"Failed to get Step 1 data: {e}")
+            logger.error(f"Failed to save Step {step} data: {e}")
             return False, str(e)
     
-    # ==========================================================================
-    # STEP 2: EMPLOYMENT & INCOME
-    # ==========================================================================
-    
     @staticmethod
-    def save_step2_data(firebase_uid, step2_data):
-        """Save or update Step 2 onboarding data."""
+    def save_steps_data(firebase_uid, payloads):
+        """Save several steps at once: one UPSERT, one row lock, one commit.
+
+        ``payloads`` maps step number -> validated step data.
+        """
+        sql, params = batch_upsert(firebase_uid, payloads)
         try:
             with DatabaseService.get_connection() as conn:
                 cursor = conn.cursor()
-                
-                # Prepare the data
-                employment_type = step2_data.get('employmentType')
-                employer = step2_data.get('employer')
-                job_title = step2_data.get('jobTitle')
-                employment_duration = step2_data.get('employmentDuration')
-                monthly_income = step2_data.get('monthlyIncome')
-                other_income = step2_data.get('otherIncome', 0)
-                
-                # Use UPSERT to handle both insert and update
-                cursor.execute("""
-                    INSERT INTO onboarding_applications (
-                        firebase_uid, employment_type, employer, job_title, 
-                        employment_duration, monthly_income, other_income, step_completed
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (firebase_uid) 
-                    DO UPDATE SET
-                        employment_type = EXCLUDED.employment_type,
-                        employer = EXCLUDED.employer,
-                        job_title = EXCLUDED.job_title,
-                        employment_duration = EXCLUDED.employment_duration,
-                        monthly_income = EXCLUDED.monthly_income,
-                        other_income = EXCLUDED.other_income,
-                        step_completed = GREATEST(onboarding_applications.step_completed, 2),
-                        updated_at = CURRENT_TIMESTAMP
-                    RETURNING id, firebase_uid, employment_type, employer, job_title,
-                            employment_duration, monthly_income, other_income,
-                            step_completed, is_completed, created_at, updated_at;
-                """, (
-                    firebase_uid, employment_type, employer, job_title,
-                    employment_duration, monthly_income, other_income, 2
-                ))
+                cursor.execute(sql, params)
                 
                 result = cursor.fetchone()
+                if 1 in payloads:
+                    DuplicateService.record_in_transaction(cursor, firebase_uid)
+                if 5 in payloads:
+                    AffordabilityService.assess_in_transaction(cursor, firebase_uid)
                 conn.commit()
                 
+                VersionService.publish(firebase_uid, result['updated_at'])
+                StatusStreamService.publish(firebase_uid, result)
+                for step in payloads:
+                    HistoryService.record(
+                        firebase_uid, step, 'submit', result['updated_at'],
+                        {column: result[column] for column in STEP_SCHEMAS[step].columns}
+                    )
                 return True, dict(result)
                 
         except Exception as e:
-            logger.error(f"Failed to save Step 2 data: {e}")
+            logger.error(f"Failed to save steps {sorted(payloads)}: {e}")
             return False, str(e)
     
     @staticmethod
-    def get_step2_data(firebase_uid):
-        """Get Step 2 onboarding data for a user."""
+    def get_step_data(step, firebase_uid):
+        """Get onboarding data for a step."""
+        schema = STEP_SCHEMAS[step]
         try:
             with DatabaseService.get_connection() as conn:
                 cursor = conn.cursor()
-                
-                cursor.execute("""
-                    SELECT 
-                        id, firebase_uid, employment_type, employer, job_title,
-                        employment_duration, monthly_income, other_income, 
-                        step_completed, is_completed, created_at, updated_at
-                    FROM onboarding_applications 
-                    WHERE firebase_uid = %s;
-                """, (firebase_uid,))
+                cursor.execute(schema.select_sql, (firebase_uid,))
                 
                 result = cursor.fetchone()
                 
@@ -175,340 +102,124 @@ class OnboardingService:
                     return True, None
                     
         except Exception as e:
-            logger.error(f"Failed to get Step 2 data: {e}")
+            logger.error(f"Failed to get Step {step} data: {e}")
             return False, str(e)
     
-    # ==========================================================================
-    # STEP 3: EXPENSES & OBLIGATIONS
-    # ==========================================================================
-    
     @staticmethod
-    def save_step3_data(firebase_uid, step3_data):
-        """Save or update Step 3 onboarding data."""
+    def patch_step_data(step, firebase_uid, changes):
+        """Apply a partial update to a step, writing only the columns that changed.
+
+        ``changes`` is the list produced by ``StepSchema.patch_changes``.
+        Returns the row's status plus whether anything was written.
+        """
+        schema = STEP_SCHEMAS[step]
+        columns = tuple(column for column, _ in changes)
+        values = [value for _, value in changes]
+        update_sql, insert_sql = schema.patch_sql(columns)
         try:
             with DatabaseService.get_connection() as conn:
                 cursor = conn.cursor()
-                
-                # Prepare the data
-                rent = step3_data.get('rent')
-                monthly_expenses = step3_data.get('monthlyExpenses')
-                debts = step3_data.get('debts')
-                dependents = step3_data.get('dependents')
-                
-                # Validate that at least one field is provided
-                if all(v is None for v in [rent, monthly_expenses, debts, dependents]):
-                    return False, "At least one Step 3 field must be provided"
-                
-                # Use UPSERT to handle both insert and update
-                cursor.execute("""
-                    INSERT INTO onboarding_applications (
-                        firebase_uid, rent, monthly_expenses, debts, dependents, step_completed
-                    ) VALUES (%s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (firebase_uid) 
-                    DO UPDATE SET
-                        rent = EXCLUDED.rent,
-                        monthly_expenses = EXCLUDED.monthly_expenses,
-                        debts = EXCLUDED.debts,
-                        dependents = EXCLUDED.dependents,
-                        step_completed = GREATEST(onboarding_applications.step_completed, 3),
-                        updated_at = CURRENT_TIMESTAMP
-                    RETURNING id, firebase_uid, rent, monthly_expenses, debts, dependents,
-                            step_completed, created_at, updated_at;
-                """, (
-                    firebase_uid, rent, monthly_expenses, debts, dependents, 3
-                ))
-                
+
+                cursor.execute(update_sql, (firebase_uid, *values))
                 result = cursor.fetchone()
+
+                if result is None:
+                    # Either nothing changed or the user has no application yet
+                    cursor.execute(schema.status_sql, (firebase_uid,))
+                    existing = cursor.fetchone()
+
+                    if existing is None:
+                        cursor.execute(insert_sql, (firebase_uid, *values))
+                        result = cursor.fetchone()
+
+                        if result is None:
+                            # A concurrent first PATCH created the application: apply ours on top
+                            cursor.execute(update_sql, (firebase_uid, *values))
+                            result = cursor.fetchone()
+                            if result is None:
+                                cursor.execute(schema.status_sql, (firebase_uid,))
+                                existing = cursor.fetchone()
+
+                    if result is None:
+                        conn.rollback()
+                        data = dict(existing)
+                        data['changed'] = False
+                        return True, data
+
+                if step == 1 and set(columns) & set(IDENTITY_COLUMNS.values()):
+                    DuplicateService.record_in_transaction(cursor, firebase_uid)
                 conn.commit()
-                
-                return True, dict(result)
-                
+
+                VersionService.publish(firebase_uid, result['updated_at'])
+                StatusStreamService.publish(firebase_uid, result)
+                HistoryService.record(firebase_uid, step, 'patch', result['updated_at'], dict(changes))
+                data = dict(result)
+                data['changed'] = True
+                return True, data
+
         except Exception as e:
-            logger.error(f"Failed to save Step 3 data: {e}")
+            logger.error(f"Failed to patch Step {step} data: {e}")
             return False, str(e)
+
+    @staticmethod
+    def save_step1_data(firebase_uid, step1_data):
+        """Save or update Step 1 onboarding data."""
+        return OnboardingService.save_step_data(1, firebase_uid, step1_data)
+    
+    @staticmethod
+    def get_step1_data(firebase_uid):
+        """Get Step 1 onboarding data for a user."""
+        return OnboardingService.get_step_data(1, firebase_uid)
+    
+    @staticmethod
+    def save_step2_data(firebase_uid, step2_data):
+        """Save or update Step 2 onboarding data."""
+        return OnboardingService.save_step_data(2, firebase_uid, step2_data)
+    
+    @staticmethod
+    def get_step2_data(firebase_uid):
+        """Get Step 2 onboarding data for a user."""
+        return OnboardingService.get_step_data(2, firebase_uid)
+    
+    @staticmethod
+    def save_step3_data(firebase_uid, step3_data):
+        """Save or update Step 3 onboarding data."""
+        return OnboardingService.save_step_data(3, firebase_uid, step3_data)
     
     @staticmethod
     def get_step3_data(firebase_uid):
         """Get Step 3 onboarding data for a user."""
-        try:
-            with DatabaseService.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                cursor.execute("""
-                    SELECT 
-                        id, firebase_uid, rent, monthly_expenses, debts, dependents,
-                        step_completed, is_completed, created_at, updated_at
-                    FROM onboarding_applications 
-                    WHERE firebase_uid = %s
-                """, (firebase_uid,))
-                
-                result = cursor.fetchone()
-                
-                if result:
-                    return True, dict(result)
-                else:
-                    return True, None
-                    
-        except Exception as e:
-            logger.error(f"Failed to get Step 3 data: {e}")
-            return False, str(e)
-    
-    # ==========================================================================
-    # STEP 4: ASSETS & FINANCIAL PROFILE  
-    # ==========================================================================
+        return OnboardingService.get_step_data(3, firebase_uid)
     
     @staticmethod
     def save_step4_data(firebase_uid, step4_data):
         """Save or update Step 4 onboarding data."""
-        try:
-            with DatabaseService.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Prepare the data
-                savings = step4_data.get('savings')
-                assets = step4_data.get('assets')
-                source_of_funds = step4_data.get('sourceOfFunds')
-                expected_account_activity = step4_data.get('expectedAccountActivity')
-                is_politically_exposed = step4_data.get('isPoliticallyExposed', False)
-                
-                # Use UPSERT to handle both insert and update
-                cursor.execute("""
-                    INSERT INTO onboarding_applications (
-                        firebase_uid, savings, assets, source_of_funds, 
-                        expected_account_activity, is_politically_exposed, step_completed
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (firebase_uid) 
-                    DO UPDATE SET
-                        savings = EXCLUDED.savings,
-                        assets = EXCLUDED.assets,
-                        source_of_funds = EXCLUDED.source_of_funds,
-                        expected_account_activity = EXCLUDED.expected_account_activity,
-                        is_politically_exposed = EXCLUDED.is_politically_exposed,
-                        step_completed = GREATEST(onboarding_applications.step_completed, 4),
-                        updated_at = CURRENT_TIMESTAMP
-                    RETURNING id, firebase_uid, savings, assets, source_of_funds,
-                            expected_account_activity, is_politically_exposed,
-                            step_completed, is_completed, created_at, updated_at;
-                """, (
-                    firebase_uid, savings, assets, source_of_funds,
-                    expected_account_activity, is_politically_exposed, 4
-                ))
-                
-                result = cursor.fetchone()
-                conn.commit()
-                
-                return True, dict(result)
-                
-        except Exception as e:
-            logger.error(f"Failed to save Step 4 data: {e}")
-            return False, str(e)
+        return OnboardingService.save_step_data(4, firebase_uid, step4_data)
     
     @staticmethod
     def get_step4_data(firebase_uid):
         """Get Step 4 onboarding data for a user."""
-        try:
-            with DatabaseService.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                cursor.execute("""
-                    SELECT 
-                        id, firebase_uid, savings, assets, source_of_funds,
-                        expected_account_activity, is_politically_exposed,
-                        step_completed, is_completed, created_at, updated_at
-                    FROM onboarding_applications 
-                    WHERE firebase_uid = %s
-                """, (firebase_uid,))
-                
-                result = cursor.fetchone()
-                
-                if result:
-                    return True, dict(result)
-                else:
-                    return True, None
-                    
-        except Exception as e:
-            logger.error(f"Failed to get Step 4 data: {e}")
-            return False, str(e)
-    
-    # ==========================================================================
-    # STEP 5: LOAN REQUEST
-    # ==========================================================================
+        return OnboardingService.get_step_data(4, firebase_uid)
     
     @staticmethod
     def save_step5_data(firebase_uid, step5_data):
         """Save or update Step 5 onboarding data."""
-        try:
-            with DatabaseService.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Prepare the data
-                loan_amount = step5_data.get('loanAmount')
-                loan_purpose = step5_data.get('loanPurpose')
-                loan_term = step5_data.get('loanTerm')
-                understands_terms = step5_data.get('understandsTerms', False)
-                can_afford_repayments = step5_data.get('canAffordRepayments', False)
-                has_received_advice = step5_data.get('hasReceivedAdvice', False)
-                
-                # Use UPSERT to handle both insert and update
-                cursor.execute("""
-                    INSERT INTO onboarding_applications (
-                        firebase_uid, loan_amount, loan_purpose, loan_term,
-                        understands_terms, can_afford_repayments, has_received_advice, step_completed
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (firebase_uid) 
-                    DO UPDATE SET
-                        loan_amount = EXCLUDED.loan_amount,
-                        loan_purpose = EXCLUDED.loan_purpose,
-                        loan_term = EXCLUDED.loan_term,
-                        understands_terms = EXCLUDED.understands_terms,
-                        can_afford_repayments = EXCLUDED.can_afford_repayments,
-                        has_received_advice = EXCLUDED.has_received_advice,
-                        step_completed = GREATEST(onboarding_applications.step_completed, 5),
-                        updated_at = CURRENT_TIMESTAMP
-                    RETURNING id, firebase_uid, loan_amount, loan_purpose, loan_term,
-                            understands_terms, can_afford_repayments, has_received_advice,
-                            step_completed, is_completed, created_at, updated_at;
-                """, (
-                    firebase_uid, loan_amount, loan_purpose, loan_term,
-                    understands_terms, can_afford_repayments, has_received_advice, 5
-                ))
-                
-                result = cursor.fetchone()
-                conn.commit()
-                
-                return True, dict(result)
-                
-        except Exception as e:
-            logger.error(f"Failed to save Step 5 data: {e}")
-            return False, str(e)
+        return OnboardingService.save_step_data(5, firebase_uid, step5_data)
     
     @staticmethod
     def get_step5_data(firebase_uid):
         """Get Step 5 onboarding data for a user."""
-        try:
-            with DatabaseService.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                cursor.execute("""
-                    SELECT 
-                        id, firebase_uid, loan_amount, loan_purpose, loan_term,
-                        understands_terms, can_afford_repayments, has_received_advice,
-                        step_completed, is_completed, created_at, updated_at
-                    FROM onboarding_applications 
-                    WHERE firebase_uid = %s
-                """, (firebase_uid,))
-                
-                result = cursor.fetchone()
-                
-                if result:
-                    return True, dict(result)
-                else:
-                    return True, None
-                    
-        except Exception as e:
-            logger.error(f"Failed to get Step 5 data: {e}")
-            return False, str(e)
-    
-    # ==========================================================================
-    # STEP 6: DOCUMENTS & KYC
-    # ==========================================================================
+        return OnboardingService.get_step_data(5, firebase_uid)
     
     @staticmethod
     def save_step6_data(firebase_uid, step6_data):
         """Save or update Step 6 onboarding data (document metadata only)."""
-        try:
-            with DatabaseService.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Prepare the flattened document metadata
-                identity_doc_name = step6_data.get('identityDocumentName')
-                identity_doc_size = step6_data.get('identityDocumentSize')
-                identity_doc_type = step6_data.get('identityDocumentType')
-                
-                address_proof_name = step6_data.get('addressProofName')
-                address_proof_size = step6_data.get('addressProofSize')
-                address_proof_type = step6_data.get('addressProofType')
-                
-                income_proof_name = step6_data.get('incomeProofName')
-                income_proof_size = step6_data.get('incomeProofSize')
-                income_proof_type = step6_data.get('incomeProofType')
-                
-                # Use UPSERT to handle both insert and update
-                cursor.execute("""
-                    INSERT INTO onboarding_applications (
-                        firebase_uid, 
-                        identity_document_name, identity_document_size, identity_document_type, identity_document_uploaded_at,
-                        address_proof_name, address_proof_size, address_proof_type, address_proof_uploaded_at,
-                        income_proof_name, income_proof_size, income_proof_type, income_proof_uploaded_at,
-                        step_completed, is_completed
-                    ) VALUES (%s, %s, %s, %s, CURRENT_TIMESTAMP, %s, %s, %s, CURRENT_TIMESTAMP, %s, %s, %s, CURRENT_TIMESTAMP, %s, %s)
-                    ON CONFLICT (firebase_uid) 
-                    DO UPDATE SET
-                        identity_document_name = EXCLUDED.identity_document_name,
-                        identity_document_size = EXCLUDED.identity_document_size,
-                        identity_document_type = EXCLUDED.identity_document_type,
-                        identity_document_uploaded_at = CURRENT_TIMESTAMP,
-                        address_proof_name = EXCLUDED.address_proof_name,
-                        address_proof_size = EXCLUDED.address_proof_size,
-                        address_proof_type = EXCLUDED.address_proof_type,
-                        address_proof_uploaded_at = CURRENT_TIMESTAMP,
-                        income_proof_name = EXCLUDED.income_proof_name,
-                        income_proof_size = EXCLUDED.income_proof_size,
-                        income_proof_type = EXCLUDED.income_proof_type,
-                        income_proof_uploaded_at = CURRENT_TIMESTAMP,
-                        step_completed = GREATEST(onboarding_applications.step_completed, 6),
-                        is_completed = true,
-                        updated_at = CURRENT_TIMESTAMP
-                    RETURNING id, firebase_uid, 
-                            identity_document_name, identity_document_size, identity_document_type, identity_document_uploaded_at,
-                            address_proof_name, address_proof_size, address_proof_type, address_proof_uploaded_at,
-                            income_proof_name, income_proof_size, income_proof_type, income_proof_uploaded_at,
-                            step_completed, is_completed, created_at, updated_at;
-                """, (
-                    firebase_uid, 
-                    identity_doc_name, identity_doc_size, identity_doc_type,
-                    address_proof_name, address_proof_size, address_proof_type,
-                    income_proof_name, income_proof_size, income_proof_type,
-                    6, True
-                ))
-                
-                result = cursor.fetchone()
-                conn.commit()
-                
-                return True, dict(result)
-                
-        except Exception as e:
-            logger.error(f"Failed to save Step 6 data: {e}")
-            return False, str(e)
+        return OnboardingService.save_step_data(6, firebase_uid, step6_data)
     
     @staticmethod
     def get_step6_data(firebase_uid):
         """Get Step 6 onboarding data for a user."""
-        try:
-            with DatabaseService.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                cursor.execute("""
-                    SELECT 
-                        id, firebase_uid,
-                        identity_document_name, identity_document_size, identity_document_type, identity_document_uploaded_at,
-                        address_proof_name, address_proof_size, address_proof_type, address_proof_uploaded_at,
-                        income_proof_name, income_proof_size, income_proof_type, income_proof_uploaded_at,
-                        step_completed, is_completed, created_at, updated_at
-                    FROM onboarding_applications 
-                    WHERE firebase_uid = %s
-                """, (firebase_uid,))
-                
-                result = cursor.fetchone()
-                
-                if result:
-                    return True, dict(result)
-                else:
-                    return True, None
-                    
-        except Exception as e:
-            logger.error(f"Failed to get Step 6 data: {e}")
-            return False, str(e)
+        return OnboardingService.get_step_data(6, firebase_uid)
     
     # ==========================================================================
     # UTILITY METHODS
@@ -521,9 +232,10 @@ class OnboardingService:
             with DatabaseService.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute("""
+                # Hot table only: none of the section tables are read
+                cursor.execute(f"""
                     SELECT step_completed, is_completed, created_at, updated_at
-                    FROM onboarding_applications 
+                    FROM {TABLE} 
                     WHERE firebase_uid = %s;
                 """, (firebase_uid,))
                 
@@ -545,13 +257,16 @@ class OnboardingService:
             with DatabaseService.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute("""
+                cursor.execute(f"""
                     SELECT *
-                    FROM onboarding_applications 
+                    FROM {WIDE_VIEW} 
                     WHERE firebase_uid = %s;
                 """, (firebase_uid,))
                 
                 result = cursor.fetchone()
+                if result is None:
+                    # Old applications are moved out of the hot tables
+                    result = ArchiveService.read_in_transaction(cursor, firebase_uid)
                 
                 if result:
                     data = dict(result)
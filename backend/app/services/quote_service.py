@@ -0,0 +1,153 @@
+# backend/app/services/quote_service.py
+import logging
+import threading
+from functools import lru_cache
+from flask import current_app
+from ..services.affordability_service import term_weeks
+from ..schemas.onboarding_steps import STEP_SCHEMAS
+
+logger = logging.getLogger(__name__)
+
+_LOAN_AMOUNT = STEP_SCHEMAS[5].patchable['loanAmount']
+MIN_LOAN_AMOUNT = _LOAN_AMOUNT.min_value
+MAX_LOAN_AMOUNT = _LOAN_AMOUNT.max_value
+
+# Weeks between installments
+FREQUENCY_WEEKS = {'weekly': 1, 'fortnightly': 2}
+
+def load_pricing(config):
+    """Quote pricing from app config (hashable, so it can key caches)."""
+    return (
+        config['QUOTE_ANNUAL_INTEREST_RATE'],
+        config['QUOTE_ESTABLISHMENT_FEE'],
+        config['QUOTE_REPAYMENT_FREQUENCY'],
+    )
+
+# ==========================================================================
+# SCHEDULE GENERATION (vectorized over loan amounts)
+# ==========================================================================
+
+def build_quotes(amounts_cents, weeks, pricing):
+    """Quotes for many loan amounts over one term, in frontend format.
+
+    Amortizes ``amount + establishment fee`` in equal installments at the
+    periodic rate (annual rate x installment weeks / 52), in integer
+    cents; each interest charge is rounded and the last installment
+    clears the balance. Every step is an array operation across all
+    amounts, looping only over the (few) installments.
+    """
+    import numpy as np
+
+    annual_rate, fee, frequency = pricing
+    every = FREQUENCY_WEEKS[frequency]
+    count = max(weeks // every, 1)
+    rate = annual_rate * every / 52
+    fee_cents = int(round(fee * 100))
+
+    balance = np.asarray(amounts_cents, dtype=np.int64) + fee_cents
+    financed = balance.copy()
+    if rate:
+        installment = np.rint(balance * (rate / (1 - (1 + rate) ** -count))).astype(np.int64)
+    else:
+        installment = -(-balance // count)  # ceil, so the last installment is the smallest
+
+    payments, principals, interests, balances = [], [], [], []
+    for number in range(1, count + 1):
+        interest = np.rint(balance * rate).astype(np.int64)
+        principal = balance if number == count else np.minimum(installment - interest, balance)
+        balance = balance - principal
+        payments.append(principal + interest)
+        principals.append(principal)
+        interests.append(interest)
+        balances.append(balance)
+
+    total_interest = np.sum(interests, axis=0)
+    total_repayable = financed + total_interest
+    payments, principals, interests, balances = (
+        (np.stack(values, axis=1) / 100).tolist() for values in (payments, principals, interests, balances)
+    )
+    quotes = []
+    for i, amount in enumerate(np.asarray(amounts_cents).tolist()):
+        quotes.append({
+            'loanAmount': amount / 100,
+            'loanTerm': f"{weeks} weeks",
+            'termWeeks': weeks,
+            'frequency': frequency,
+            'installments': count,
+            'installmentAmount': payments[i][0],
+            'finalInstallmentAmount': payments[i][-1],
+            'annualInterestRate': annual_rate,
+            'establishmentFee': fee,
+            'totalInterest': int(total_interest[i]) / 100,
+            'totalRepayable': int(total_repayable[i]) / 100,
+            'schedule': [
+                {
+                    'number': n + 1,
+                    'dueWeek': (n + 1) * every,
+                    'payment': payments[i][n],
+                    'principal': principals[i][n],
+                    'interest': interests[i][n],
+                    'balance': balances[i][n]
+                }
+                for n in range(count)
+            ]
+        })
+    return quotes
+
+@lru_cache(maxsize=4096)
+def _off_grid_quote(amount_cents, weeks, pricing):
+    return build_quotes([amount_cents], weeks, pricing)[0]
+
+class QuoteService:
+    """Repayment quotes for Step 5.
+
+    Whole-dollar amounts are served from a per-term grid of every amount
+    between the Step 5 limits, generated in one vectorized pass the first
+    time the term is quoted. Grids are indexed by the ``loanTerm`` text
+    the client sends, so a quote is a config read and two dictionary
+    lookups. Amounts with cents go through an LRU cache.
+    """
+    _grids = {}
+    _terms = {}
+    _terms_key = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def quote(cls, amount, loan_term=None):
+        """Return ``(success, quote or error message)``."""
+        config = current_app.config
+        pricing = load_pricing(config)
+        offered = config['QUOTE_TERM_WEEKS']
+
+        if cls._terms_key != (pricing, offered):
+            cls._terms, cls._terms_key = {}, (pricing, offered)
+        grid = cls._terms.get(loan_term)
+        if grid is None:
+            weeks = term_weeks(loan_term) if loan_term else offered[0]
+            if weeks not in offered:
+                terms = ', '.join(f"{term} weeks" for term in offered)
+                return False, f"Loan term must be one of: {terms}"
+            grid = cls._grid(int(weeks), pricing)
+            # Index a bounded number of spellings ("8 weeks", "8 Weeks", ...)
+            if len(cls._terms) < 64:
+                cls._terms[loan_term] = grid
+
+        amount_cents = int(round(amount * 100))
+        if amount_cents % 100:
+            return True, _off_grid_quote(amount_cents, grid[MIN_LOAN_AMOUNT]['termWeeks'], pricing)
+        return True, grid[amount_cents // 100]
+
+    @classmethod
+    def _grid(cls, weeks, pricing):
+        grid = cls._grids.get((weeks, pricing))
+        if grid is None:
+            with cls._lock:
+                grid = cls._grids.get((weeks, pricing))
+                if grid is None:
+                    import numpy as np
+
+                    dollars = np.arange(MIN_LOAN_AMOUNT, MAX_LOAN_AMOUNT + 1)
+                    quotes = build_quotes(dollars * 100, weeks, pricing)
+                    grid = cls._grids[(weeks, pricing)] = dict(zip(dollars.tolist(), quotes))
+                    logger.info(f"Built repayment quote grid for {weeks} weeks ({len(grid)} amounts)")
+        return grid
@@ -0,0 +1,142 @@
+# backend/app/services/status_stream_service.py
+import json
+import logging
+import threading
+import time
+from ..services.cache_service import CacheService
+
+logger = logging.getLogger(__name__)
+
+STATUS_CHANNEL = 'onboarding:status'
+
+def status_event(firebase_uid, status):
+    """Status row (``step_completed``, ``is_completed``, ``updated_at``) -> pushed event."""
+    updated_at = status.get('updated_at')
+    return {
+        'uid': firebase_uid,
+        'stepCompleted': status.get('step_completed', 0),
+        'isCompleted': status.get('is_completed', False),
+        'updatedAt': updated_at.isoformat() if hasattr(updated_at, 'isoformat') else updated_at
+    }
+
+class _Mailbox:
+    """Latest-value slot for one open stream; older unsent events are superseded."""
+    __slots__ = ('event', 'value')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+
+    def put(self, value):
+        self.value = value
+        self.event.set()
+
+    def wait(self, timeout):
+        """Return the latest value, or None if nothing arrived within ``timeout``."""
+        if not self.event.wait(timeout):
+            return None
+        self.event.clear()
+        return self.value
+
+class StatusStreamService:
+    """Fan-out of application status changes to open SSE streams.
+
+    Writers publish to a Redis channel; one listener thread per worker
+    receives every message and hands it to the mailboxes of that user's
+    open streams in this worker. Without Redis, events only reach
+    streams in the publishing worker.
+    """
+    _subscribers = {}
+    _lock = threading.Lock()
+    _listener = None
+
+    @classmethod
+    def publish(cls, firebase_uid, status):
+        """Announce a status change after it has been committed."""
+        event = status_event(firebase_uid, status)
+        if not CacheService().publish(STATUS_CHANNEL, event):
+            cls._dispatch(event)
+
+    @classmethod
+    def subscribe(cls, firebase_uid, app):
+        """Register a stream for a user and return its mailbox."""
+        mailbox = _Mailbox()
+        with cls._lock:
+            cls._subscribers.setdefault(firebase_uid, set()).add(mailbox)
+            if cls._listener is None:
+                cls._listener = threading.Thread(
+                    target=cls._listen, args=(app,), name='status-stream-listener', daemon=True
+                )
+                cls._listener.start()
+        return mailbox
+
+    @classmethod
+    def unsubscribe(cls, firebase_uid, mailbox):
+        with cls._lock:
+            mailboxes = cls._subscribers.get(firebase_uid)
+            if mailboxes is not None:
+                mailboxes.discard(mailbox)
+                if not mailboxes:
+                    del cls._subscribers[firebase_uid]
+
+    @classmethod
+    def has_subscribers(cls, firebase_uid):
+        return firebase_uid in cls._subscribers
+
+    @classmethod
+    def notify_local(cls, firebase_uid, status):
+        """Deliver a status to this worker's streams only (e.g. from a DB notification)."""
+        cls._dispatch(status_event(firebase_uid, status))
+
+    @classmethod
+    def open_streams(cls):
+        with cls._lock:
+            return sum(len(mailboxes) for mailboxes in cls._subscribers.values())
+
+    @classmethod
+    def _dispatch(cls, event):
+        with cls._lock:
+            mailboxes = tuple(cls._subscribers.get(event['uid'], ()))
+        for mailbox in mailboxes:
+            mailbox.put(event)
+
+    @classmethod
+    def _listen(cls, app):
+        """Relay Redis messages to this worker's streams, reconnecting with backoff.
+
+        ``_listener`` stays set while reconnecting, so the thread is never
+        lost; without Redis ``publish`` delivers locally in the meantime.
+        """
+        backoff = 1
+        warned = False
+        with app.app_context():
+            while True:
+                pubsub = CacheService().subscribe(STATUS_CHANNEL)
+                if pubsub is None:
+                    if not warned:
+                        logger.warning("Redis not available; status events stay within this worker until it is")
+                        warned = True
+                    time.sleep(backoff)
+                    backoff = min(backoff * 2, 30)
+                    continue
+
+                logger.info("Status stream listener subscribed")
+                backoff = 1
+                warned = False
+                try:
+                    while True:
+                        message = pubsub.get_message(timeout=1.0)
+                        if message and message['type'] == 'message':
+                            try:
+                                cls._dispatch(json.loads(message['data']))
+                            except ValueError as e:
+                                logger.error(f"Ignoring malformed status event: {e}")
+                except Exception as e:
+                    logger.error(f"Status stream listener lost its connection: {e}; retrying in {backoff}s")
+                    time.sleep(backoff)
+                    backoff = min(backoff * 2, 30)
+                finally:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
@@ -0,0 +1,64 @@
+# backend/app/services/version_service.py
+import logging
+from datetime import timezone
+from flask import current_app
+from ..services.cache_service import CacheService
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = 'onboarding:version:{}'
+
+class VersionService:
+    """Cached version stamps for onboarding applications.
+
+    A stamp is ``updated_at`` in integer microseconds (0 when the user has
+    no application yet). Conditional GETs compare the client's ETag
+    against the cached stamp so a repeat fetch can be answered with a 304
+    without querying Postgres. Writers overwrite the stamp after commit;
+    readers only fill it in when it is missing, so a slow read can never
+    put back a stale version.
+    """
+
+    @staticmethod
+    def stamp_for(updated_at):
+        """Version stamp for an ``updated_at`` value (naive timestamps are UTC)."""
+        if not updated_at:
+            return 0
+        if updated_at.tzinfo is None:
+            updated_at = updated_at.replace(tzinfo=timezone.utc)
+        return int(updated_at.timestamp() * 1_000_000)
+
+    @staticmethod
+    def get(firebase_uid):
+        """Cached stamp for a user, or None on a miss / without Redis."""
+        return CacheService().get(VERSION_KEY.format(firebase_uid))
+
+    @staticmethod
+    def remember(firebase_uid, stamp):
+        """Cache a stamp read from Postgres unless a writer already set one."""
+        CacheService().add(VERSION_KEY.format(firebase_uid), stamp, current_app.config['ONBOARDING_VERSION_TTL'])
+
+    @classmethod
+    def publish(cls, firebase_uid, updated_at):
+        """Record the version written by a committed update."""
+        key = VERSION_KEY.format(firebase_uid)
+        cache = CacheService()
+        if not cache.set(key, cls.stamp_for(updated_at), current_app.config['ONBOARDING_VERSION_TTL']):
+            # Never leave an older stamp behind
+            cache.delete(key)
+
+    @classmethod
+    def refresh(cls, updated_at_by_uid):
+        """Overwrite stamps with ``updated_at`` values just read from Postgres."""
+        stamps = {
+            VERSION_KEY.format(uid): cls.stamp_for(updated_at) for uid, updated_at in updated_at_by_uid.items()
+        }
+        cache = CacheService()
+        if not cache.set_many(stamps, current_app.config['ONBOARDING_VERSION_TTL']):
+            # Never leave an older stamp behind
+            cache.delete_many(list(stamps))
+
+    @staticmethod
+    def invalidate(firebase_uids):
+        """Forget the stamps of users whose rows were written elsewhere."""
+        CacheService().delete_many([VERSION_KEY.format(uid) for uid in firebase_uids])
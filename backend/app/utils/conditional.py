@@ -0,0 +1,46 @@
+from flask import request, make_response
+from datetime import datetime, timezone
+import hashlib
+
+def make_etag(scope, firebase_uid, stamp):
+    """Weak ETag for a user's resource ``scope`` at version ``stamp``.
+
+    The user is part of the tag so a browser cache shared by two accounts
+    can never revalidate one user's body for the other.
+    """
+    owner = hashlib.blake2b(firebase_uid.encode(), digest_size=6).hexdigest()
+    return f"{scope}-{owner}-{stamp}"
+
+def _last_modified(stamp):
+    return datetime.fromtimestamp(stamp / 1_000_000, tz=timezone.utc) if stamp else None
+
+def is_not_modified(etag, stamp):
+    """True when the request's validators still match ``etag``/``stamp``.
+
+    ``If-None-Match`` takes precedence over ``If-Modified-Since``.
+    """
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    if request.if_modified_since and stamp:
+        # HTTP dates have second precision
+        return _last_modified(stamp).replace(microsecond=0) <= request.if_modified_since
+    return False
+
+def _set_validators(response, etag, stamp):
+    response.set_etag(etag, weak=True)
+    last_modified = _last_modified(stamp)
+    if last_modified:
+        response.last_modified = last_modified
+    # Per-user data: browsers may keep it but must revalidate each time.
+    # Not varied on Authorization since the client refreshes its token per request.
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
+
+def not_modified_response(etag, stamp):
+    """Empty 304 response carrying the current validators."""
+    return _set_validators(make_response('', 304), etag, stamp)
+
+def with_validators(result, etag, stamp):
+    """Attach ETag/Last-Modified to a ``success_response`` result."""
+    response, status_code = result
+    return _set_validators(response, etag, stamp), status_code
@@ -0,0 +1,37 @@
+"""Streaming input for ``COPY ... FROM STDIN`` (bulk import, identity-key rebuild)."""
+import csv
+import io
+
+class CsvFeed(io.RawIOBase):
+    """Readable file object producing CSV lines from row tuples on demand.
+
+    ``copy_expert`` pulls from it in fixed-size reads, so rows are encoded
+    as COPY consumes them and never held in memory all at once.
+    """
+
+    def __init__(self, rows):
+        self._rows = iter(rows)
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+        self._pending = b''
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        while size < 0 or len(self._pending) < size:
+            for row in self._rows:
+                self._writer.writerow(row)
+                if self._buffer.tell() >= 65536:
+                    break
+            text = self._buffer.getvalue()
+            if not text:
+                break
+            self._buffer.seek(0)
+            self._buffer.truncate()
+            self._pending += text.encode()
+        if size < 0:
+            data, self._pending = self._pending, b''
+        else:
+            data, self._pending = self._pending[:size], self._pending[size:]
+        return data
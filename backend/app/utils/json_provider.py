@@ -0,0 +1,70 @@
+"""JSON provider used for every API response.
+
+Serializes with orjson when it is installed and falls back to the stdlib
+``json`` module otherwise. Either way datetimes/dates are written as ISO
+8601, Decimals as numbers and UUIDs as strings, so routes can hand DB
+values straight to ``success_response``.
+"""
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from uuid import UUID
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+def json_default(value):
+    """Serialize the types the stdlib encoder (and orjson, for Decimal) can't."""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def dumps_compact(obj):
+    """Single-line JSON bytes regardless of debug mode (e.g. for NDJSON)."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=json_default, separators=(',', ':')).encode('utf-8')
+
+class ApiJSONProvider(DefaultJSONProvider):
+    """orjson-backed provider; compact unless the app runs in debug mode."""
+    sort_keys = False
+
+    def _indent(self):
+        return self.compact is False or (self.compact is None and self._app.debug)
+
+    def dumps(self, obj, **kwargs):
+        return self._dumps_bytes(obj, **kwargs).decode('utf-8')
+
+    def _dumps_bytes(self, obj, **kwargs):
+        if orjson is not None and not kwargs:
+            option = orjson.OPT_NON_STR_KEYS
+            if self._indent():
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(obj, default=json_default, option=option)
+
+        kwargs.setdefault('default', json_default)
+        kwargs.setdefault('ensure_ascii', self.ensure_ascii)
+        kwargs.setdefault('sort_keys', self.sort_keys)
+        if self._indent():
+            kwargs.setdefault('indent', 2)
+        else:
+            kwargs.setdefault('separators', (',', ':'))
+        return json.dumps(obj, **kwargs).encode('utf-8')
+
+    def loads(self, s, **kwargs):
+        if orjson is not None and not kwargs:
+            return orjson.loads(s)
+        return json.loads(s, **kwargs)
+
+    def response(self, *args, **kwargs):
+        """Like ``jsonify`` but writes orjson's bytes without a decode/encode round trip."""
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self._dumps_bytes(obj) + b'\n', mimetype=self.mimetype)
@@ -0,0 +1,19 @@
+"""Monthly range partitions for append-only tables (archive, history).
+
+Partitions are named ``<table>_YYYY_MM`` and created on demand, ahead of
+the rows that need them; old months can be detached or dropped whole.
+"""
+from datetime import date
+
+def month_start(day, months=0):
+    """First day of ``day``'s month, shifted by ``months``."""
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+def monthly_partition_sql(table, day):
+    """``CREATE TABLE`` for the partition of ``table`` holding ``day``'s month."""
+    start, end = month_start(day), month_start(day, 1)
+    return (
+        f"CREATE TABLE IF NOT EXISTS {table}_{start:%Y_%m} PARTITION OF {table} "
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}');"
+    )
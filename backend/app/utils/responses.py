@@ -14,8 +14,11 @@ def success_response(data=None, message="Success", status_code=200):
     
     return jsonify(response), status_code
 
-def error_response(message="An error occurred", status_code=400, error_code=None):
-    """Standardized error response."""
+def error_response(message="An error occurred", status_code=400, error_code=None, errors=None):
+    """Standardized error response.
+
+    ``errors`` optionally lists every field error (``field``/``message``/``code``).
+    """
     response = {
         'success': False,
         'message': message,
@@ -25,4 +28,7 @@ def error_response(message="An error occurred", status_code=400, error_code=None
     if error_code:
         response['error_code'] = error_code
     
+    if errors:
+        response['errors'] = errors
+    
     return jsonify(response), status_code
\ No newline at end of file
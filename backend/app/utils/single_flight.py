@@ -0,0 +1,67 @@
+import threading
+from flask import current_app, make_response
+
+class _Call:
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+class SingleFlight:
+    """Coalesce identical concurrent calls within one worker process.
+
+    The first caller for a key runs the function; callers arriving while
+    it is in flight wait and share its result (or exception). Nothing is
+    cached once the call completes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._stats = {'executed': 0, 'coalesced': 0}
+
+    def do(self, key, fn):
+        """Run ``fn`` once for all concurrent callers with the same ``key``."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._stats['executed'] += 1
+            else:
+                self._stats['coalesced'] += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    def response(self, key, view):
+        """Like ``do`` for a view: the serialized body is shared and every
+        caller gets its own response object built from it."""
+        def render():
+            response = make_response(view())
+            return response.get_data(), response.status_code, list(response.headers)
+
+        body, status, headers = self.do(key, render)
+        return current_app.response_class(body, status=status, headers=headers)
+
+    def stats(self):
+        with self._lock:
+            data = dict(self._stats)
+            data['in_flight'] = len(self._calls)
+        return data
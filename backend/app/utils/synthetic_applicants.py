@@ -0,0 +1,132 @@
+"""Deterministic synthetic applicants for load tests and benchmarks.
+
+``generate_applicants(count, seed)`` yields rows keyed by database column
+(the same shape the bulk importer and exporter use). Every step payload is
+built in frontend format and checked with that step's schema validator
+before it is mapped to columns, so the data always satisfies the route
+validation rules: residency and employment enums, the employment/income
+rule, Step 3 ranges and $100-$2,000 loan amounts. The same ``seed`` always
+produces the same rows.
+"""
+import random
+from datetime import date, datetime, timedelta, timezone
+from ..schemas.onboarding_steps import (
+    EMPLOYMENT_DURATIONS, EMPLOYMENT_TYPES, RESIDENCY_STATUSES, STEP_SCHEMAS, UNEMPLOYED_TYPES
+)
+
+# Generated timestamps fall within SPAN_DAYS before EPOCH (not "now", to stay deterministic)
+EPOCH = datetime(2025, 1, 1, tzinfo=timezone.utc)
+SPAN_DAYS = 730
+
+# Share of applicants that stopped after each step (step 6 = completed)
+STEP_WEIGHTS = (10, 12, 10, 8, 15, 45)
+
+FIRST_NAMES = ('Aroha', 'Liam', 'Mere', 'Oliver', 'Ana', 'Noah', 'Hana', 'Jack', 'Sione', 'Isla', 'Wiremu', 'Mia')
+LAST_NAMES = ('Smith', 'Ngata', 'Wilson', 'Tui', 'Brown', 'Patel', 'Taylor', 'Fifita', 'Walker', 'Chen')
+CITIES = ('Auckland', 'Wellington', 'Christchurch', 'Hamilton', 'Tauranga', 'Dunedin', 'Rotorua')
+EMPLOYERS = ('Acme Ltd', 'Kiwi Foods', 'Southern Health', 'Harbour Logistics', 'City Council', 'Fern Retail')
+JOB_TITLES = ('Engineer', 'Nurse', 'Driver', 'Retail Assistant', 'Accountant', 'Teacher', 'Builder')
+LOAN_PURPOSES = ('car_repairs', 'medical', 'bills', 'education', 'travel', 'debt_consolidation', 'other')
+LOAN_TERMS = ('8 weeks', '12 weeks', '16 weeks')
+FUNDS_SOURCES = ('salary', 'benefits', 'savings', 'business_income')
+ACCOUNT_ACTIVITY = ('low', 'medium', 'high')
+
+def _money(rng, low, high, step=1):
+    """Whole-dollar amount in ``[low, high]`` on a ``step`` grid."""
+    return rng.randrange(low // step, high // step + 1) * step
+
+def _payloads(rng, index, last_step):
+    """Frontend payloads for steps 1..last_step of one applicant."""
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    payloads = {1: {
+        'fullName': f"{first} {last}",
+        'dob': (date(1950, 1, 1) + timedelta(days=rng.randrange(365 * 55))).isoformat(),
+        'address': f"{rng.randint(1, 999)} {rng.choice(LAST_NAMES)} Street, {rng.choice(CITIES)}",
+        'email': f"{first.lower()}.{last.lower()}.{index}@example.com",
+        'phoneNumber': f"+6421{rng.randrange(10 ** 7):07d}",
+        'nzResidencyStatus': rng.choice(RESIDENCY_STATUSES),
+        'taxNumber': f"{rng.randrange(10 ** 8, 10 ** 9)}" if rng.random() < 0.7 else '',
+    }}
+
+    employment_type = rng.choice(EMPLOYMENT_TYPES)
+    if employment_type in UNEMPLOYED_TYPES:
+        payloads[2] = {
+            'employmentType': employment_type, 'employer': '', 'jobTitle': '', 'employmentDuration': '',
+            'monthlyIncome': 0, 'otherIncome': _money(rng, 200, 3000, 10),
+        }
+    else:
+        payloads[2] = {
+            'employmentType': employment_type,
+            'employer': rng.choice(EMPLOYERS),
+            'jobTitle': rng.choice(JOB_TITLES),
+            'employmentDuration': rng.choice(EMPLOYMENT_DURATIONS),
+            'monthlyIncome': _money(rng, 1500, 12000, 10),
+            'otherIncome': _money(rng, 0, 1000, 10) if rng.random() < 0.3 else 0,
+        }
+
+    payloads[3] = {
+        'rent': _money(rng, 0, 4000, 10),
+        'monthlyExpenses': _money(rng, 200, 6000, 10),
+        'debts': _money(rng, 0, 50000, 100) if rng.random() < 0.6 else 0,
+        'dependents': rng.choice((0, 0, 0, 1, 1, 2, 3, 4)),
+    }
+    payloads[4] = {
+        'savings': _money(rng, 0, 20000, 10),
+        'assets': _money(rng, 0, 100000, 100),
+        'sourceOfFunds': rng.choice(FUNDS_SOURCES),
+        'expectedAccountActivity': rng.choice(ACCOUNT_ACTIVITY),
+        'isPoliticallyExposed': rng.random() < 0.01,
+    }
+    payloads[5] = {
+        'loanAmount': _money(rng, 100, 2000, 50),
+        'loanPurpose': rng.choice(LOAN_PURPOSES),
+        'loanTerm': rng.choice(LOAN_TERMS),
+        'understandsTerms': True,
+        'canAffordRepayments': True,
+        'hasReceivedAdvice': True,
+    }
+    payloads[6] = {
+        'identityDocumentName': f"passport-{index}.pdf",
+        'identityDocumentSize': rng.randint(50_000, 5_000_000),
+        'identityDocumentType': 'application/pdf',
+        'addressProofName': f"bill-{index}.pdf",
+        'addressProofSize': rng.randint(50_000, 5_000_000),
+        'addressProofType': 'application/pdf',
+        'incomeProofName': f"payslip-{index}.png",
+        'incomeProofSize': rng.randint(50_000, 5_000_000),
+        'incomeProofType': 'image/png',
+    }
+    return {step: payloads[step] for step in range(1, last_step + 1)}
+
+def generate_applicants(count, seed=0, validate=True):
+    """Yield ``count`` applicant rows keyed by database column.
+
+    Rows carry ``firebase_uid`` (``synthetic-<seed>-<n>``), every field of
+    the steps the applicant reached, and the status columns. With
+    ``validate`` each payload is run through its step validator and a
+    ValueError is raised if the generator ever drifts from the rules.
+    """
+    rng = random.Random(seed)
+    steps = range(1, len(STEP_WEIGHTS) + 1)
+    for index in range(count):
+        last_step = rng.choices(steps, weights=STEP_WEIGHTS)[0]
+        created_at = EPOCH - timedelta(seconds=rng.randrange(SPAN_DAYS * 86400))
+        updated_at = created_at + timedelta(seconds=rng.randrange(14 * 86400))
+
+        row = {'firebase_uid': f"synthetic-{seed}-{index}"}
+        for step, payload in _payloads(rng, index, last_step).items():
+            schema = STEP_SCHEMAS[step]
+            if validate:
+                errors = schema.validate(payload)
+                if errors:
+                    raise ValueError(f"Synthetic Step {step} payload failed validation: {errors}")
+            values = iter(schema.payload_values(payload))
+            for field in schema.fields:
+                # Server-side values (upload timestamps) are set as the route would
+                row[field.column] = updated_at if field.server_value is not None else next(values)
+
+        row['step_completed'] = last_step
+        row['is_completed'] = last_step == 6
+        row['created_at'] = created_at
+        row['updated_at'] = updated_at
+        yield row
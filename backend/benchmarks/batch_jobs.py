@@ -0,0 +1,118 @@
+# backend/benchmarks/batch_jobs.py
+"""Parallel re-scoring throughput across worker counts.
+
+Usage (from the backend directory, against a scratch database):
+
+    python -m benchmarks.batch_jobs --dsn postgresql://localhost/bench
+    python -m benchmarks.batch_jobs --dsn ... --rows 5000000 --workers 1,2,4,8,16 --keep
+
+Builds ``bench_affordability_applications`` (the affordability input and
+result columns of ``onboarding_applications``) with ``--rows`` synthetic
+rows, then runs the affordability re-score job over the same id
+partitions once per worker count, exactly as ``flask
+rescore-affordability --workers N`` does but without checkpoints. Every
+run uses a fresh policy version, so each one rewrites every row.
+Throughput stops scaling once the database (WAL, locks, I/O) rather than
+scoring is the bottleneck; run it on hardware like production's.
+"""
+import argparse
+import os
+import sys
+import time
+
+import psycopg2
+
+from app.config import Config
+from app.services.affordability_service import AffordabilityRescoreJob, load_policy
+from app.services.batch_job_service import plan_partitions, run_partitions
+
+TABLE = 'bench_affordability_applications'
+
+SCHEMA_SQL = f"""
+DROP TABLE IF EXISTS {TABLE};
+CREATE TABLE {TABLE} (
+    id BIGINT PRIMARY KEY,
+    monthly_income NUMERIC(12, 2), other_income NUMERIC(12, 2),
+    rent NUMERIC(12, 2), monthly_expenses NUMERIC(12, 2), debts NUMERIC(12, 2),
+    dependents INTEGER, loan_amount NUMERIC(12, 2), loan_term TEXT,
+    affordability_outcome TEXT, affordability_surplus NUMERIC(12, 2),
+    affordability_ratio NUMERIC(10, 4), affordability_policy TEXT,
+    affordability_assessed_at TIMESTAMPTZ
+);
+"""
+
+POPULATE_SQL = f"""
+INSERT INTO {TABLE} (id, monthly_income, other_income, rent, monthly_expenses, debts,
+                     dependents, loan_amount, loan_term)
+SELECT g, 1500 + g % 10500, (g % 7) * 50, CASE WHEN g % 20 = 0 THEN NULL ELSE g % 4000 END,
+       200 + g % 5800, (g % 11) * 1000, g % 5,
+       CASE WHEN g % 19 = 0 THEN NULL ELSE 100 + (g % 39) * 50 END,
+       (ARRAY['8 weeks', '12 weeks', '16 weeks'])[1 + g % 3]
+FROM generate_series(1, %s) AS g;
+ANALYZE {TABLE};
+"""
+
+class BenchRescoreJob(AffordabilityRescoreJob):
+    table = source = TABLE
+
+def build_table(dsn, rows):
+    print(f"Building {TABLE} with {rows:,} rows...", flush=True)
+    started = time.perf_counter()
+    with psycopg2.connect(dsn) as conn:
+        cursor = conn.cursor()
+        cursor.execute(SCHEMA_SQL)
+        cursor.execute(POPULATE_SQL, (rows,))
+    print(f"Built in {time.perf_counter() - started:.1f}s\n")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Parallel re-scoring throughput across worker counts.")
+    parser.add_argument('--dsn', required=True, help="Scratch database to build the synthetic table in")
+    parser.add_argument('--rows', type=int, default=1_000_000, help="Synthetic table size")
+    parser.add_argument('--workers', default=None,
+                        help="Comma-separated worker counts (default: 1, 2, 4, ... up to the CPU count)")
+    parser.add_argument('--partition-size', type=int, default=Config.BATCH_JOB_PARTITION_SIZE)
+    parser.add_argument('--batch-size', type=int, default=Config.BATCH_JOB_BATCH_SIZE)
+    parser.add_argument('--reuse', action='store_true', help="Reuse an existing synthetic table")
+    parser.add_argument('--keep', action='store_true', help="Keep the synthetic table afterwards")
+    args = parser.parse_args(argv)
+
+    if args.workers:
+        counts = [int(count) for count in args.workers.split(',')]
+    else:
+        counts, count = [], 1
+        while count < (os.cpu_count() or 1):
+            counts.append(count)
+            count *= 2
+        counts.append(os.cpu_count() or 1)
+
+    if not args.reuse:
+        build_table(args.dsn, args.rows)
+    with psycopg2.connect(args.dsn) as conn:
+        cursor = conn.cursor()
+        cursor.execute(f"SELECT min(id), max(id), count(*) FROM {TABLE};")
+        min_id, max_id, rows = cursor.fetchone()
+    partitions = plan_partitions(min_id, max_id, args.partition_size)
+    policy = load_policy(vars(Config))
+
+    print(f"{rows:,} rows in {len(partitions)} partitions of {args.partition_size:,} ids\n")
+    print(f"{'workers':>8}{'seconds':>10}{'rows/s':>12}{'speed-up':>10}{'efficiency':>12}")
+    baseline = None
+    try:
+        for workers in counts:
+            params = dict(policy, version=f"bench-{workers}-{time.time_ns()}")
+            stats = run_partitions(BenchRescoreJob, params, args.dsn, partitions, workers, args.batch_size)
+            if stats['failed']:
+                print(f"{workers:>8}  {stats['failed']} partitions failed (see log)")
+                continue
+            baseline = baseline or stats['seconds']
+            speedup = baseline / stats['seconds']
+            print(f"{workers:>8}{stats['seconds']:>10.2f}{stats['rows_per_second']:>12,}"
+                  f"{speedup:>9.2f}x{speedup / workers:>11.0%}", flush=True)
+    finally:
+        if not args.keep:
+            with psycopg2.connect(args.dsn) as conn:
+                conn.cursor().execute(f"DROP TABLE IF EXISTS {TABLE};")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
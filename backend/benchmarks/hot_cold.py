@@ -0,0 +1,207 @@
+# backend/benchmarks/hot_cold.py
+"""Wide row vs. hot/cold split: bloat, WAL and status-read latency.
+
+Usage (from the backend directory, against a scratch database):
+
+    python -m benchmarks.hot_cold --dsn postgresql://localhost/bench
+    python -m benchmarks.hot_cold --dsn ... --rows 2000000 --writes 1000000 --keep
+
+Builds the same ``--rows`` synthetic applications twice: once as one wide
+table (the pre-migrations/008 layout) and once split into a narrow hot
+table plus one section table per step, with the listing index from
+migrations/002 on both. Column lists come from the step schemas, so the
+layouts track ``app/schemas/onboarding_steps.py``.
+
+Each layout then takes the same write mix, in batches of random
+applications: autosaves of one Step 2 field (which also bump
+``updated_at``) and step-progress updates. Reported per layout: WAL
+written, table growth and dead tuples left for VACUUM, then the latency
+of the status read every save makes and of a full application read.
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+
+import psycopg2
+
+from app.schemas.onboarding_steps import SQL_TYPES, STEP_SCHEMAS
+
+WIDE = 'bench_wide_applications'
+HOT = 'bench_hot_applications'
+SECTIONS = {step: f"bench_{schema.table}" for step, schema in STEP_SCHEMAS.items()}
+
+HOT_COLUMNS = (
+    'id BIGINT PRIMARY KEY', 'firebase_uid TEXT NOT NULL UNIQUE',
+    'step_completed INTEGER NOT NULL', 'is_completed BOOLEAN NOT NULL',
+    'created_at TIMESTAMPTZ NOT NULL', 'updated_at TIMESTAMPTZ NOT NULL',
+    'affordability_outcome TEXT', 'duplicate_kinds TEXT[]'
+)
+
+# Synthetic value per field kind (g is the row number, ts its timestamp)
+VALUES_BY_KIND = {
+    'string': "md5({column!r} || g)",
+    'boolean': "g % 2 = 0",
+    'money': "(g % 5000)::numeric",
+    'integer': "g % 10",
+    'date': "date '1960-01-01' + g % 15000",
+    'timestamp': "ts",
+}
+
+AUTOSAVE_STEP = 2
+AUTOSAVE_COLUMN = 'monthly_income'
+
+def _fields():
+    return [field for schema in STEP_SCHEMAS.values() for field in schema.fields]
+
+def schema_sql(rows):
+    fields = _fields()
+    sql = [
+        f"DROP TABLE IF EXISTS {WIDE}, {HOT}, {', '.join(SECTIONS.values())};",
+        f"CREATE TABLE {WIDE} ({', '.join(HOT_COLUMNS)}, "
+        f"{', '.join(f'{f.column} {SQL_TYPES[f.kind]}' for f in fields)});",
+        f"INSERT INTO {WIDE} SELECT g, 'uid-' || g, g % 7, g % 7 = 6, ts - interval '1 day', ts, NULL, NULL, "
+        f"{', '.join(VALUES_BY_KIND[f.kind].format(column=f.column) for f in fields)} "
+        f"FROM (SELECT g, now() - (random() * interval '730 days') AS ts "
+        f"FROM generate_series(1, {int(rows)}) AS g) AS rows;",
+        f"CREATE TABLE {HOT} ({', '.join(HOT_COLUMNS)});",
+        f"INSERT INTO {HOT} SELECT id, firebase_uid, step_completed, is_completed, created_at, updated_at, "
+        f"affordability_outcome, duplicate_kinds FROM {WIDE};",
+    ]
+    for step, schema in STEP_SCHEMAS.items():
+        sql += [
+            f"CREATE TABLE {SECTIONS[step]} WITH (fillfactor = 90) AS "
+            f"SELECT id AS application_id, {', '.join(schema.columns)} FROM {WIDE};",
+            f"ALTER TABLE {SECTIONS[step]} ADD PRIMARY KEY (application_id);",
+        ]
+    sql += [
+        f"CREATE INDEX ON {WIDE} (updated_at DESC, id DESC);",
+        f"CREATE INDEX ON {HOT} (updated_at DESC, id DESC);",
+    ]
+    return sql
+
+LAYOUTS = {
+    'wide': {
+        'tables': (WIDE,),
+        'autosave': (
+            f"UPDATE {WIDE} SET {AUTOSAVE_COLUMN} = {AUTOSAVE_COLUMN} + 1, updated_at = CURRENT_TIMESTAMP "
+            f"WHERE id = ANY(%s);"
+        ),
+        'progress': (
+            f"UPDATE {WIDE} SET step_completed = step_completed % 6 + 1, updated_at = CURRENT_TIMESTAMP "
+            f"WHERE id = ANY(%s);"
+        ),
+        'status': f"SELECT step_completed, is_completed, updated_at FROM {WIDE} WHERE firebase_uid = %s;",
+        'full': f"SELECT * FROM {WIDE} WHERE firebase_uid = %s;",
+    },
+    'split': {
+        'tables': (HOT, *SECTIONS.values()),
+        'autosave': (
+            f"WITH changed AS (UPDATE {SECTIONS[AUTOSAVE_STEP]} SET {AUTOSAVE_COLUMN} = {AUTOSAVE_COLUMN} + 1 "
+            f"WHERE application_id = ANY(%s) RETURNING application_id) "
+            f"UPDATE {HOT} a SET updated_at = CURRENT_TIMESTAMP FROM changed WHERE a.id = changed.application_id;"
+        ),
+        'progress': (
+            f"UPDATE {HOT} SET step_completed = step_completed % 6 + 1, updated_at = CURRENT_TIMESTAMP "
+            f"WHERE id = ANY(%s);"
+        ),
+        'status': f"SELECT step_completed, is_completed, updated_at FROM {HOT} WHERE firebase_uid = %s;",
+        'full': (
+            f"SELECT * FROM {HOT} a "
+            + ' '.join(f"LEFT JOIN {table} s{step} ON s{step}.application_id = a.id"
+                       for step, table in SECTIONS.items())
+            + " WHERE a.firebase_uid = %s;"
+        ),
+    },
+}
+
+def build_tables(conn, rows):
+    cursor = conn.cursor()
+    print(f"Building both layouts with {rows:,} rows...", flush=True)
+    started = time.perf_counter()
+    for sql in schema_sql(rows):
+        cursor.execute(sql)
+    for table in (WIDE, HOT, *SECTIONS.values()):
+        cursor.execute(f"VACUUM ANALYZE {table};")
+    print(f"Built in {time.perf_counter() - started:.1f}s\n")
+
+def _table_stats(cursor, tables):
+    """``(total bytes, dead tuples)`` summed over ``tables``."""
+    try:
+        cursor.execute("SELECT pg_stat_force_next_flush();")
+    except psycopg2.Error:
+        pass  # Before PostgreSQL 15 the counters may lag by up to a second
+    time.sleep(1)
+    cursor.execute(
+        "SELECT sum(pg_total_relation_size(relid))::bigint, sum(n_dead_tup)::bigint "
+        "FROM pg_stat_user_tables WHERE relname = ANY(%s);",
+        (list(tables),)
+    )
+    return cursor.fetchone()
+
+def run_writes(cursor, layout, rows, writes, batch_size, seed):
+    """Apply the write mix; returns ``(WAL bytes, seconds)``."""
+    rng = random.Random(seed)
+    cursor.execute("SELECT pg_current_wal_lsn();")
+    start_lsn = cursor.fetchone()[0]
+    started = time.perf_counter()
+    for done in range(0, writes, batch_size):
+        ids = rng.sample(range(1, rows + 1), min(batch_size, writes - done))
+        # Three autosaves per progress update, as the onboarding form does
+        kind = 'progress' if (done // batch_size) % 4 == 3 else 'autosave'
+        cursor.execute(layout[kind], (ids,))
+    seconds = time.perf_counter() - started
+    cursor.execute("SELECT pg_wal_lsn_diff(pg_current_wal_lsn(), %s)::bigint;", (start_lsn,))
+    return cursor.fetchone()[0], seconds
+
+def _latency(cursor, sql, rows, repeat, seed):
+    rng = random.Random(seed)
+    timings = []
+    for _ in range(repeat):
+        uid = f"uid-{rng.randint(1, rows)}"
+        started = time.perf_counter()
+        cursor.execute(sql, (uid,))
+        cursor.fetchall()
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return statistics.median(timings), timings[int(len(timings) * 0.95)]
+
+def run(conn, rows, writes, batch_size, repeat):
+    cursor = conn.cursor()
+    print(f"{'layout':<8}{'WAL MB':>10}{'write s':>10}{'growth MB':>12}{'dead tuples':>14}"
+          f"{'status p50/p95 ms':>20}{'full p50/p95 ms':>18}")
+    for name, layout in LAYOUTS.items():
+        size_before, _ = _table_stats(cursor, layout['tables'])
+        wal, seconds = run_writes(cursor, layout, rows, writes, batch_size, seed=1)
+        size_after, dead = _table_stats(cursor, layout['tables'])
+        status = _latency(cursor, layout['status'], rows, repeat, seed=2)
+        full = _latency(cursor, layout['full'], rows, repeat, seed=2)
+        print(f"{name:<8}{wal / 2 ** 20:>10.1f}{seconds:>10.1f}{(size_after - size_before) / 2 ** 20:>12.1f}"
+              f"{dead:>14,}{status[0]:>11.3f}/{status[1]:<8.3f}{full[0]:>9.3f}/{full[1]:<8.3f}", flush=True)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Wide row vs. hot/cold split: bloat, WAL and read latency.")
+    parser.add_argument('--dsn', required=True, help="Scratch database to build the synthetic tables in")
+    parser.add_argument('--rows', type=int, default=1_000_000, help="Synthetic applications")
+    parser.add_argument('--writes', type=int, default=500_000, help="Row writes per layout")
+    parser.add_argument('--batch-size', type=int, default=1_000, help="Rows per write statement")
+    parser.add_argument('--repeat', type=int, default=2_000, help="Timed reads per query")
+    parser.add_argument('--reuse', action='store_true', help="Reuse existing synthetic tables")
+    parser.add_argument('--keep', action='store_true', help="Keep the synthetic tables afterwards")
+    args = parser.parse_args(argv)
+
+    conn = psycopg2.connect(args.dsn)
+    conn.autocommit = True
+    try:
+        if not args.reuse:
+            build_tables(conn, args.rows)
+        run(conn, args.rows, args.writes, args.batch_size, args.repeat)
+    finally:
+        if not args.keep:
+            conn.cursor().execute(f"DROP TABLE IF EXISTS {WIDE}, {HOT}, {', '.join(SECTIONS.values())};")
+        conn.close()
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,125 @@
+# backend/benchmarks/legacy_validation.py
+"""Reference copies of the hand-written route validation used before the
+compiled step validators, kept only so benchmarks can compare against them.
+
+Each function returns ``(message, error_code)`` for the first failure, or
+None when the payload is valid.
+"""
+
+def validate_step1(step1_data):
+    required_fields = ['fullName', 'dob', 'address', 'email', 'phoneNumber', 'nzResidencyStatus']
+    missing_fields = [field for field in required_fields if not step1_data.get(field)]
+
+    if missing_fields:
+        return f"Missing required fields: {', '.join(missing_fields)}", 'MISSING_REQUIRED_FIELDS'
+
+    valid_statuses = ['citizen', 'permanent_resident', 'temporary_resident', 'work_visa', 'student_visa']
+    if step1_data.get('nzResidencyStatus') not in valid_statuses:
+        return "Invalid residency status", 'INVALID_RESIDENCY_STATUS'
+    return None
+
+def validate_step2(step2_data):
+    required_fields = ['employmentType']
+    missing_fields = [field for field in required_fields if not step2_data.get(field)]
+
+    if missing_fields:
+        return f"Missing required fields: {', '.join(missing_fields)}", 'MISSING_REQUIRED_FIELDS'
+
+    valid_employment_types = ['full_time', 'part_time', 'self_employed', 'contract', 'casual', 'unemployed', 'retired', 'student']
+    if step2_data.get('employmentType') not in valid_employment_types:
+        return "Invalid employment type", 'INVALID_EMPLOYMENT_TYPE'
+
+    if step2_data.get('employmentDuration'):
+        valid_durations = ['less_than_3_months', '3_to_6_months', '6_months_to_1_year', '1_to_2_years', '2_to_5_years', 'more_than_5_years']
+        if step2_data.get('employmentDuration') not in valid_durations:
+            return "Invalid employment duration", 'INVALID_EMPLOYMENT_DURATION'
+
+    employment_type = step2_data.get('employmentType')
+    if employment_type not in ['unemployed', 'retired']:
+        if not step2_data.get('employer'):
+            return "Employer name is required for employed individuals", 'MISSING_EMPLOYER'
+        if not step2_data.get('jobTitle'):
+            return "Job title is required for employed individuals", 'MISSING_JOB_TITLE'
+        if not step2_data.get('employmentDuration'):
+            return "Employment duration is required for employed individuals", 'MISSING_EMPLOYMENT_DURATION'
+        if not step2_data.get('monthlyIncome') or step2_data.get('monthlyIncome') <= 0:
+            return "Monthly income is required and must be greater than 0 for employed individuals", 'INVALID_MONTHLY_INCOME'
+
+    if employment_type in ['unemployed', 'retired']:
+        monthly_income = step2_data.get('monthlyIncome', 0)
+        other_income = step2_data.get('otherIncome', 0)
+        if monthly_income <= 0 and other_income <= 0:
+            return "Please specify your income source. Enter the amount in either monthly income or other income field.", 'NO_INCOME_SPECIFIED'
+    return None
+
+def validate_step3(step3_data):
+    required_fields = ['rent', 'monthlyExpenses', 'debts', 'dependents']
+    missing_fields = []
+
+    for field in required_fields:
+        value = step3_data.get(field)
+        if value is None:
+            missing_fields.append(field)
+
+    if missing_fields:
+        return f"Missing required fields: {', '.join(missing_fields)}", 'MISSING_REQUIRED_FIELDS'
+
+    numeric_fields = ['rent', 'monthlyExpenses', 'debts', 'dependents']
+    for field in numeric_fields:
+        value = step3_data.get(field)
+        if value is not None and not isinstance(value, (int, float)):
+            return f"Field '{field}' must be a number", 'INVALID_FIELD_TYPE'
+
+        if field == 'rent' and value is not None and (value < 0 or value > 10000):
+            return "Rent must be between 0 and 10,000", 'INVALID_RENT_AMOUNT'
+        elif field == 'monthlyExpenses' and value is not None and (value < 0 or value > 20000):
+            return "Monthly expenses must be between 0 and 20,000", 'INVALID_EXPENSES_AMOUNT'
+        elif field == 'debts' and value is not None and (value < 0 or value > 500000):
+            return "Debts must be between 0 and 500,000", 'INVALID_DEBTS_AMOUNT'
+        elif field == 'dependents' and value is not None and (value < 0 or value > 10):
+            return "Dependents must be between 0 and 10", 'INVALID_DEPENDENTS_COUNT'
+    return None
+
+def validate_step5(step5_data):
+    required_fields = ['loanAmount', 'loanPurpose']
+    missing_fields = []
+
+    for field in required_fields:
+        value = step5_data.get(field)
+        if value is None or value == '':
+            missing_fields.append(field)
+
+    if missing_fields:
+        return f"Missing required fields: {', '.join(missing_fields)}", 'MISSING_REQUIRED_FIELDS'
+
+    loan_amount = step5_data.get('loanAmount')
+    if loan_amount is not None:
+        if not isinstance(loan_amount, (int, float)) or loan_amount < 100 or loan_amount > 2000:
+            return "Loan amount must be between $100 and $2,000", 'INVALID_LOAN_AMOUNT'
+
+    declarations = ['understandsTerms', 'canAffordRepayments', 'hasReceivedAdvice']
+    for declaration in declarations:
+        value = step5_data.get(declaration, False)
+        if not value:
+            return f"All responsible lending declarations must be acknowledged", 'MISSING_DECLARATIONS'
+    return None
+
+def validate_step6(step6_data):
+    required_fields = [
+        'identityDocumentName', 'identityDocumentSize', 'identityDocumentType',
+        'addressProofName', 'addressProofSize', 'addressProofType',
+        'incomeProofName', 'incomeProofSize', 'incomeProofType'
+    ]
+    missing_fields = [field for field in required_fields if not step6_data.get(field)]
+
+    if missing_fields:
+        return f"Missing required fields: {', '.join(missing_fields)}", 'MISSING_REQUIRED_FIELDS'
+    return None
+
+LEGACY_VALIDATORS = {
+    1: validate_step1,
+    2: validate_step2,
+    3: validate_step3,
+    5: validate_step5,
+    6: validate_step6,
+}
@@ -0,0 +1,156 @@
+# backend/benchmarks/listing.py
+"""Keyset vs OFFSET page latency for the back-office application listing.
+
+Usage (from the backend directory, against a scratch database):
+
+    python -m benchmarks.listing --dsn postgresql://localhost/bench
+    python -m benchmarks.listing --dsn ... --rows 1000000 --keep
+
+Builds ``bench_onboarding_applications`` (same listing columns as
+``onboarding_applications`` plus wide document-metadata and text columns)
+with ``--rows`` synthetic rows and the indexes from
+migrations/002_onboarding_applications_listing_indexes.sql, then times
+fetching the page at increasing depths for each filter. Keyset pages use
+the cursor of the row just before the page, exactly as the API does; the
+OFFSET column is the same query with ``OFFSET depth`` instead of a cursor.
+"""
+import argparse
+import statistics
+import sys
+import time
+
+import psycopg2
+import psycopg2.extras
+
+from app.services.back_office_service import build_listing_query
+
+TABLE = 'bench_onboarding_applications'
+
+SCHEMA_SQL = f"""
+DROP TABLE IF EXISTS {TABLE};
+CREATE TABLE {TABLE} (
+    id BIGINT PRIMARY KEY,
+    firebase_uid TEXT NOT NULL,
+    full_name TEXT, email TEXT, phone_number TEXT, nz_residency_status TEXT,
+    address TEXT, employment_type TEXT, monthly_income NUMERIC(12, 2),
+    loan_amount NUMERIC(12, 2), loan_purpose TEXT, loan_term TEXT,
+    affordability_outcome TEXT, duplicate_kinds TEXT[],
+    identity_document_name TEXT, identity_document_size INTEGER,
+    identity_document_type TEXT, identity_document_uploaded_at TIMESTAMPTZ,
+    address_proof_name TEXT, address_proof_size INTEGER,
+    address_proof_type TEXT, address_proof_uploaded_at TIMESTAMPTZ,
+    income_proof_name TEXT, income_proof_size INTEGER,
+    income_proof_type TEXT, income_proof_uploaded_at TIMESTAMPTZ,
+    step_completed INTEGER NOT NULL, is_completed BOOLEAN NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL, updated_at TIMESTAMPTZ NOT NULL
+);
+"""
+
+POPULATE_SQL = f"""
+INSERT INTO {TABLE}
+SELECT g, 'uid-' || g, 'Applicant ' || g, 'applicant' || g || '@example.com',
+       '+6421' || lpad((g % 10000000)::text, 7, '0'), 'citizen',
+       repeat('x', 60), 'full_time', 5000 + g % 3000,
+       1000 + g % 20000, 'debt_consolidation', '12_months',
+       (ARRAY['pass', 'refer', 'decline'])[1 + g % 3], NULL,
+       'passport-' || g || '.pdf', 400000 + g % 100000, 'application/pdf', ts,
+       'bill-' || g || '.pdf', 100000 + g % 50000, 'application/pdf', ts,
+       'payslip-' || g || '.png', 800000 + g % 200000, 'image/png', ts,
+       g % 7, g % 7 = 6, ts - interval '1 day', ts
+FROM (
+    SELECT g, now() - (random() * interval '730 days') AS ts
+    FROM generate_series(1, %s) AS g
+) AS rows;
+"""
+
+INDEX_SQL = (
+    f"CREATE INDEX ON {TABLE} (updated_at DESC, id DESC);",
+    f"CREATE INDEX ON {TABLE} (updated_at DESC, id DESC) WHERE is_completed;",
+    f"CREATE INDEX ON {TABLE} (updated_at DESC, id DESC) WHERE NOT is_completed;",
+    f"CREATE INDEX ON {TABLE} (step_completed, updated_at DESC, id DESC);",
+    f"ANALYZE {TABLE};"
+)
+
+FILTERS = {
+    'all': {},
+    'in_progress': {'is_completed': False},
+    'step_3': {'step_completed': 3}
+}
+
+def build_table(conn, rows):
+    cursor = conn.cursor()
+    print(f"Building {TABLE} with {rows:,} rows...", flush=True)
+    started = time.perf_counter()
+    cursor.execute(SCHEMA_SQL)
+    cursor.execute(POPULATE_SQL, (rows,))
+    for sql in INDEX_SQL:
+        cursor.execute(sql)
+    print(f"Built in {time.perf_counter() - started:.1f}s\n")
+
+def _time_query(cursor, sql, params, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        cursor.execute(sql, params)
+        cursor.fetchall()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+def _cursor_before(cursor, filters, depth):
+    """Keyset position of the row at ``depth - 1`` (the end of the previous page)."""
+    if depth == 0:
+        return None
+    sql, params = build_listing_query(filters, None, 0, table=TABLE, sections=False)
+    sql = sql.replace('LIMIT %s;', 'OFFSET %s LIMIT 1;')
+    params[-1] = depth - 1
+    cursor.execute(sql, params)
+    row = cursor.fetchone()
+    return (row['updated_at'], row['id']) if row else None
+
+def run(conn, depths, limit, repeat):
+    cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+    print(f"{'filter':<14}{'depth':>12}{'keyset ms':>12}{'offset ms':>12}")
+    for name, filters in FILTERS.items():
+        for depth in depths:
+            position = _cursor_before(cursor, filters, depth)
+            if depth and position is None:
+                break
+            keyset_sql, keyset_params = build_listing_query(filters, position, limit, table=TABLE, sections=False)
+            offset_sql, offset_params = build_listing_query(filters, None, limit, table=TABLE, sections=False)
+            offset_sql = offset_sql.replace('LIMIT %s;', 'LIMIT %s OFFSET %s;')
+            offset_params.append(depth)
+
+            keyset_ms = _time_query(cursor, keyset_sql, keyset_params, repeat)
+            offset_ms = _time_query(cursor, offset_sql, offset_params, repeat)
+            print(f"{name:<14}{depth:>12,}{keyset_ms:>12.2f}{offset_ms:>12.2f}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Keyset vs OFFSET listing page latency.")
+    parser.add_argument('--dsn', required=True, help="Scratch database to build the synthetic table in")
+    parser.add_argument('--rows', type=int, default=10_000_000, help="Synthetic table size")
+    parser.add_argument('--limit', type=int, default=50, help="Page size")
+    parser.add_argument('--repeat', type=int, default=5, help="Timed runs per query (median reported)")
+    parser.add_argument('--reuse', action='store_true', help="Reuse an existing synthetic table")
+    parser.add_argument('--keep', action='store_true', help="Keep the synthetic table afterwards")
+    args = parser.parse_args(argv)
+
+    depths = [0]
+    depth = 1_000
+    while depth < args.rows:
+        depths.append(depth)
+        depth *= 10
+
+    conn = psycopg2.connect(args.dsn)
+    conn.autocommit = True
+    try:
+        if not args.reuse:
+            build_table(conn, args.rows)
+        run(conn, depths, args.limit, args.repeat)
+    finally:
+        if not args.keep:
+            conn.cursor().execute(f"DROP TABLE IF EXISTS {TABLE};")
+        conn.close()
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
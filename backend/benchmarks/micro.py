@@ -0,0 +1,345 @@
+# backend/benchmarks/micro.py
+"""Micro-benchmarks for the per-request hot helpers.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.micro                          # run and print results
+    python -m benchmarks.micro --save benchmarks/baseline.json
+    python -m benchmarks.micro --compare benchmarks/baseline.json
+    python -m benchmarks.micro --filter responses --repeat 9
+
+Each benchmark is timed with ``timeit`` in auto-ranged batches and the
+fastest and median per-call times are reported in nanoseconds. In compare
+mode a benchmark is flagged when its median moved by more than
+``--threshold`` percent against the baseline file.
+"""
+import argparse
+import json
+import platform
+import queue
+import statistics
+import sys
+import timeit
+from datetime import date, datetime
+from decimal import Decimal
+
+from flask import Flask, current_app
+from flask.json.provider import DefaultJSONProvider
+
+from app.config import Config
+from app.schemas.onboarding_steps import STEP_SCHEMAS
+from app.services.cache_service import CacheService, build_cache_key
+from app.services.history_service import HistoryService
+from app.services.onboarding_service import OnboardingService
+from app.services.quote_service import QuoteService, build_quotes, load_pricing
+from app.utils.json_provider import ApiJSONProvider
+from app.utils.responses import success_response, error_response
+from benchmarks.legacy_validation import LEGACY_VALIDATORS
+
+BENCHMARKS = {}
+
+def benchmark(name):
+    """Register a benchmark factory. The factory returns the callable to time."""
+    def decorator(factory):
+        BENCHMARKS[name] = factory
+        return factory
+    return decorator
+
+# ==========================================================================
+# SAMPLE DATA
+# ==========================================================================
+
+NOW = datetime(2025, 6, 1, 12, 30, 45, 123456)
+
+STEP2_ROW = {
+    'id': 42, 'firebase_uid': 'uid-benchmark',
+    'employment_type': 'full_time', 'employer': 'Acme Ltd', 'job_title': 'Engineer',
+    'employment_duration': '2_to_5_years',
+    'monthly_income': Decimal('5400.00'), 'other_income': Decimal('250.00'),
+    'step_completed': 2, 'is_completed': False, 'created_at': NOW, 'updated_at': NOW
+}
+
+STEP3_ROW = {
+    'id': 42, 'firebase_uid': 'uid-benchmark',
+    'rent': Decimal('1800.00'), 'monthly_expenses': Decimal('950.50'),
+    'debts': Decimal('12000.00'), 'dependents': 2,
+    'step_completed': 3, 'is_completed': False, 'created_at': NOW, 'updated_at': NOW
+}
+
+STEP6_ROW = {
+    'id': 42, 'firebase_uid': 'uid-benchmark',
+    'identity_document_name': 'passport.pdf', 'identity_document_size': 482113,
+    'identity_document_type': 'application/pdf', 'identity_document_uploaded_at': NOW,
+    'address_proof_name': 'power-bill.pdf', 'address_proof_size': 120934,
+    'address_proof_type': 'application/pdf', 'address_proof_uploaded_at': NOW,
+    'income_proof_name': 'payslip.png', 'income_proof_size': 903112,
+    'income_proof_type': 'image/png', 'income_proof_uploaded_at': NOW,
+    'step_completed': 6, 'is_completed': True, 'created_at': NOW, 'updated_at': NOW
+}
+
+VALID_PAYLOADS = {
+    1: {'fullName': 'Aroha Smith', 'dob': '1990-04-17', 'address': '1 Queen St, Auckland',
+        'email': 'aroha@example.com', 'phoneNumber': '+64211234567', 'nzResidencyStatus': 'citizen'},
+    2: {'employmentType': 'full_time', 'employer': 'Acme Ltd', 'jobTitle': 'Engineer',
+        'employmentDuration': '2_to_5_years', 'monthlyIncome': 5400, 'otherIncome': 250},
+    3: {'rent': 1800, 'monthlyExpenses': 950.5, 'debts': 12000, 'dependents': 2},
+    5: {'loanAmount': 1500, 'loanPurpose': 'car_repair', 'loanTerm': '6_months',
+        'understandsTerms': True, 'canAffordRepayments': True, 'hasReceivedAdvice': True},
+    6: {'identityDocumentName': 'passport.pdf', 'identityDocumentSize': 482113, 'identityDocumentType': 'application/pdf',
+        'addressProofName': 'power-bill.pdf', 'addressProofSize': 120934, 'addressProofType': 'application/pdf',
+        'incomeProofName': 'payslip.png', 'incomeProofSize': 903112, 'incomeProofType': 'image/png'},
+}
+
+# Several fields wrong at once: the legacy code stops at the first one
+INVALID_STEP3 = {'rent': -5, 'monthlyExpenses': 'lots', 'debts': 900000, 'dependents': 12}
+
+def _bench_app():
+    """Minimal Flask app so jsonify has an application context."""
+    app = Flask('benchmarks')
+    app.json = ApiJSONProvider(app)
+    return app
+
+def _legacy_step6(row):
+    """Step 6 payload as the routes built it before the JSON provider (converted by hand)."""
+    data = STEP_SCHEMAS[6].to_frontend(row)
+    return {key: value.isoformat() if isinstance(value, datetime) else value for key, value in data.items()}
+
+# Providers only keep a weak reference to their app
+JSON_APP = Flask('benchmarks-json')
+
+def _envelope(data):
+    return {'success': True, 'message': "Step 6 data retrieved successfully",
+            'timestamp': NOW.isoformat(), 'data': data}
+
+# ==========================================================================
+# RESPONSE HELPERS
+# ==========================================================================
+
+@benchmark('responses.success_small')
+def bench_success_small():
+    payload = {'step_completed': 3, 'is_completed': False}
+    return lambda: success_response(payload, "Onboarding status retrieved successfully")
+
+@benchmark('responses.success_step6')
+def bench_success_step6():
+    payload = STEP_SCHEMAS[6].to_frontend(STEP6_ROW)
+    return lambda: success_response(payload, "Step 6 data retrieved successfully")
+
+@benchmark('responses.error')
+def bench_error():
+    return lambda: error_response("Missing required fields: fullName, dob", 400, 'MISSING_REQUIRED_FIELDS')
+
+# ==========================================================================
+# JSON SERIALIZATION (STEP 6 HAS THE MOST DATETIME FIELDS)
+# ==========================================================================
+
+@benchmark('json.step6_flask_default')
+def bench_json_step6_default():
+    dumps = DefaultJSONProvider(JSON_APP).dumps
+    body = _envelope(_legacy_step6(STEP6_ROW))
+    return lambda: dumps(body)
+
+@benchmark('json.step6_provider')
+def bench_json_step6_provider():
+    dumps = ApiJSONProvider(JSON_APP).dumps
+    body = _envelope(STEP_SCHEMAS[6].to_frontend(STEP6_ROW))
+    return lambda: dumps(body)
+
+@benchmark('json.step6_row_to_body_legacy')
+def bench_json_step6_row_legacy():
+    dumps = DefaultJSONProvider(JSON_APP).dumps
+    return lambda: dumps(_envelope(_legacy_step6(STEP6_ROW)))
+
+@benchmark('json.step6_row_to_body_provider')
+def bench_json_step6_row_provider():
+    dumps = ApiJSONProvider(JSON_APP).dumps
+    to_frontend = STEP_SCHEMAS[6].to_frontend
+    return lambda: dumps(_envelope(to_frontend(STEP6_ROW)))
+
+# ==========================================================================
+# ROW -> FRONTEND TRANSFORMS
+# ==========================================================================
+
+@benchmark('transform.step2')
+def bench_transform_step2():
+    return lambda: STEP_SCHEMAS[2].to_frontend(STEP2_ROW)
+
+@benchmark('transform.step3')
+def bench_transform_step3():
+    return lambda: STEP_SCHEMAS[3].to_frontend(STEP3_ROW)
+
+@benchmark('transform.step6')
+def bench_transform_step6():
+    return lambda: STEP_SCHEMAS[6].to_frontend(STEP6_ROW)
+
+@benchmark('service.format_date')
+def bench_format_date():
+    dob = date(1990, 4, 17)
+    return lambda: OnboardingService._format_date_for_frontend(dob)
+
+# ==========================================================================
+# VALIDATION (LEGACY ROUTE CODE VS COMPILED VALIDATORS)
+# ==========================================================================
+
+def _register_validation_benchmarks():
+    for step, payload in VALID_PAYLOADS.items():
+        legacy = LEGACY_VALIDATORS[step]
+        compiled = STEP_SCHEMAS[step].validate
+        benchmark(f'validate.legacy_step{step}')(lambda legacy=legacy, payload=payload: lambda: legacy(payload))
+        benchmark(f'validate.compiled_step{step}')(lambda compiled=compiled, payload=payload: lambda: compiled(payload))
+
+_register_validation_benchmarks()
+
+@benchmark('validate.legacy_step3_invalid')
+def bench_legacy_step3_invalid():
+    return lambda: LEGACY_VALIDATORS[3](INVALID_STEP3)
+
+@benchmark('validate.compiled_step3_invalid')
+def bench_compiled_step3_invalid():
+    validate = STEP_SCHEMAS[3].validate
+    return lambda: validate(INVALID_STEP3)
+
+# ==========================================================================
+# CACHE
+# ==========================================================================
+
+def _cached_target():
+    pass
+
+@benchmark('cache.build_key')
+def bench_build_key():
+    args = ('uid-benchmark', 3)
+    kwargs = {'include_documents': True}
+    return lambda: build_cache_key('onboarding', _cached_target, args, kwargs)
+
+@benchmark('cache.encode_step6')
+def bench_cache_encode():
+    return lambda: CacheService._encode(STEP6_ROW)
+
+@benchmark('cache.decode_step6')
+def bench_cache_decode():
+    encoded = CacheService._encode(STEP6_ROW)
+    return lambda: CacheService._decode(encoded)
+
+# ==========================================================================
+# REPAYMENT QUOTES (COMPUTED PER REQUEST VS GRID LOOKUP)
+# ==========================================================================
+
+def _quote_config():
+    current_app.config.update({key: getattr(Config, key) for key in dir(Config) if key.startswith('QUOTE_')})
+
+@benchmark('quote.compute_one')
+def bench_quote_compute_one():
+    _quote_config()
+    pricing = load_pricing(current_app.config)
+    weeks = Config.QUOTE_TERM_WEEKS[0]
+    return lambda: build_quotes([75000], weeks, pricing)
+
+@benchmark('quote.grid_lookup')
+def bench_quote_grid_lookup():
+    _quote_config()
+    QuoteService.quote(750)
+    return lambda: QuoteService.quote(750, '8 weeks')
+
+# ==========================================================================
+# HISTORY (WORK ADDED TO A STEP SAVE)
+# ==========================================================================
+
+@benchmark('history.record_step6')
+def bench_history_record():
+    current_app.config['HISTORY_ENABLED'] = True
+    HistoryService._queue = entries = queue.Queue()
+    columns = STEP_SCHEMAS[6].columns
+
+    def record():
+        HistoryService.record('uid-benchmark', 6, 'submit', NOW, {column: STEP6_ROW[column] for column in columns})
+        entries.get_nowait()  # Stands in for the writer so the queue stays empty
+    return record
+
+# ==========================================================================
+# RUNNER
+# ==========================================================================
+
+def _time(func, repeat):
+    """Return per-call timings in nanoseconds for ``repeat`` auto-ranged batches."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return [t / number * 1e9 for t in timer.repeat(repeat=repeat, number=number)]
+
+def run(names, repeat):
+    results = {}
+    app = _bench_app()
+    with app.app_context():
+        for name in names:
+            func = BENCHMARKS[name]()
+            timings = _time(func, repeat)
+            results[name] = {
+                'min_ns': round(min(timings), 1),
+                'median_ns': round(statistics.median(timings), 1)
+            }
+    return results
+
+def _print_results(results, baseline=None, threshold=5.0):
+    header = f"{'benchmark':<32}{'min (ns)':>12}{'median (ns)':>14}{'ops/s':>12}"
+    if baseline is not None:
+        header += f"{'baseline':>12}{'change':>10}"
+    print(header)
+    print('-' * len(header))
+
+    regressions = 0
+    for name, result in results.items():
+        ops = 1e9 / result['median_ns']
+        line = f"{name:<32}{result['min_ns']:>12.1f}{result['median_ns']:>14.1f}{ops:>12,.0f}"
+        if baseline is not None:
+            base = baseline.get(name)
+            if base:
+                change = (result['median_ns'] - base['median_ns']) / base['median_ns'] * 100
+                marker = ''
+                if change > threshold:
+                    marker = ' !'
+                    regressions += 1
+                elif change < -threshold:
+                    marker = ' *'
+                line += f"{base['median_ns']:>12.1f}{change:>+9.1f}%{marker}"
+            else:
+                line += f"{'-':>12}{'new':>10}"
+        print(line)
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Micro-benchmarks for per-request hot helpers.")
+    parser.add_argument('--filter', default='', help="Only run benchmarks whose name contains this text")
+    parser.add_argument('--repeat', type=int, default=7, help="Number of timed batches per benchmark")
+    parser.add_argument('--save', metavar='PATH', help="Write results to a baseline JSON file")
+    parser.add_argument('--compare', metavar='PATH', help="Compare results against a baseline JSON file")
+    parser.add_argument('--threshold', type=float, default=5.0, help="Percent change flagged in compare mode")
+    args = parser.parse_args(argv)
+
+    names = [name for name in BENCHMARKS if args.filter in name]
+    results = run(names, args.repeat)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+
+    regressions = _print_results(results, baseline, args.threshold)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({
+                'python': platform.python_version(),
+                'machine': platform.machine(),
+                'recorded_at': datetime.utcnow().isoformat(),
+                'results': results
+            }, f, indent=2)
+            f.write('\n')
+        print(f"\nResults saved to {args.save}")
+
+    if baseline is not None:
+        print(f"\n{regressions} benchmark(s) slower than baseline by more than {args.threshold}%")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
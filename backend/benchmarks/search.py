@@ -0,0 +1,153 @@
+# backend/benchmarks/search.py
+"""Back-office search latency: trigram GIN indexes vs. a plain ILIKE scan.
+
+Usage (from the backend directory, against a scratch database where
+pg_trgm can be created):
+
+    python -m benchmarks.search --dsn postgresql://localhost/bench
+    python -m benchmarks.search --dsn ... --rows 5000000 --keep
+
+Builds ``bench_search_applications`` (the listing columns plus address and
+document-name columns) with ``--rows`` synthetic applicants whose
+names, streets and cities come from the synthetic applicant generator, and
+the indexes from migrations/007_onboarding_applications_search_indexes.sql.
+Each term is then searched exactly as the API does, timed with the indexes
+and again with index scans disabled (the naive ``ILIKE '%...%'`` plan).
+Terms range from rare (one applicant's email) to very common (a surname
+shared by a tenth of the table, which hits the candidate cap).
+"""
+import argparse
+import statistics
+import sys
+import time
+
+import psycopg2
+import psycopg2.extras
+
+from app.services.back_office_service import SEARCH_CANDIDATES, build_search_query
+from app.utils.synthetic_applicants import CITIES, FIRST_NAMES, LAST_NAMES
+
+TABLE = 'bench_search_applications'
+
+TARGET_MS = 50
+
+def _array(values):
+    return "ARRAY[" + ', '.join(f"'{value}'" for value in values) + "]"
+
+SCHEMA_SQL = f"""
+DROP TABLE IF EXISTS {TABLE};
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE TABLE {TABLE} (
+    id BIGINT PRIMARY KEY,
+    firebase_uid TEXT NOT NULL,
+    full_name TEXT, email TEXT, phone_number TEXT, nz_residency_status TEXT,
+    address TEXT, employment_type TEXT, monthly_income NUMERIC(12, 2),
+    loan_amount NUMERIC(12, 2), loan_purpose TEXT, loan_term TEXT,
+    affordability_outcome TEXT, duplicate_kinds TEXT[],
+    identity_document_name TEXT, address_proof_name TEXT, income_proof_name TEXT,
+    step_completed INTEGER NOT NULL, is_completed BOOLEAN NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL, updated_at TIMESTAMPTZ NOT NULL
+);
+"""
+
+# Surnames get a numbered suffix on most rows so names are not all alike
+POPULATE_SQL = f"""
+INSERT INTO {TABLE}
+SELECT g, 'uid-' || g, first || ' ' || last, lower(first) || '.' || lower(last) || '.' || g || '@example.com',
+       '+6421' || lpad((g % 10000000)::text, 7, '0'), 'citizen',
+       (g % 999 + 1) || ' ' || street || ' Street, ' || city,
+       'full_time', 5000 + g % 3000, 1000 + g % 20000, 'debt_consolidation', '12 weeks',
+       NULL, NULL, 'passport-' || g || '.pdf', 'bill-' || g || '.pdf', 'payslip-' || g || '.png',
+       g % 7, g % 7 = 6, ts - interval '1 day', ts
+FROM (
+    SELECT g, now() - (random() * interval '730 days') AS ts,
+           ({_array(FIRST_NAMES)})[1 + g % {len(FIRST_NAMES)}] AS first,
+           ({_array(LAST_NAMES)})[1 + (g / 7) % {len(LAST_NAMES)}]
+               || CASE WHEN g % 10 = 0 THEN '' ELSE '-' || to_hex(g % 65521) END AS last,
+           ({_array(LAST_NAMES)})[1 + (g / 3) % {len(LAST_NAMES)}] || to_hex(g % 4093) AS street,
+           ({_array(CITIES)})[1 + g % {len(CITIES)}] AS city
+    FROM generate_series(1, %s) AS g
+) AS rows;
+"""
+
+INDEX_SQL = (
+    f"CREATE INDEX ON {TABLE} USING gin (full_name gin_trgm_ops);",
+    f"CREATE INDEX ON {TABLE} USING gin (email gin_trgm_ops);",
+    f"CREATE INDEX ON {TABLE} USING gin (address gin_trgm_ops);",
+    f"ANALYZE {TABLE};"
+)
+
+def search_terms(rows):
+    """``(label, text, fields)`` from rare to very common."""
+    row = rows // 2 + 1
+    return [
+        ('exact email', f".{row}@example", ['email']),
+        ('partial name', f"Smith-{row % 65521:x}"[:9], None),
+        ('street', f"{LAST_NAMES[1]}{row % 4093:x} Street", ['address']),
+        ('common surname', LAST_NAMES[0], None),
+        ('city', CITIES[2], ['address']),
+    ]
+
+def build_table(conn, rows):
+    cursor = conn.cursor()
+    print(f"Building {TABLE} with {rows:,} rows...", flush=True)
+    started = time.perf_counter()
+    cursor.execute(SCHEMA_SQL)
+    cursor.execute(POPULATE_SQL, (rows,))
+    for sql in INDEX_SQL:
+        cursor.execute(sql)
+    print(f"Built in {time.perf_counter() - started:.1f}s\n")
+
+def _time_query(cursor, sql, params, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), rows
+
+def run(conn, rows, limit, repeat, scan_repeat):
+    cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+    print(f"{'term':<16}{'query':<22}{'hits':>6}{'indexed ms':>12}{'scan ms':>10}")
+    slowest = 0
+    for label, text, fields in search_terms(rows):
+        sql, params = build_search_query(text, fields, limit, table=TABLE, sections=False)
+        indexed_ms, results = _time_query(cursor, sql, params, repeat)
+        slowest = max(slowest, indexed_ms)
+
+        cursor.execute("SET enable_bitmapscan = off; SET enable_indexscan = off;")
+        scan_ms, _ = _time_query(cursor, sql, params, scan_repeat)
+        cursor.execute("RESET enable_bitmapscan; RESET enable_indexscan;")
+
+        total = results[0]['total'] if results else 0
+        hits = f"{SEARCH_CANDIDATES}+" if total > SEARCH_CANDIDATES else total
+        print(f"{label:<16}{text[:20]:<22}{hits!s:>6}{indexed_ms:>12.2f}{scan_ms:>10.1f}")
+    verdict = 'within' if slowest < TARGET_MS else 'OVER'
+    print(f"\nSlowest indexed search {slowest:.2f} ms ({verdict} the {TARGET_MS} ms target)")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Back-office search latency.")
+    parser.add_argument('--dsn', required=True, help="Scratch database to build the synthetic table in")
+    parser.add_argument('--rows', type=int, default=2_000_000, help="Synthetic table size")
+    parser.add_argument('--limit', type=int, default=20, help="Results per search")
+    parser.add_argument('--repeat', type=int, default=5, help="Timed runs per indexed search (median reported)")
+    parser.add_argument('--scan-repeat', type=int, default=1, help="Timed runs per full-scan search")
+    parser.add_argument('--reuse', action='store_true', help="Reuse an existing synthetic table")
+    parser.add_argument('--keep', action='store_true', help="Keep the synthetic table afterwards")
+    args = parser.parse_args(argv)
+
+    conn = psycopg2.connect(args.dsn)
+    conn.autocommit = True
+    try:
+        if not args.reuse:
+            build_table(conn, args.rows)
+        run(conn, args.rows, args.limit, args.repeat, args.scan_repeat)
+    finally:
+        if not args.keep:
+            conn.cursor().execute(f"DROP TABLE IF EXISTS {TABLE};")
+        conn.close()
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,17 @@
+-- Announce every change to onboarding_applications on the
+-- onboarding_applications_changed channel (payload: firebase_uid) so each
+-- app worker can invalidate its caches, whoever made the write.
+-- NOTIFY collapses identical payloads within a transaction.
+
+CREATE OR REPLACE FUNCTION notify_onboarding_application_change() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('onboarding_applications_changed', COALESCE(NEW.firebase_uid, OLD.firebase_uid));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS onboarding_applications_notify ON onboarding_applications;
+
+CREATE TRIGGER onboarding_applications_notify
+    AFTER INSERT OR UPDATE OR DELETE ON onboarding_applications
+    FOR EACH ROW EXECUTE FUNCTION notify_onboarding_application_change();
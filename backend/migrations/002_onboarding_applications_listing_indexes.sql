@@ -0,0 +1,22 @@
+-- Indexes backing the back-office listing (GET /api/back-office/applications).
+-- Every page is ORDER BY updated_at DESC, id DESC with a keyset predicate
+-- (updated_at, id) < (cursor), so each filter combination needs an index
+-- whose leading columns match its equality filters and end in (updated_at, id).
+-- CONCURRENTLY cannot run inside a transaction: apply with plain psql.
+
+-- No filter, or only an updated_at range
+CREATE INDEX CONCURRENTLY IF NOT EXISTS onboarding_applications_updated_idx
+    ON onboarding_applications (updated_at DESC, id DESC);
+
+-- is_completed filter: partial indexes hold only the matching rows
+CREATE INDEX CONCURRENTLY IF NOT EXISTS onboarding_applications_completed_updated_idx
+    ON onboarding_applications (updated_at DESC, id DESC)
+    WHERE is_completed;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS onboarding_applications_in_progress_updated_idx
+    ON onboarding_applications (updated_at DESC, id DESC)
+    WHERE NOT is_completed;
+
+-- step_completed filter (alone or with is_completed)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS onboarding_applications_step_updated_idx
+    ON onboarding_applications (step_completed, updated_at DESC, id DESC);
@@ -0,0 +1,14 @@
+-- Let bulk imports skip the per-row change notification from 001.
+-- The importer sets terepay.bulk_import = 'on' for its own transaction
+-- (SET LOCAL) and drops every cached version stamp after it commits,
+-- instead of NOTIFYing each of possibly millions of rows.
+
+CREATE OR REPLACE FUNCTION notify_onboarding_application_change() RETURNS trigger AS $$
+BEGIN
+    IF current_setting('terepay.bulk_import', true) = 'on' THEN
+        RETURN NULL;
+    END IF;
+    PERFORM pg_notify('onboarding_applications_changed', COALESCE(NEW.firebase_uid, OLD.firebase_uid));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
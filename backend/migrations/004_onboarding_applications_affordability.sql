@@ -0,0 +1,10 @@
+-- Affordability pre-assessment results (app/services/affordability_service.py).
+-- Written when Step 5 is saved and by `flask rescore-affordability`;
+-- never part of updated_at.
+
+ALTER TABLE onboarding_applications
+    ADD COLUMN IF NOT EXISTS affordability_outcome TEXT,
+    ADD COLUMN IF NOT EXISTS affordability_surplus NUMERIC(12, 2),
+    ADD COLUMN IF NOT EXISTS affordability_ratio NUMERIC(10, 4),
+    ADD COLUMN IF NOT EXISTS affordability_policy TEXT,
+    ADD COLUMN IF NOT EXISTS affordability_assessed_at TIMESTAMPTZ;
@@ -0,0 +1,27 @@
+-- Checkpoints for partitioned batch jobs (app/services/batch_job_service.py).
+-- A run records its job, parameters and id range; each partition is
+-- recorded in the same transaction as its updates, so a resumed run
+-- (`--resume RUN_ID`) skips exactly the partitions already applied.
+
+CREATE TABLE IF NOT EXISTS batch_job_runs (
+    run_id TEXT PRIMARY KEY,
+    job TEXT NOT NULL,
+    params JSONB NOT NULL,
+    min_id BIGINT,
+    max_id BIGINT,
+    partition_size BIGINT NOT NULL,
+    partitions INTEGER NOT NULL,
+    started_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    finished_at TIMESTAMPTZ
+);
+
+CREATE TABLE IF NOT EXISTS batch_job_partitions (
+    run_id TEXT NOT NULL REFERENCES batch_job_runs (run_id) ON DELETE CASCADE,
+    partition_start BIGINT NOT NULL,
+    partition_end BIGINT NOT NULL,
+    rows INTEGER NOT NULL,
+    updated INTEGER NOT NULL,
+    seconds REAL NOT NULL,
+    finished_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (run_id, partition_start)
+);
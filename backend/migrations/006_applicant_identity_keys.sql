@@ -0,0 +1,29 @@
+-- Duplicate applicant detection (app/services/duplicate_service.py).
+-- Hashed, normalized Step 1 identity keys (email, phone, IRD number), one
+-- row per application and key; a Step 1 save probes the primary key for
+-- other accounts holding the same keys. `flask cluster-duplicates`
+-- rebuilds the keys and sets duplicate_cluster (lowest application id in
+-- each group of linked applications).
+
+CREATE TABLE IF NOT EXISTS applicant_identity_keys (
+    id BIGSERIAL NOT NULL,
+    kind TEXT NOT NULL,
+    key_hash BYTEA NOT NULL,
+    firebase_uid TEXT NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (kind, key_hash, firebase_uid)
+);
+
+CREATE INDEX IF NOT EXISTS applicant_identity_keys_firebase_uid_idx
+    ON applicant_identity_keys (firebase_uid);
+
+-- Bloom filter refreshes read new keys by id
+CREATE INDEX IF NOT EXISTS applicant_identity_keys_id_idx
+    ON applicant_identity_keys (id);
+
+ALTER TABLE onboarding_applications
+    ADD COLUMN IF NOT EXISTS duplicate_kinds TEXT[],
+    ADD COLUMN IF NOT EXISTS duplicate_cluster BIGINT;
+
+CREATE INDEX IF NOT EXISTS onboarding_applications_duplicate_cluster_idx
+    ON onboarding_applications (duplicate_cluster) WHERE duplicate_cluster IS NOT NULL;
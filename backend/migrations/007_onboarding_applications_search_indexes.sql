@@ -0,0 +1,27 @@
+-- Trigram indexes for the back-office search (GET /api/back-office/applications/search).
+-- Each searchable column gets a pg_trgm GIN index, so a substring match
+-- (column ILIKE '%term%') is an index lookup; the search ORs the columns as
+-- a bitmap and ranks matches with word_similarity().
+-- CONCURRENTLY cannot run inside a transaction: apply with plain psql.
+-- After 008 these columns live in onboarding_personal, which 008 indexes,
+-- so the psql \if below skips the indexes on a re-run.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+SELECT EXISTS (
+    SELECT 1 FROM information_schema.columns
+    WHERE table_name = 'onboarding_applications' AND column_name = 'full_name'
+) AS wide_layout \gset
+
+\if :wide_layout
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS onboarding_applications_full_name_trgm_idx
+    ON onboarding_applications USING gin (full_name gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS onboarding_applications_email_trgm_idx
+    ON onboarding_applications USING gin (email gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS onboarding_applications_address_trgm_idx
+    ON onboarding_applications USING gin (address gin_trgm_ops);
+
+\endif
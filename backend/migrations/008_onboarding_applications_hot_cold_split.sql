@@ -0,0 +1,204 @@
+-- Vertical split of onboarding_applications into hot and cold tables
+-- (app/schemas/onboarding_steps.py).
+-- Every autosave and status change used to rewrite the whole wide row
+-- (~50 columns), so each save left a full-width dead tuple and WAL record.
+-- onboarding_applications keeps only the hot columns (progress, status,
+-- affordability and duplicate results); each step's fields move to a
+-- section table keyed by application_id, written only when that step is
+-- saved. onboarding_applications_wide joins them back for readers
+-- (exports, back office, batch jobs).
+--
+-- Runs in one transaction and takes an ACCESS EXCLUSIVE lock on
+-- onboarding_applications while rows are copied: apply it in a
+-- maintenance window. DROP COLUMN only hides the moved columns, so
+-- reclaim the space afterwards with VACUUM FULL onboarding_applications
+-- (or pg_repack to avoid the lock). The 007 trigram indexes are rebuilt
+-- on onboarding_personal.
+
+BEGIN;
+
+DO $$
+BEGIN
+    -- Already split: nothing to move
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'onboarding_applications' AND column_name = 'full_name'
+    ) THEN
+        RETURN;
+    END IF;
+
+    LOCK TABLE onboarding_applications IN ACCESS EXCLUSIVE MODE;
+    DROP VIEW IF EXISTS onboarding_applications_wide;
+
+    -- Step 1: personal information
+    CREATE TABLE onboarding_personal AS
+        SELECT id AS application_id, full_name, date_of_birth, address, email, phone_number,
+               nz_residency_status, tax_number
+        FROM onboarding_applications
+        WHERE num_nonnulls(full_name, date_of_birth, address, email, phone_number,
+                           nz_residency_status, tax_number) > 0;
+
+    -- Step 2: employment and income
+    CREATE TABLE onboarding_employment AS
+        SELECT id AS application_id, employment_type, employer, job_title, employment_duration,
+               monthly_income, other_income
+        FROM onboarding_applications
+        WHERE num_nonnulls(employment_type, employer, job_title, employment_duration,
+                           monthly_income) > 0;
+
+    -- Step 3: expenses and obligations
+    CREATE TABLE onboarding_expenses AS
+        SELECT id AS application_id, rent, monthly_expenses, debts, dependents
+        FROM onboarding_applications
+        WHERE num_nonnulls(rent, monthly_expenses, debts, dependents) > 0;
+
+    -- Step 4: assets and financial profile
+    CREATE TABLE onboarding_assets AS
+        SELECT id AS application_id, savings, assets, source_of_funds, expected_account_activity,
+               is_politically_exposed
+        FROM onboarding_applications
+        WHERE num_nonnulls(savings, assets, source_of_funds, expected_account_activity) > 0;
+
+    -- Step 5: loan request
+    CREATE TABLE onboarding_loan AS
+        SELECT id AS application_id, loan_amount, loan_purpose, loan_term, understands_terms,
+               can_afford_repayments, has_received_advice
+        FROM onboarding_applications
+        WHERE num_nonnulls(loan_amount, loan_purpose, loan_term) > 0;
+
+    -- Step 6: document metadata
+    CREATE TABLE onboarding_documents AS
+        SELECT id AS application_id,
+               identity_document_name, identity_document_size, identity_document_type,
+               identity_document_uploaded_at,
+               address_proof_name, address_proof_size, address_proof_type, address_proof_uploaded_at,
+               income_proof_name, income_proof_size, income_proof_type, income_proof_uploaded_at
+        FROM onboarding_applications
+        WHERE num_nonnulls(identity_document_name, address_proof_name, income_proof_name) > 0;
+
+    ALTER TABLE onboarding_applications
+        DROP COLUMN full_name, DROP COLUMN date_of_birth, DROP COLUMN address, DROP COLUMN email,
+        DROP COLUMN phone_number, DROP COLUMN nz_residency_status, DROP COLUMN tax_number,
+        DROP COLUMN employment_type, DROP COLUMN employer, DROP COLUMN job_title,
+        DROP COLUMN employment_duration, DROP COLUMN monthly_income, DROP COLUMN other_income,
+        DROP COLUMN rent, DROP COLUMN monthly_expenses, DROP COLUMN debts, DROP COLUMN dependents,
+        DROP COLUMN savings, DROP COLUMN assets, DROP COLUMN source_of_funds,
+        DROP COLUMN expected_account_activity, DROP COLUMN is_politically_exposed,
+        DROP COLUMN loan_amount, DROP COLUMN loan_purpose, DROP COLUMN loan_term,
+        DROP COLUMN understands_terms, DROP COLUMN can_afford_repayments, DROP COLUMN has_received_advice,
+        DROP COLUMN identity_document_name, DROP COLUMN identity_document_size,
+        DROP COLUMN identity_document_type, DROP COLUMN identity_document_uploaded_at,
+        DROP COLUMN address_proof_name, DROP COLUMN address_proof_size,
+        DROP COLUMN address_proof_type, DROP COLUMN address_proof_uploaded_at,
+        DROP COLUMN income_proof_name, DROP COLUMN income_proof_size,
+        DROP COLUMN income_proof_type, DROP COLUMN income_proof_uploaded_at;
+END;
+$$;
+
+-- Keys, cascades and fillfactor. Section rows have no index besides the
+-- primary key, so the spare page space lets re-saves be HOT updates.
+DO $$
+DECLARE
+    section TEXT;
+BEGIN
+    FOREACH section IN ARRAY ARRAY[
+        'onboarding_personal', 'onboarding_employment', 'onboarding_expenses',
+        'onboarding_assets', 'onboarding_loan', 'onboarding_documents'
+    ] LOOP
+        IF NOT EXISTS (
+            SELECT 1 FROM pg_constraint WHERE conrelid = section::regclass AND contype = 'p'
+        ) THEN
+            EXECUTE format('ALTER TABLE %I ADD PRIMARY KEY (application_id)', section);
+            EXECUTE format(
+                'ALTER TABLE %I ADD FOREIGN KEY (application_id) '
+                'REFERENCES onboarding_applications (id) ON DELETE CASCADE',
+                section
+            );
+        END IF;
+        EXECUTE format('ALTER TABLE %I SET (fillfactor = 90)', section);
+        EXECUTE format('ANALYZE %I', section);
+    END LOOP;
+END;
+$$;
+
+-- Change notifications (001/003) for writes that touch only a section.
+-- A step save writes the hot row too; NOTIFY collapses the duplicate.
+-- Section rows deleted by the hot row's cascade find no uid: the hot
+-- row's own trigger has already announced the change.
+CREATE OR REPLACE FUNCTION notify_onboarding_section_change() RETURNS trigger AS $$
+DECLARE
+    uid TEXT;
+BEGIN
+    IF current_setting('terepay.bulk_import', true) = 'on' THEN
+        RETURN NULL;
+    END IF;
+    SELECT firebase_uid INTO uid FROM onboarding_applications
+    WHERE id = COALESCE(NEW.application_id, OLD.application_id);
+    IF uid IS NOT NULL THEN
+        PERFORM pg_notify('onboarding_applications_changed', uid);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+DECLARE
+    section TEXT;
+BEGIN
+    FOREACH section IN ARRAY ARRAY[
+        'onboarding_personal', 'onboarding_employment', 'onboarding_expenses',
+        'onboarding_assets', 'onboarding_loan', 'onboarding_documents'
+    ] LOOP
+        EXECUTE format('DROP TRIGGER IF EXISTS %I ON %I', section || '_notify', section);
+        EXECUTE format(
+            'CREATE TRIGGER %I AFTER INSERT OR UPDATE OR DELETE ON %I '
+            'FOR EACH ROW EXECUTE FUNCTION notify_onboarding_section_change()',
+            section || '_notify', section
+        );
+    END LOOP;
+END;
+$$;
+
+-- Search indexes (007) follow the columns into the personal section
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS onboarding_personal_full_name_trgm_idx
+    ON onboarding_personal USING gin (full_name gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS onboarding_personal_email_trgm_idx
+    ON onboarding_personal USING gin (email gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS onboarding_personal_address_trgm_idx
+    ON onboarding_personal USING gin (address gin_trgm_ops);
+
+-- The original wide shape, for readers
+CREATE OR REPLACE VIEW onboarding_applications_wide AS
+    SELECT a.id, a.firebase_uid,
+           p.full_name, p.date_of_birth, p.address, p.email, p.phone_number,
+           p.nz_residency_status, p.tax_number,
+           e.employment_type, e.employer, e.job_title, e.employment_duration,
+           e.monthly_income, e.other_income,
+           x.rent, x.monthly_expenses, x.debts, x.dependents,
+           s.savings, s.assets, s.source_of_funds, s.expected_account_activity,
+           s.is_politically_exposed,
+           l.loan_amount, l.loan_purpose, l.loan_term, l.understands_terms,
+           l.can_afford_repayments, l.has_received_advice,
+           d.identity_document_name, d.identity_document_size, d.identity_document_type,
+           d.identity_document_uploaded_at,
+           d.address_proof_name, d.address_proof_size, d.address_proof_type,
+           d.address_proof_uploaded_at,
+           d.income_proof_name, d.income_proof_size, d.income_proof_type,
+           d.income_proof_uploaded_at,
+           a.step_completed, a.is_completed, a.created_at, a.updated_at,
+           a.affordability_outcome, a.affordability_surplus, a.affordability_ratio,
+           a.affordability_policy, a.affordability_assessed_at,
+           a.duplicate_kinds, a.duplicate_cluster
+    FROM onboarding_applications a
+    LEFT JOIN onboarding_personal p ON p.application_id = a.id
+    LEFT JOIN onboarding_employment e ON e.application_id = a.id
+    LEFT JOIN onboarding_expenses x ON x.application_id = a.id
+    LEFT JOIN onboarding_assets s ON s.application_id = a.id
+    LEFT JOIN onboarding_loan l ON l.application_id = a.id
+    LEFT JOIN onboarding_documents d ON d.application_id = a.id;
+
+COMMIT;
@@ -0,0 +1,34 @@
+-- Application archival (app/services/archive_service.py).
+-- `flask archive-applications` moves completed applications and abandoned
+-- drafts past their age limits out of onboarding_applications (and its
+-- section tables) in small batches. Each archived application is its
+-- onboarding_applications_wide row as JSONB, so the archive survives
+-- later column changes. Partitions are monthly by archived_at and are
+-- created by the command as needed; old months can be detached or dropped
+-- whole.
+-- onboarding_table_sizes holds snapshots of table and index sizes taken
+-- after every archive run and by `flask record-table-sizes`.
+
+CREATE TABLE IF NOT EXISTS onboarding_applications_archive (
+    application_id BIGINT NOT NULL,
+    firebase_uid TEXT NOT NULL,
+    reason TEXT NOT NULL,
+    archived_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    application JSONB NOT NULL,
+    PRIMARY KEY (application_id, archived_at)
+) PARTITION BY RANGE (archived_at);
+
+-- Read fallback: a user's latest archived application
+CREATE INDEX IF NOT EXISTS onboarding_applications_archive_firebase_uid_idx
+    ON onboarding_applications_archive (firebase_uid, archived_at DESC);
+
+CREATE TABLE IF NOT EXISTS onboarding_table_sizes (
+    captured_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    relation TEXT NOT NULL,
+    table_name TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    bytes BIGINT NOT NULL,
+    live_rows BIGINT,
+    dead_rows BIGINT,
+    PRIMARY KEY (captured_at, relation)
+);
@@ -0,0 +1,32 @@
+-- Append-only history of onboarding submissions (app/services/history_service.py).
+-- One row per step save or PATCH with the values it wrote, inserted in
+-- batches by each worker's background writer. Partitions are monthly by
+-- changed_at and are created by the writer as needed; retention is
+-- detaching or dropping whole months, never DELETE.
+
+CREATE TABLE IF NOT EXISTS onboarding_application_history (
+    id BIGSERIAL NOT NULL,
+    firebase_uid TEXT NOT NULL,
+    step INTEGER NOT NULL,
+    source TEXT NOT NULL,
+    changed_at TIMESTAMPTZ NOT NULL,
+    recorded_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    data JSONB NOT NULL,
+    PRIMARY KEY (id, changed_at)
+) PARTITION BY RANGE (changed_at);
+
+CREATE INDEX IF NOT EXISTS onboarding_application_history_firebase_uid_idx
+    ON onboarding_application_history (firebase_uid, changed_at DESC);
+
+-- Entries are never changed once written
+CREATE OR REPLACE FUNCTION reject_onboarding_history_change() RETURNS trigger AS $$
+BEGIN
+    RAISE EXCEPTION 'onboarding_application_history is append-only';
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS onboarding_application_history_append_only ON onboarding_application_history;
+
+CREATE TRIGGER onboarding_application_history_append_only
+    BEFORE UPDATE OR DELETE ON onboarding_application_history
+    FOR EACH ROW EXECUTE FUNCTION reject_onboarding_history_change();
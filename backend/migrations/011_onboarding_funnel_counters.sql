@@ -0,0 +1,116 @@
+-- Incrementally maintained onboarding funnel (app/services/funnel_service.py).
+-- onboarding_funnel_counters holds how many applications sit at each
+-- (step_completed, is_completed) and, per step, how many timed
+-- transitions reached it and their total seconds. Statement-level
+-- triggers apply each statement's changes as aggregated deltas, so a
+-- step save touches one or two counter rows, an autosave none, and a bulk
+-- import one row per bucket rather than per application. Counters are
+-- spread over 16 shards (application id % 16) so concurrent transitions
+-- rarely wait on the same row; readers sum at most 16 x 7 x 2 rows.
+-- Deleted (archived) applications stay counted. `flask rebuild-funnel`
+-- recounts from the live and archived rows.
+-- Runs in one transaction that blocks writes to onboarding_applications
+-- until the counts are seeded (one scan of the table).
+
+BEGIN;
+
+ALTER TABLE onboarding_applications
+    ADD COLUMN IF NOT EXISTS step_reached_at TIMESTAMPTZ;
+
+CREATE TABLE IF NOT EXISTS onboarding_funnel_counters (
+    shard SMALLINT NOT NULL,
+    step_completed INTEGER NOT NULL,
+    is_completed BOOLEAN NOT NULL,
+    applications BIGINT NOT NULL DEFAULT 0,
+    transitions BIGINT NOT NULL DEFAULT 0,
+    transition_seconds DOUBLE PRECISION NOT NULL DEFAULT 0,
+    PRIMARY KEY (shard, step_completed, is_completed)
+);
+
+-- When the current step was reached; a transition's time is measured from it
+CREATE OR REPLACE FUNCTION stamp_onboarding_step_reached() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' OR NEW.step_completed > OLD.step_completed THEN
+        NEW.step_reached_at := COALESCE(NEW.updated_at, CURRENT_TIMESTAMP);
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS onboarding_applications_step_reached ON onboarding_applications;
+
+CREATE TRIGGER onboarding_applications_step_reached
+    BEFORE INSERT OR UPDATE OF step_completed ON onboarding_applications
+    FOR EACH ROW EXECUTE FUNCTION stamp_onboarding_step_reached();
+
+CREATE OR REPLACE FUNCTION count_onboarding_funnel_inserts() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO onboarding_funnel_counters AS c (shard, step_completed, is_completed, applications)
+    SELECT id % 16, step_completed, is_completed, count(*)
+    FROM new_rows GROUP BY 1, 2, 3 ORDER BY 1, 2, 3
+    ON CONFLICT (shard, step_completed, is_completed)
+    DO UPDATE SET applications = c.applications + EXCLUDED.applications;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Rows leave their old bucket and join the new one. Step and completion
+-- only ever move forward, so buckets are locked in a consistent order.
+-- Transitions from a step reached before this migration are not timed.
+CREATE OR REPLACE FUNCTION count_onboarding_funnel_updates() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO onboarding_funnel_counters AS c
+        (shard, step_completed, is_completed, applications, transitions, transition_seconds)
+    SELECT shard, step_completed, is_completed, sum(applications), sum(transitions), sum(seconds)
+    FROM (
+        SELECT o.id % 16 AS shard, o.step_completed, o.is_completed,
+               -1 AS applications, 0 AS transitions, 0::float8 AS seconds
+        FROM old_rows o JOIN new_rows n ON n.id = o.id
+        WHERE (o.step_completed, o.is_completed) IS DISTINCT FROM (n.step_completed, n.is_completed)
+        UNION ALL
+        SELECT n.id % 16, n.step_completed, n.is_completed, 1,
+               (n.step_completed > o.step_completed AND o.step_reached_at IS NOT NULL)::int,
+               CASE WHEN n.step_completed > o.step_completed AND o.step_reached_at IS NOT NULL
+                    THEN extract(epoch FROM n.step_reached_at - o.step_reached_at)::float8
+                    ELSE 0 END
+        FROM old_rows o JOIN new_rows n ON n.id = o.id
+        WHERE (o.step_completed, o.is_completed) IS DISTINCT FROM (n.step_completed, n.is_completed)
+    ) AS deltas
+    GROUP BY 1, 2, 3 ORDER BY 1, 2, 3
+    ON CONFLICT (shard, step_completed, is_completed)
+    DO UPDATE SET applications = c.applications + EXCLUDED.applications,
+                  transitions = c.transitions + EXCLUDED.transitions,
+                  transition_seconds = c.transition_seconds + EXCLUDED.transition_seconds;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS onboarding_applications_funnel_inserts ON onboarding_applications;
+
+CREATE TRIGGER onboarding_applications_funnel_inserts
+    AFTER INSERT ON onboarding_applications
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION count_onboarding_funnel_inserts();
+
+DROP TRIGGER IF EXISTS onboarding_applications_funnel_updates ON onboarding_applications;
+
+CREATE TRIGGER onboarding_applications_funnel_updates
+    AFTER UPDATE ON onboarding_applications
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION count_onboarding_funnel_updates();
+
+-- Seed the counts from the live and archived rows (first run only)
+INSERT INTO onboarding_funnel_counters (shard, step_completed, is_completed, applications)
+SELECT id % 16, step_completed, is_completed, count(*)
+FROM (
+    SELECT id, step_completed, is_completed FROM onboarding_applications
+    UNION ALL
+    (SELECT DISTINCT ON (application_id) application_id,
+            (application->>'step_completed')::int, (application->>'is_completed')::boolean
+     FROM onboarding_applications_archive
+     ORDER BY application_id, archived_at DESC)
+) AS applications
+WHERE NOT EXISTS (SELECT 1 FROM onboarding_funnel_counters)
+GROUP BY 1, 2, 3;
+
+COMMIT;
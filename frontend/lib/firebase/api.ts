@@ -133,11 +133,13 @@ class ApiClient {
     endpoint: string, 
     data?: TData
   ): Promise<T> {
+    // Same key for every retry so the backend answers duplicates from its replay cache
+    const idempotencyKey = crypto.randomUUID();
     return this.executeWithRetry(async () => {
       const headers = await this.getAuthHeaders();
       const response = await fetch(`${this.baseURL}${endpoint}`, {
         method: 'POST',
-        headers,
+        headers: { ...headers, 'Idempotency-Key': idempotencyKey },
         body: data ? JSON.stringify(data) : undefined,
       });
 
@@ -162,6 +164,82 @@ class ApiClient {
     });
   }
 
+  // Type-safe PATCH sending only the changed fields
+  async patch<T, TData extends RequestBody = RequestBody>(
+    endpoint: string,
+    data: TData
+  ): Promise<T> {
+    return this.executeWithRetry(async () => {
+      const headers = await this.getAuthHeaders();
+      const response = await fetch(`${this.baseURL}${endpoint}`, {
+        method: 'PATCH',
+        headers,
+        body: JSON.stringify(data),
+      });
+
+      return this.handleResponse<T>(response);
+    });
+  }
+
+  // Server-Sent Events over fetch (EventSource cannot send the Authorization header).
+  // Reconnects with Last-Event-ID until the returned function is called.
+  stream(endpoint: string, onEvent: (event: string, data: unknown) => void): () => void {
+    const controller = new AbortController();
+    let lastEventId = '';
+
+    const connect = async (): Promise<void> => {
+      while (!controller.signal.aborted) {
+        try {
+          const headers = { ...(await this.getAuthHeaders()) } as Record<string, string>;
+          if (lastEventId) {
+            headers['Last-Event-ID'] = lastEventId;
+          }
+          const response = await fetch(`${this.baseURL}${endpoint}`, {
+            method: 'GET',
+            headers,
+            signal: controller.signal,
+          });
+          if (!response.ok || !response.body) {
+            throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+          }
+
+          const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+          let buffer = '';
+          for (;;) {
+            const { value, done } = await reader.read();
+            if (done) break;
+            buffer += value;
+
+            let boundary = buffer.indexOf('\n\n');
+            while (boundary !== -1) {
+              const block = buffer.slice(0, boundary);
+              buffer = buffer.slice(boundary + 2);
+              boundary = buffer.indexOf('\n\n');
+
+              let event = 'message';
+              const data: string[] = [];
+              for (const line of block.split('\n')) {
+                if (line.startsWith('event:')) event = line.slice(6).trim();
+                else if (line.startsWith('id:')) lastEventId = line.slice(3).trim();
+                else if (line.startsWith('data:')) data.push(line.slice(5).trim());
+              }
+              if (data.length) {
+                onEvent(event, JSON.parse(data.join('\n')));
+              }
+            }
+          }
+        } catch (error) {
+          if (controller.signal.aborted) return;
+          console.error(`Stream ${endpoint} failed:`, error);
+        }
+        await new Promise(resolve => setTimeout(resolve, RETRY_DELAY * 3));
+      }
+    };
+
+    connect();
+    return () => controller.abort();
+  }
+
   async delete<T>(endpoint: string): Promise<T> {
     return this.executeWithRetry(async () => {
       const headers = await this.getAuthHeaders();
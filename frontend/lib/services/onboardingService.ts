@@ -25,7 +25,8 @@ import {
   SavedStep3Data,
   SavedStep4Data,
   SavedStep5Data,
-  SavedStep6Data
+  SavedStep6Data,
+  RepaymentQuote
 } from '@/types/onboarding';
 
 
@@ -418,6 +419,20 @@ static async getStep5Data(): Promise<SavedStep5Data | null> {
   }
 }
 
+/**
+ * Get a repayment quote (installments, total cost and schedule) for a loan
+ */
+static async getRepaymentQuote(loanAmount: number, loanTerm?: string, includeSchedule = true): Promise<RepaymentQuote> {
+  const params = new URLSearchParams({ loanAmount: String(loanAmount) });
+  if (loanTerm) {
+    params.set('loanTerm', loanTerm);
+  }
+  if (!includeSchedule) {
+    params.set('schedule', 'false');
+  }
+  return apiClient.get<RepaymentQuote>(`/api/onboarding/quote?${params.toString()}`);
+}
+
 // Step 6 Methods - API Compatible
 private static toStep6ApiFormat(data: Step6Data): Step6ApiData {
   return {
@@ -489,4 +504,15 @@ static async getStep6Data(): Promise<SavedStep6Data | null> {
   }
 }
  
+
+// Pushes application status changes; returns a function that closes the stream
+static subscribeToStatus(
+  onStatus: (status: { stepCompleted: number; isCompleted: boolean; updatedAt: string | null }) => void
+): () => void {
+  return apiClient.stream('/api/onboarding/status/stream', (event, data) => {
+    if (event === 'status') {
+      onStatus(data as { stepCompleted: number; isCompleted: boolean; updatedAt: string | null });
+    }
+  });
+}
 }
\ No newline at end of file
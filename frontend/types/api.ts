@@ -5,9 +5,17 @@ export interface ApiResponse<T = any> {
     timestamp: string;
   }
   
+  export interface ApiFieldError {
+    field: string;
+    message: string;
+    code: string;
+    step?: number; // Set by the batch save endpoint
+  }
+  
   export interface ApiError {
     success: false;
     message: string;
     error_code?: string;
+    errors?: ApiFieldError[];
     timestamp: string;
   }
\ No newline at end of file
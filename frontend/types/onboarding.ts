@@ -246,6 +246,31 @@ export interface SavedStep5Data extends Step5Data {
   isCompleted: boolean;
 }
 
+// Repayment quote for a Step 5 loan amount and term
+export interface RepaymentInstallment {
+  number: number;
+  dueWeek: number;
+  payment: number;
+  principal: number;
+  interest: number;
+  balance: number;
+}
+
+export interface RepaymentQuote {
+  loanAmount: number;
+  loanTerm: string;
+  termWeeks: number;
+  frequency: 'weekly' | 'fortnightly';
+  installments: number;
+  installmentAmount: number;
+  finalInstallmentAmount: number;
+  annualInterestRate: number;
+  establishmentFee: number;
+  totalInterest: number;
+  totalRepayable: number;
+  schedule?: RepaymentInstallment[];
+}
+
 // Step 6 interfaces - API Compatible with flattened structure
 export interface Step6Data {
   identityDocumentName?: string;